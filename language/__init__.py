@@ -1,9 +1,14 @@
+import hashlib
 import importlib
 import os
 import pkgutil
 import sys
+import threading
 
+from collections.abc import Mapping
+from pathlib import Path
 from types import ModuleType
+from typing import Callable, Union
 
 language_pack = None
 supported_languages = None
@@ -15,12 +20,102 @@ def _import_submodules(module):
         yield importlib.import_module(f"{module.__name__}.{module_name}")
 
 
-def load_language_pack(module_name: str = "") -> ModuleType:
+def lazy(namespace: dict, **factories: Union[Callable, str]) -> Callable:
+    """
+    Returns a module __getattr__ that builds each of the named attributes the
+    first time it is accessed, and stores it in the module's namespace so that
+    later accesses are ordinary lookups. Each factory is either a callable
+    returning the attribute, or the name of a module, relative to the module's
+    package, from which the attribute of the same name is imported.
+
+    Attributes are only built once, even when first accessed from several
+    threads at once. Functions in the same module must not refer to a lazy
+    attribute as a bare global name, which bypasses __getattr__.
+
+    Usage (in a module):
+        >>> __getattr__ = lazy(globals(), Name=ElvishNameGenerator, NobleName=lambda: __getattr__("Name"))
+        >>> __getattr__ = lazy(globals(), Name=".names", NobleName=".names")
+    """
+    lock = threading.RLock()
+
+    def __getattr__(name: str):
+        if name not in factories:
+            raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+        with lock:
+            if name not in namespace:
+                factory = factories[name]
+                if isinstance(factory, str):
+                    namespace[name] = getattr(importlib.import_module(factory, namespace["__package__"]), name)
+                else:
+                    namespace[name] = factory()
+        return namespace[name]
+
+    return __getattr__
+
+
+class LazyLanguages(Mapping):
+    """
+    A mapping of language names to language modules, in which each module is
+    imported the first time it is accessed.
+
+    Usage:
+        >>> languages = LazyLanguages("language.languages", ["common", "elvish"])
+        >>> list(languages)
+        ['common', 'elvish']
+        >>> languages["elvish"]    # imports language.languages.elvish
+        <module 'language.languages.elvish' ...>
+    """
+
+    def __init__(self, module_name: str, names: list):
+        self.module_name = module_name
+        self.names = list(names)
+
+    def __getitem__(self, name: str) -> ModuleType:
+        if name not in self.names:
+            raise KeyError(name)
+        return importlib.import_module(f"{self.module_name}.{name}")
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+def load_language_pack(module_name: str = "", lazy: bool = False) -> ModuleType:
+    """
+    Import a language pack and return it, along with a dictionary of its languages.
+
+    If lazy is True, the languages are discovered without being imported, and
+    each one is imported the first time it is accessed.
+    """
     if not module_name:
         module_name = os.getenv("FANLANG_LANGUAGE_PACK", "language.languages")
     language_pack = importlib.import_module(module_name)
+    if lazy:
+        names = [name for (loader, name, is_pkg) in pkgutil.iter_modules(language_pack.__path__)]
+        return language_pack, LazyLanguages(module_name, names)
     _import_submodules(language_pack)
     supported_languages = dict(
         (module.__name__.split(".")[-1], module) for module in list(_import_submodules(sys.modules[module_name]))
     )
     return language_pack, supported_languages
+
+
+def pack_hash(module_name: str = "") -> str:
+    """
+    Returns a hash of the source files of a language pack, which changes
+    whenever any of its languages might generate different words or names.
+    """
+    if not module_name:
+        module_name = os.getenv("FANLANG_LANGUAGE_PACK", "language.languages")
+    digest = hashlib.blake2b(digest_size=16)
+    for path in importlib.import_module(module_name).__path__:
+        root = Path(path)
+        # Include every file, not just the source: trained languages load their models from data files.
+        for source in sorted(root.rglob("*")):
+            if not source.is_file() or "__pycache__" in source.parts:
+                continue
+            digest.update(str(source.relative_to(root)).encode("utf-8") + b"\0")
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
@@ -0,0 +1,178 @@
+"""
+asyncio support for generating words and names without blocking the event loop.
+
+Generation is CPU-bound, so it runs in a thread pool shared by every language
+and name generator. Work is submitted in chunks whose size adapts so that
+each chunk takes about `target` seconds, which keeps the event loop
+responsive no matter how many words are requested. Requests made
+concurrently against the same generator are coalesced: while one batch is
+being generated, new requests queue up and are served together by the next
+batch. Batches are generated under a budget (see types.budget()), so that a
+word that runs out of attempts fails none of the requests it would serve.
+
+Callers normally use the async methods on Language and NameGenerator:
+
+    >>> names = await Name.aname(1000)
+    >>> async for word in Language.aiter_words(100):
+    ...     print(word)
+"""
+import asyncio
+import contextvars
+import functools
+import os
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Union
+
+_executor = None
+_coalescers = weakref.WeakKeyDictionary()
+
+# The number of seconds each chunk of generation should take.
+TARGET_LATENCY = float(os.environ.get("FANLANG_ASYNC_TARGET_LATENCY", 0.005))
+
+
+def executor() -> ThreadPoolExecutor:
+    """
+    Returns the executor shared by all asynchronous generation.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix="fanlang")
+    return _executor
+
+
+class Chunker:
+    """
+    Chooses chunk sizes so that generating one chunk takes about `target` seconds.
+
+    Usage:
+        >>> chunker = Chunker(target=0.005)
+        >>> chunker.size
+        1
+        >>> chunker.record(count=1, elapsed=0.0001)
+        >>> chunker.size
+        25
+    """
+
+    def __init__(self, target: float = TARGET_LATENCY, minimum: int = 1, maximum: int = 10000):
+        self.target = target
+        self.minimum = minimum
+        self.maximum = maximum
+        self.size = minimum
+
+    def record(self, count: int, elapsed: float):
+        """
+        Adjust the chunk size after generating `count` items in `elapsed` seconds.
+        """
+        if elapsed <= 0:
+            ideal = self.maximum
+        else:
+            ideal = self.target * count / elapsed
+        # Average with the current size so one slow chunk doesn't swing the size too far.
+        self.size = max(self.minimum, min(self.maximum, int((self.size + ideal) / 2) or 1))
+
+
+class Coalescer:
+    """
+    Serves concurrent requests against one generator method in shared batches.
+    """
+
+    def __init__(self, generate: Callable[[int], list]):
+        self.generate = generate
+        self.chunker = Chunker()
+        self.pending = []
+        self.running = False
+
+    def _generate(self, count: int) -> list:
+        from language import types
+
+        with types.budget():
+            return self.generate(count)
+
+    async def request(self, count: int) -> list:
+        """
+        Returns `count` results from the generator, generated alongside any concurrent requests.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((count, future))
+        if not self.running:
+            self.running = True
+            loop.create_task(self.drain())
+        return await future
+
+    async def drain(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while self.pending:
+                # Yield once, so that requests made in the same iteration of the loop join this batch.
+                await asyncio.sleep(0)
+                batch, self.pending = self.pending, []
+                total = sum(count for (count, future) in batch)
+                results = []
+                try:
+                    while len(results) < total:
+                        count = min(self.chunker.size, total - len(results))
+                        start = time.perf_counter()
+                        results.extend(await loop.run_in_executor(executor(), self._generate, count))
+                        self.chunker.record(count, time.perf_counter() - start)
+                except Exception as e:
+                    for count, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                offset = 0
+                for count, future in batch:
+                    if not future.done():
+                        future.set_result(results[offset : offset + count])
+                    offset += count
+        finally:
+            self.running = False
+
+
+def coalescer(generate: Callable[[int], list]) -> Coalescer:
+    """
+    Returns the Coalescer for a generator method in the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    coalescers = _coalescers.setdefault(loop, {})
+    if generate not in coalescers:
+        coalescers[generate] = Coalescer(generate)
+    return coalescers[generate]
+
+
+async def generate(
+    method: Callable[[int], list], count: int, deadline_ms: Union[float, None] = None, **options
+) -> list:
+    """
+    Returns `count` results from a generator method such as Language.word or
+    NameGenerator.name, without blocking the event loop.
+
+    If deadline_ms is given, the results are generated within a budget that
+    starts now, rather than when a worker thread picks up the request; such
+    requests are not coalesced with others. Any other options are passed to
+    the method.
+    """
+    if deadline_ms is None and not options:
+        return await coalescer(method).request(count)
+    from language import types
+
+    with types.budget(deadline_ms):
+        context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor(), functools.partial(context.run, method, count, **options))
+
+
+async def stream(method: Callable[[int], list], count: Union[int, None] = None) -> AsyncIterator:
+    """
+    Yields `count` results from a generator method, or an unbounded stream if count is None.
+    """
+    batcher = coalescer(method)
+    remaining = count
+    while remaining is None or remaining > 0:
+        size = batcher.chunker.size if remaining is None else min(batcher.chunker.size, remaining)
+        for result in await batcher.request(size):
+            yield result
+        if remaining is not None:
+            remaining -= size
@@ -0,0 +1,337 @@
+"""
+How many distinct names can a NameGenerator produce?
+
+Before giving every NPC in a city of 200,000 a generated name, it helps to
+know how soon names start repeating. That depends on the whole distribution of
+names, not just on how many are possible: a generator that picks one of a
+million names but favours a few hundred of them will repeat itself quickly.
+
+The Estimate of a generator reports:
+
+    entropy    - the Shannon entropy of its names, in bits
+    collision  - the probability that two independently generated names are
+                 the same, sum(p ** 2) over every name
+    effective  - 1 / collision, the number of equally likely names that would
+                 repeat as often as this generator does
+
+and the birthday curve: the chance that a population of N names contains at
+least one duplicate, and the expected number of duplicated pairs.
+
+Each part of a name template is independent of the others, so the entropy of
+a name is the entropy of its template plus the entropies of its parts, and its
+collision probability is the product of theirs. Each part is measured the best
+way available:
+
+    - Parts drawn from WeightedSets (titles, adjectives, counts and so on) are
+      computed exactly.
+    - Words are drawn from the language and scored with the exact word model
+      of language.identify, so entropy and collision probability are averages
+      of exact per-word probabilities over a sample of words.
+    - Parts with custom handlers are sampled, and the estimate is corrected
+      for the names the sample did not see (Good-Turing coverage and the
+      Chao-Shen entropy estimator).
+
+Usage:
+    >>> estimate = Estimator(dwarvish.Name).estimate()
+    >>> estimate.effective
+    1496420.6
+    >>> estimate.duplicate_pairs(200000)
+    13365.2
+"""
+import math
+from collections import Counter, defaultdict
+from itertools import product
+
+from language import types
+from language.identify import word_model
+
+# The population sizes reported in the birthday curve.
+POPULATIONS = (1000, 10000, 50000, 100000, 200000, 500000, 1000000)
+
+
+class Part:
+    """
+    The entropy (in nats) and collision probability of one part of a name.
+
+    Attributes:
+        entropy   - the Shannon entropy of the part
+        collision - the probability that two independent draws of the part are equal
+        empty     - the probability that the part is blank, and so left out of the name
+        method    - how the part was measured: "exact", "scored" or "sampled"
+        error     - the standard error of the collision probability, if it was estimated
+    """
+
+    def __init__(self, entropy: float, collision: float, empty: float = 0.0, method: str = "exact", error: float = 0.0):
+        self.entropy = entropy
+        self.collision = collision
+        self.empty = empty
+        self.method = method
+        self.error = error
+
+    @property
+    def filled_entropy(self) -> float:
+        """
+        The entropy of the part, given that it is not blank.
+        """
+        q = self.empty
+        blank = -(q * math.log(q) + (1 - q) * math.log(1 - q)) if 0 < q < 1 else 0.0
+        return (self.entropy - blank) / (1 - q)
+
+    @property
+    def filled_collision(self) -> float:
+        """
+        The collision probability of the part, given that it is not blank.
+        """
+        return (self.collision - self.empty**2) / (1 - self.empty) ** 2
+
+    @classmethod
+    def from_distribution(cls, distribution: dict) -> "Part":
+        total = sum(distribution.values())
+        p = [weight / total for weight in distribution.values() if weight]
+        empty = sum(weight for (value, weight) in distribution.items() if not value.strip()) / total
+        return cls(-sum(x * math.log(x) for x in p), sum(x * x for x in p), empty)
+
+    @classmethod
+    def from_sample(cls, values: list) -> "Part":
+        """
+        Estimate a part from a sample of its values. If every value was seen
+        at least twice, the sample is assumed to have covered the whole
+        distribution.
+        """
+        values = [value.strip() for value in values]
+        counts = Counter(values)
+        n = len(values)
+        singletons = sum(1 for count in counts.values() if count == 1)
+        if not singletons:
+            part = cls.from_distribution(counts)
+            part.method = "sampled"
+            return part
+
+        # Chao-Shen: shrink the observed frequencies by the sample coverage,
+        # and weight each term by the chance its value was seen at all.
+        coverage = 1 - min(singletons, n - 1) / n
+        entropy = 0.0
+        for count in counts.values():
+            p = coverage * count / n
+            entropy -= p * math.log(p) / (1 - (1 - p) ** n)
+
+        # The fraction of pairs of samples that are equal is an unbiased
+        # estimate of the collision probability.
+        pairs = n * (n - 1) / 2
+        equal = sum(count * (count - 1) / 2 for count in counts.values())
+        error = math.sqrt(max(equal, 1)) / pairs
+        return cls(entropy, max(equal / pairs, error), counts[""] / n, "sampled", error)
+
+    @classmethod
+    def join(cls, *parts: "Part") -> "Part":
+        """
+        Returns the Part formed by concatenating independent parts.
+        """
+        collision = math.prod(part.collision for part in parts)
+        method = "exact" if all(part.method == "exact" for part in parts) else "scored"
+        if any(part.method == "sampled" for part in parts):
+            method = "sampled"
+        error = collision * math.sqrt(sum((part.error / part.collision) ** 2 for part in parts if part.collision))
+        empty = math.prod(part.empty for part in parts)
+        return cls(sum(part.entropy for part in parts), collision, empty, method, error)
+
+
+class Estimate:
+    """
+    The capacity of a NameGenerator.
+
+    Attributes:
+        entropy   - the entropy of a name, in bits
+        collision - the probability that two independent names are the same
+        effective - the effective number of distinct names, 1 / collision
+        templates - (template, probability, Part) for each name template
+    """
+
+    def __init__(self, entropy: float, collision: float, templates: list, error: float = 0.0):
+        self.entropy = entropy / math.log(2)
+        self.collision = collision
+        self.error = error
+        self.effective = 1 / collision if collision else float("inf")
+        self.templates = templates
+
+    def duplicate_pairs(self, population: int) -> float:
+        """
+        Returns the expected number of pairs of identical names in a population.
+        """
+        return population * (population - 1) / 2 * self.collision
+
+    def any_duplicate(self, population: int) -> float:
+        """
+        Returns the probability that a population contains at least one duplicated name.
+        """
+        return 1 - math.exp(-self.duplicate_pairs(population))
+
+    def population_at(self, probability: float) -> int:
+        """
+        Returns the population at which the chance of a duplicated name reaches `probability`.
+        """
+        return math.ceil(math.sqrt(2 * -math.log(1 - probability) / self.collision) + 0.5)
+
+
+class Estimator:
+    """
+    Estimates the capacity of a NameGenerator.
+    """
+
+    def __init__(self, generator: types.NameGenerator, samples: int = 5000):
+        """
+        Args:
+            generator - the NameGenerator to measure
+            samples   - the number of values to draw for each part that cannot be computed exactly
+        """
+        self.generator = generator
+        self.samples = samples
+        self._word = None
+
+    def word(self) -> Part:
+        """
+        Measure the words of the generator's language by scoring a sample of
+        them with the exact word model.
+        """
+        if self._word is None:
+            model = word_model(self.generator.language)
+            logs = []
+            for word in self._words(self.samples):
+                p = model.probability(word)
+                if p > 0:
+                    logs.append(math.log(p))
+            n = len(logs)
+            probabilities = [math.exp(log) for log in logs]
+            collision = sum(probabilities) / n
+            variance = sum((p - collision) ** 2 for p in probabilities) / max(n - 1, 1)
+            self._word = Part(-sum(logs) / n, collision, 0.0, "scored", math.sqrt(variance / n))
+        return self._word
+
+    def _words(self, count: int, batch_size: int = 256) -> list:
+        """
+        Returns `count` words from the generator's language. Languages with
+        strict rules occasionally exhaust their attempts at a word, which would
+        abandon a whole batch; those batches are simply drawn again.
+        """
+        words = []
+        while len(words) < count:
+            try:
+                words += self.generator.language.word(min(batch_size, count - len(words)))
+            except types.ImprobableTemplateError:
+                continue
+        return words
+
+    def _sample(self, handler) -> Part:
+        values = []
+        while len(values) < self.samples:
+            try:
+                values.append(handler())
+            except types.ImprobableTemplateError:
+                continue
+        return Part.from_sample(values)
+
+    def _set(self, weighted_set: types.WeightedSet, transform=lambda member: member) -> Part:
+        distribution = defaultdict(float)
+        for member, weight in zip(weighted_set.members, weighted_set.weights):
+            distribution[transform(member)] += weight
+        return Part.from_distribution(distribution)
+
+    def part(self, template: str) -> Part:
+        """
+        Measure one part of a name template.
+        """
+        generator = self.generator
+        handler = f"get_{template}"
+        if types._defined_by(generator.__class__, handler) is not types.NameGenerator:
+            return self._sample(generator.handlers[handler])
+
+        if template in ("name", "surname"):
+            names = generator._names if template == "name" else generator._surnames
+            # The handlers use the first element of whatever the set returns, as name() does.
+            part = self._set(names, lambda member: member[0].title()) if names else self.word()
+            if template == "surname" and generator._suffixes:
+                part = Part.join(part, self._set(generator._suffixes))
+            return part
+
+        sets = {
+            "adjective": generator._adjectives,
+            "affix": generator._affixes,
+            "title": generator._titles,
+            "count": generator._counts,
+            "nickname": generator._nicknames,
+        }
+        if template in sets:
+            return self._set(sets[template]) if sets[template] else Part(0.0, 1.0, empty=1.0)
+        if template == "the":
+            return Part(0.0, 1.0)
+        return self._sample(generator.handlers[handler])
+
+    def estimate(self) -> Estimate:
+        """
+        Combine the parts of every template into an Estimate for the generator.
+
+        Blank parts are left out of names, so different templates can produce
+        the same name: "adjective,name" with a blank adjective is the same as
+        "name". Names are therefore grouped by which of their parts are filled
+        in. Names with different filled parts are assumed to be distinct.
+        """
+        templates = self.generator.templates
+        total = sum(templates.weights)
+        parts = {}
+        measured = []
+        # The probability of each sequence of filled parts, across every template.
+        shapes = defaultdict(float)
+        for template, weight in zip(templates.members, templates.weights):
+            p = weight / total
+            names = [name.lower() for name in template.template.split(",")]
+            for name in names:
+                if name not in parts:
+                    parts[name] = self.part(name)
+            # The same part twice in one template, such as two surnames, is two independent draws.
+            measured.append((template.template, p, Part.join(*(parts[name] for name in names))))
+            for filled in product(*((False, True) for _ in names)):
+                p_shape = p
+                for name, is_filled in zip(names, filled):
+                    p_shape *= (1 - parts[name].empty) if is_filled else parts[name].empty
+                if p_shape:
+                    shapes[tuple(name for (name, is_filled) in zip(names, filled) if is_filled)] += p_shape
+
+        entropy = 0.0
+        collision = 0.0
+        variance = 0.0
+        for shape, p in shapes.items():
+            filled = [parts[name] for name in shape]
+            entropy += p * (-math.log(p) + sum(part.filled_entropy for part in filled))
+            shape_collision = math.prod(part.filled_collision for part in filled)
+            collision += p * p * shape_collision
+            variance += sum(
+                (p * p * shape_collision * part.error / part.collision) ** 2 for part in filled if part.collision
+            )
+        return Estimate(entropy, collision, measured, math.sqrt(variance))
+
+
+def report(estimate: Estimate, populations: tuple = POPULATIONS) -> str:
+    """
+    Returns a plain text report of an Estimate.
+    """
+    lines = [
+        f"Entropy:         {estimate.entropy:.2f} bits",
+        f"Collision:       {estimate.collision:.3g} (+/- {estimate.error:.2g})",
+        f"Effective names: {estimate.effective:,.0f}",
+        f"50% duplicate:   {estimate.population_at(0.5):,} names",
+        f"1% duplicate:    {estimate.population_at(0.01):,} names",
+        "",
+        "Templates:",
+    ]
+    for template, p, part in estimate.templates:
+        lines.append(
+            f"  {p:6.1%}  {part.entropy / math.log(2):6.2f} bits  {1 / part.collision:>16,.0f} effective"
+            f"  ({part.method})  {template}"
+        )
+    lines += ["", "Population  P(duplicate)  Expected duplicate pairs"]
+    for population in populations:
+        lines.append(
+            f"{population:>10,}  {estimate.any_duplicate(population):12.2%}"
+            f"  {estimate.duplicate_pairs(population):,.1f}"
+        )
+    return "\n".join(lines)
@@ -1,21 +1,26 @@
 import logging
 import os
+import sys
 import textwrap
+import time
 from enum import Enum
+from pathlib import Path
 from types import ModuleType
 
-import language
-
 import typer
-from rich.logging import RichHandler
-from rich.console import Console
+
+import language
 
 app = typer.Typer()
 
 app_state = {}
 
 default_language = os.environ.get("FANLANG_DEFAULT_LANGUAGE", "common")
-language_pack, supported_languages = language.load_language_pack()
+
+# Languages are discovered without being imported; each language module is
+# only imported when it is used, so that a single command doesn't pay for the
+# whole language pack.
+language_pack, supported_languages = language.load_language_pack(lazy=True)
 
 Supported = Enum("Supported", ((k, k) for k in supported_languages.keys()))
 
@@ -40,47 +45,478 @@ def main(
         default=default_language,
         help="The language to use."
     ),
+    metrics_port: int = typer.Option(
+        int(os.environ.get("FANLANG_METRICS_PORT", 0)),
+        help="Serve generation metrics in the Prometheus format on this local port.",
+    ),
+    metrics_file: Path = typer.Option(
+        None, help="Dump a JSON summary of the generation metrics to this file periodically, or to stderr if -."
+    ),
+    metrics_interval: float = typer.Option(10.0, help="The number of seconds between dumps of the metrics."),
 ):
-    app_state["language"] = supported_languages[language.name]
+    app_state["language"] = language.name
 
     debug = os.getenv("FANLANG_DEBUG", None)
+    if debug or sys.stderr.isatty():
+        from rich.logging import RichHandler
+
+        handlers = [RichHandler(rich_tracebacks=True, tracebacks_suppress=[typer])]
+    else:
+        handlers = [logging.StreamHandler()]
     logging.basicConfig(
         format="%(name)s %(message)s",
         level=logging.DEBUG if debug else logging.INFO,
-        handlers=[RichHandler(rich_tracebacks=True, tracebacks_suppress=[typer])],
+        handlers=handlers,
     )
     logging.getLogger('markdown_it').setLevel(logging.ERROR)
     logging.debug(f"Loaded language pack {language_pack}.")
     logging.debug(f"Default language: {default_language}.")
 
+    if metrics_port or metrics_file:
+        import atexit
+
+        from language import metrics
+
+        if metrics_port:
+            metrics.serve(supported_languages, port=metrics_port)
+        if metrics_file:
+            atexit.register(metrics.Reporter(supported_languages, metrics_file, metrics_interval).start().stop)
+
+
+def selected_language() -> ModuleType:
+    return supported_languages[app_state["language"]]
+
 
 @app.command()
-def text(count: int = typer.Option(50, help="The number of words to generate.")):
+def text(
+    count: int = typer.Option(50, help="The number of words to generate."),
+    seed: str = typer.Option(None, help="Generate the text from a seed, in parallel chunks, so it can be reproduced."),
+    processes: int = typer.Option(0, help="With --seed, the number of worker processes. Defaults to one per CPU."),
+):
+
+    if seed is not None:
+        from language.parallel import text as parallel_text
 
-    paragraph = app_state["language"].Language.text(count)
+        paragraph = "".join(
+            parallel_text(app_state["language"], count, seed, pack=language_pack.__name__, processes=processes or None)
+        )
+    else:
+        paragraph = selected_language().Language.text(count)
+
+    if not sys.stdout.isatty():
+        print(textwrap.fill(paragraph, width=80))
+        return
+
+    from rich.console import Console
 
     console = Console(width=80)
     console.print(paragraph)
 
 
+def parse_ids(ids: str):
+    """
+    Yields the IDs in a comma-separated list of IDs and inclusive ranges, such
+    as "1,5,1000-2000", or read one per line from stdin if ids is "-".
+    """
+    if ids == "-":
+        for line in sys.stdin:
+            if line.strip():
+                yield int(line)
+        return
+    for part in ids.split(","):
+        start, _, end = part.partition("-")
+        yield from range(int(start), int(end or start) + 1)
+
+
 @app.command()
 def names(
     count: int = typer.Option(50, help="The number of names to generate."),
     noble: bool = typer.Option(False, help="Generate noble names."),
+    seed: str = typer.Option(None, help="Generate the names of a seeded stream; the same seed gives the same names."),
+    ids: str = typer.Option(
+        None, help="With --seed, the indexes of the names to generate, such as 1000-2000, or - to read them from stdin."
+    ),
+    permute: bool = typer.Option(
+        False, help="Generate every possible name exactly once, in an order shuffled by --seed, until none are left."
+    ),
+    output_dir: Path = typer.Option(
+        None, help="Write the names to shards in this directory, with a manifest; see language.shards."
+    ),
+    compression: str = typer.Option("none", help="With --output-dir, compress each shard: none, gzip or xz."),
+    shard_size: float = typer.Option(
+        64, help="With --output-dir, the largest size of each shard, in MiB uncompressed."
+    ),
+):
+    module = selected_language()
+    generator = module.Name if not noble else module.NobleName
+    if output_dir:
+        from language import shards
+
+        if ids is not None or permute:
+            raise typer.BadParameter("Cannot be combined with --ids or --permute.", param_hint="--output-dir")
+        if compression not in shards.COMPRESSION:
+            raise typer.BadParameter("Use none, gzip or xz.", param_hint="--compression")
+        name = app_state["language"]
+        manifest = shards.write(
+            generator,
+            output_dir,
+            count=count,
+            seed=seed,
+            prefix=f"{name}-noble" if noble else name,
+            compression=compression,
+            shard_bytes=int(shard_size * 2**20),
+            metadata=dict(language=name, noble=noble, pack=language_pack.__name__, pack_hash=language.pack_hash()),
+        )
+        shard_count = len(manifest["shards"])
+        print(f"Wrote {count} {name} names to {output_dir} in {shard_count} shards (seed {manifest['seed']}).")
+        return
+    if permute:
+        from language.types import LanguageError
+
+        try:
+            space = generator.space()
+        except LanguageError as e:
+            raise typer.BadParameter(str(e), param_hint="--permute")
+        for name in space.permute(seed):
+            print(name["fullname"])
+        return
+    if seed is None:
+        for name in generator.name(count):
+            print(name["fullname"])
+        return
+    if ids is None:
+        for index in range(count):
+            print(generator.name_at(seed, index)["fullname"])
+        return
+    for index in parse_ids(ids):
+        print(f"{index}\t{generator.name_at(seed, index)['fullname']}")
+
+
+@app.command()
+def list(
+    names: bool = typer.Option(False, help="Display sample names."),
+    processes: int = typer.Option(0, help="The number of worker processes. Defaults to one per CPU."),
+):
+    from language.parallel import sample_all
+
+    for sample in sample_all(
+        [*supported_languages],
+        kind="names" if names else "text",
+        count=1,
+        pack=language_pack.__name__,
+        processes=processes or None,
+        ordered=True,
+    ):
+        text = sample.error or sample.values[0]
+        if not names:
+            text = textwrap.shorten(text, width=70, placeholder='')
+        print(f"{sample.language.title():15s}: {text}")
+
+
+@app.command()
+def sample(
+    all: bool = typer.Option(False, "--all", help="Sample every language, not just the selected one."),
+    count: int = typer.Option(3, help="The number of names or paragraphs to generate for each language."),
+    text: bool = typer.Option(False, help="Generate text instead of names."),
+    noble: bool = typer.Option(False, help="Generate noble names."),
+    words: int = typer.Option(20, help="The number of words in each paragraph of text."),
+    processes: int = typer.Option(0, help="The number of worker processes. Defaults to one per CPU."),
 ):
-    generator = app_state["language"].Name if not noble else app_state["language"].NobleName
-    for name in generator.name(count):
-        print(name["fullname"])
+    """
+    Generate samples of one or every language, and report how long each took.
+    Languages are generated in parallel, and shown as soon as they finish.
+    """
+    from language.parallel import sample_all
+
+    start = time.perf_counter()
+    for result in sample_all(
+        [*supported_languages] if all else [app_state["language"]],
+        kind="text" if text else "noble" if noble else "names",
+        count=count,
+        words=words,
+        pack=language_pack.__name__,
+        processes=processes or None,
+    ):
+        print(f"{result.language.title()} ({result.elapsed:.3f}s)")
+        for value in result.values:
+            print(f"  {value}")
+        if result.error:
+            print(f"  {result.error}")
+        sys.stdout.flush()
+    if all:
+        print(f"Total: {time.perf_counter() - start:.3f}s")
+
+
+@app.command()
+def capacity(
+    target: Supported = typer.Option(None, "--language", help="The language whose names to measure."),
+    noble: bool = typer.Option(False, help="Measure the noble name generator."),
+    samples: int = typer.Option(5000, help="The number of values to sample for parts that can't be computed exactly."),
+):
+    """
+    Estimate how many distinct names the language's name generator can produce,
+    and how soon names start repeating.
+    """
+    from language.capacity import Estimator, report
+
+    module = supported_languages[target.name] if target else selected_language()
+    generator = module.Name if not noble else module.NobleName
+    print(report(Estimator(generator, samples=samples).estimate()))
 
 
 @app.command()
-def list(names: bool = typer.Option(False, help="Display sample names.")):
-    for lang, module in supported_languages.items():
-        if names:
-            text = str(module.Name)
-        else:
-            text = textwrap.shorten(module.Language.text(count=20), width=70, placeholder='')
-        print(f"{lang.title():15s}: {text}")
+def pregen(
+    output: Path = typer.Argument(..., help="The corpus file to write."),
+    target: Supported = typer.Option(None, "--language", help="The language of the names."),
+    count: int = typer.Option(100000, help="The number of names to generate."),
+    noble: bool = typer.Option(False, help="Generate noble names."),
+    seed: str = typer.Option(None, help="The seed to generate the names from. Defaults to a random seed."),
+):
+    """
+    Generate a corpus of names to serve from disk.
+    """
+    from language import corpus
+
+    name = target.name if target else app_state["language"]
+    module = supported_languages[name]
+    generator = module.Name if not noble else module.NobleName
+    header = corpus.write(
+        generator,
+        output,
+        count=count,
+        seed=seed,
+        metadata={"language": name, "noble": noble, "pack": language_pack.__name__, "pack_hash": language.pack_hash()},
+    )
+    print(f"Wrote {count} {name} names to {output} (seed {header['seed']}).")
+
+
+@app.command()
+def population(
+    size: int = typer.Option(10000, help="The number of people to generate."),
+    mix: str = typer.Option(
+        None, help="The languages of the people, as comma-separated language:weight. Defaults to the selected language."
+    ),
+    noble: float = typer.Option(0.02, help="The fraction of families that are noble."),
+    output: Path = typer.Option(None, help="The file to write the people to, as tab-separated values."),
+    seed: str = typer.Option(None, help="The seed to generate the people from. Defaults to a random seed."),
+    processes: int = typer.Option(0, help="The number of worker processes. Defaults to one per CPU."),
+):
+    """
+    Generate the people of a settlement, in households and families sharing
+    surnames, as tab-separated values; see language.population.
+    """
+    from language import population as pop
+
+    try:
+        languages = pop.parse_mix(mix or app_state["language"])
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--mix")
+    for name, weight in languages:
+        if name not in supported_languages:
+            raise typer.BadParameter(f"Unsupported language {name}.", param_hint="--mix")
+    seed = seed or os.urandom(8).hex()
+
+    start = time.perf_counter()
+    rows = pop.generate(size, languages, seed, pack=language_pack.__name__, processes=processes or None, noble=noble)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            count = pop.write(rows, f)
+        logging.info(f"Wrote {count} people to {output} in {time.perf_counter() - start:.2f}s (seed {seed}).")
+    else:
+        pop.write(rows, sys.stdout)
+
+
+@app.command()
+def ring(
+    all: bool = typer.Option(False, "--all", help="Produce names in every language, not just the selected one."),
+    noble: bool = typer.Option(False, help="Produce noble names."),
+    lanes: int = typer.Option(16, help="The number of consumer processes each ring can serve."),
+    capacity: int = typer.Option(1024, help="The number of names in each lane."),
+    report: float = typer.Option(10.0, help="Log the ring counters every this many seconds."),
+):
+    """
+    Generate names into shared memory ring buffers until interrupted, for
+    worker processes to pop with language.ring.Consumer. Each ring is named
+    after its language, with "-noble" appended for noble names.
+    """
+    from language.ring import Producer
+
+    generators = {}
+    for name in [*supported_languages] if all else [app_state["language"]]:
+        module = supported_languages[name]
+        generators[f"{name}-noble" if noble else name] = module.NobleName if noble else module.Name
+    with Producer(generators, lanes=lanes, capacity=capacity) as producer:
+        logging.info(f"Producing names for {', '.join(producer.rings)}.")
+        last = time.monotonic()
+
+        def stop():
+            nonlocal last
+            if time.monotonic() - last >= report:
+                last = time.monotonic()
+                for key, stats in producer.stats().items():
+                    logging.info(
+                        f"{key}: {sum(stats['occupancy'])}/{stats['lanes'] * stats['capacity']} names, "
+                        f"{stats['consumers']} consumers, {stats['produced']} produced, "
+                        f"{stats['consumed']} consumed, {stats['refill_rate']:.0f} names/s"
+                    )
+            return False
+
+        try:
+            producer.run(stop=stop)
+        except KeyboardInterrupt:
+            pass
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", help="The address to listen on."),
+    port: int = typer.Option(8089, help="The port to listen on."),
+    socket: Path = typer.Option(None, help="Listen on this Unix socket instead of a port."),
+):
+    """
+    Serve names and text over HTTP until interrupted; see language.service.
+    """
+    import asyncio
+
+    from language.service import serve
+
+    try:
+        asyncio.run(serve(supported_languages, host=host, port=port, path=str(socket) if socket else ""))
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def loadtest(
+    mix: str = typer.Option(
+        "common:names:0.7,elvish:noble:0.2,celestial:text:0.1",
+        help="The requests to send, as comma-separated language:kind:weight, where kind is names, noble or text.",
+    ),
+    mode: str = typer.Option("closed", help="closed: send each request when the last is answered; open: at --rate."),
+    concurrency: int = typer.Option(16, help="The number of connections, and of clients in closed-loop mode."),
+    rate: float = typer.Option(0.0, help="The total requests per second. Required in open-loop mode."),
+    duration: float = typer.Option(10.0, help="The number of seconds to measure."),
+    warmup: float = typer.Option(1.0, help="The number of seconds to send requests before measuring."),
+    count: int = typer.Option(1, help="The number of names in each names request."),
+    words: int = typer.Option(25, help="The number of words in each text request."),
+    host: str = typer.Option("127.0.0.1", help="The address of the service."),
+    port: int = typer.Option(8089, help="The port of the service."),
+    socket: Path = typer.Option(None, help="The Unix socket of the service, instead of a port."),
+    seed: str = typer.Option(None, help="Seed the request mix and arrival times."),
+    label: str = typer.Option("", help="A name for this run, such as the version under test."),
+    output: Path = typer.Option(None, help="Save the report as JSON."),
+    baseline: Path = typer.Option(None, help="Compare with a report saved earlier with --output."),
+):
+    """
+    Measure the throughput, latency and error rate of a running `fanlang serve`.
+    """
+    import asyncio
+
+    from language import loadtest as lt
+
+    if mode not in ("closed", "open"):
+        raise typer.BadParameter("Use closed or open.", param_hint="--mode")
+    if mode == "open" and rate <= 0:
+        raise typer.BadParameter("An open-loop test needs a rate.", param_hint="--rate")
+    try:
+        requests = lt.parse_mix(mix, count=count, words=words)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--mix")
+
+    async def main():
+        client = lt.Client(host=host, port=port, path=str(socket) if socket else "", size=concurrency)
+        return await lt.run(
+            client, requests, duration, concurrency, rate, mode=mode, warmup=warmup, seed=seed, label=label
+        )
+
+    report = asyncio.run(main())
+    print(lt.format_report(report))
+    if baseline:
+        print(lt.compare(report, lt.load(baseline)))
+    if output:
+        lt.save(report, output)
+
+
+@app.command()
+def identify(
+    source: str = typer.Argument(..., help="A file of strings, one per line, or - to read from stdin."),
+    scores: bool = typer.Option(False, help="Include the score for every language."),
+    processes: int = typer.Option(0, help="The number of worker processes. Defaults to one per CPU."),
+):
+    """
+    Report the most likely language of each string, as tab-separated values:
+    the string, the language, its log-likelihood per character, and the
+    fraction of words in the string the language could have generated.
+    """
+    from language.identify import identify_stream
+
+    languages = dict((name, supported_languages[name]) for name in supported_languages)
+    if scores:
+        print("\t".join(["text", "language", "score", "plausible", *languages]))
+
+    f = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for result in identify_stream(f, languages=languages, processes=processes or None):
+            if not result.language:
+                continue
+            if scores:
+                print("\t".join([str(result), *(f"{result.scores[name]:.3f}" for name in languages)]))
+            else:
+                print(result)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+@app.command()
+def translate(
+    target: Supported = typer.Option(None, "--language", help="The language to translate into."),
+    lexicon: Path = typer.Option(None, help="The lexicon of earlier translations. Defaults to $FANLANG_LEXICON."),
+    cache: bool = typer.Option(True, help="Reuse and save translations in the lexicon."),
+):
+    """
+    Translate standard input into a language, word by word. The same word is
+    always translated the same way.
+    """
+    from language.translate import DEFAULT_LEXICON, Lexicon, Translator
+
+    module = supported_languages[target.name] if target else selected_language()
+    store = Lexicon(lexicon or DEFAULT_LEXICON) if cache else None
+    translator = Translator(module.Language, lexicon=store)
+    try:
+        for line in translator.stream(sys.stdin):
+            sys.stdout.write(line)
+    finally:
+        if store:
+            store.close()
+
+
+@app.command()
+def train(
+    corpus: str = typer.Argument(..., help="A file of names, one per line, or - to read from stdin."),
+    order: int = typer.Option(3, help="The number of characters in each n-gram."),
+    name: str = typer.Option("", help="The name of the new language. Defaults to the name of the corpus file."),
+    output: Path = typer.Option(Path("."), help="The directory in which to write the new language."),
+    snapshot: bool = typer.Option(False, help="Only write the model snapshot, not a language module."),
+):
+    from language import ngram
+
+    name = name or Path(corpus).stem
+    trainer = ngram.NgramTrainer(order=order)
+    if corpus == "-":
+        trainer.update(sys.stdin)
+    else:
+        with open(corpus, encoding="utf-8") as f:
+            trainer.update(f)
+    model = trainer.model()
+
+    if snapshot:
+        path = output / f"{name}.ngram"
+        output.mkdir(parents=True, exist_ok=True)
+        model.save(path)
+    else:
+        path = ngram.write_module(model, name, output)
+    print(f"Trained {name} on {trainer.names} names ({len(model.contexts)} contexts): {path}")
 
 
 if __name__ == "__main__":
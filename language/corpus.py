@@ -0,0 +1,231 @@
+"""
+Pre-generated name corpora, served from disk.
+
+Generating a name takes tens or hundreds of microseconds; looking one up in a
+pre-generated corpus takes a few. A corpus file (.fnc) holds any number of
+names generated offline, and a Corpus reads them straight from a memory map,
+so opening even a very large corpus costs nothing and any name -- the k-th or
+a random one -- is found in constant time. Every process that opens the same
+corpus shares the same pages of the operating system's page cache.
+
+The file is laid out as:
+
+    preamble   MAGIC, the format version and the position of the header
+    blobs      for each column, the UTF-8 text of every entry, concatenated
+    offsets    for each column, count + 1 little-endian uint64 offsets into its blob
+    header     JSON: language, pack hash, seed, count and the position of each column
+
+The first column, "fullname", holds each whole name; the others hold the
+values of each part of the name ("name", "surname", "title", ...), with
+multiple values of the same part separated by UNIT_SEPARATOR.
+
+Usage:
+    >>> write(elvish.Name, "elvish.fnc", count=1000, seed=1234)
+    >>> with Corpus("elvish.fnc") as corpus:
+    ...     corpus.fullname(17)
+    'Nyeyias um Adyuss'
+    ...     corpus[17]["surname"]
+    ['Adyuss']
+"""
+import json
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Union
+
+from language import types
+
+MAGIC = b"FNC1"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sIQ")
+
+UNIT_SEPARATOR = "\x1f"
+
+# Names are generated, and written, in batches of this size.
+BATCH_SIZE = 10000
+
+
+def _align(f, boundary: int = 8):
+    padding = -f.tell() % boundary
+    if padding:
+        f.write(b"\0" * padding)
+
+
+def write(
+    generator: types.NameGenerator,
+    path: Union[str, Path],
+    count: int,
+    seed: Union[int, str, None] = None,
+    metadata: Union[dict, None] = None,
+) -> dict:
+    """
+    Generate `count` names and write them to a corpus file. The same
+    generator, count and seed always produce the same file. Returns the
+    header that was written.
+
+    Names are written as they are generated, one batch at a time, so memory
+    use does not grow with the size of the corpus beyond the offsets. The
+    k-th batch is generated from derive_seed(seed, k) under a budget, so
+    words that run out of attempts are replaced by safe words.
+    """
+    if seed is None:
+        seed = types.rng().getrandbits(64)
+    parts = {part for template in generator.templates.members for part in template.template.lower().split(",")}
+    columns = ["fullname"] + sorted(parts)
+    blobs = dict((column, tempfile.TemporaryFile()) for column in columns)
+    offsets = dict((column, array("Q", [0])) for column in columns)
+    try:
+        for index, written in enumerate(range(0, count, BATCH_SIZE)):
+            batch = min(BATCH_SIZE, count - written)
+            # Any one of a batch's names may run out of attempts, so replace those words with safe words rather than
+            # fail the whole batch.
+            with types.seeded(types.derive_seed(seed, index)), types.budget():
+                names = generator.name(batch)
+            for column in columns:
+                if column == "fullname":
+                    values = [name["fullname"] for name in names]
+                else:
+                    values = [UNIT_SEPARATOR.join(name.get(column, [])) for name in names]
+                data = [value.encode("utf-8") for value in values]
+                blobs[column].write(b"".join(data))
+                position = offsets[column][-1]
+                for value in data:
+                    position += len(value)
+                    offsets[column].append(position)
+
+        header = {
+            "version": VERSION,
+            "count": count,
+            "seed": seed,
+            "columns": {},
+        }
+        header.update(metadata or {})
+        with open(path, "wb") as f:
+            f.write(PREAMBLE.pack(MAGIC, VERSION, 0))
+            for column in columns:
+                blob = blobs[column]
+                blob.seek(0)
+                header["columns"][column] = {"blob": f.tell(), "length": offsets[column][-1]}
+                shutil.copyfileobj(blob, f)
+            for column in columns:
+                _align(f)
+                header["columns"][column]["offsets"] = f.tell()
+                table = offsets[column]
+                if sys.byteorder != "little":
+                    table.byteswap()
+                table.tofile(f)
+            position = f.tell()
+            f.write(json.dumps(header).encode("utf-8"))
+            f.seek(0)
+            f.write(PREAMBLE.pack(MAGIC, VERSION, position))
+    finally:
+        for blob in blobs.values():
+            blob.close()
+    return header
+
+
+class Corpus:
+    """
+    A memory-mapped corpus of pre-generated names.
+
+    Attributes:
+        header  - the corpus header: language, pack_hash, seed, count, columns
+        columns - the names of the columns in the corpus
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, position = PREAMBLE.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise types.LanguageError(f"{path} is not a name corpus.")
+        if version != VERSION:
+            raise types.LanguageError(f"{path} has unsupported corpus version {version}.")
+        self.header = json.loads(self._map[position:].decode("utf-8"))
+        self.count = self.header["count"]
+        self.columns = list(self.header["columns"])
+
+        self._view = view = memoryview(self._map)
+        self._blobs = {}
+        self._offsets = {}
+        for column, layout in self.header["columns"].items():
+            self._blobs[column] = layout["blob"]
+            start = layout["offsets"]
+            table = view[start : start + (self.count + 1) * 8]
+            # The offsets are little-endian; read them in place when the host is too.
+            self._offsets[column] = table.cast("Q") if sys.byteorder == "little" else _Offsets(table)
+
+    def _value(self, column: str, index: int) -> str:
+        offsets = self._offsets[column]
+        start = self._blobs[column]
+        return self._map[start + offsets[index] : start + offsets[index + 1]].decode("utf-8")
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"corpus index {index} out of range")
+        return index
+
+    def fullname(self, index: int) -> str:
+        """
+        Returns the full name of the `index`-th entry.
+        """
+        return self._value("fullname", self._index(index))
+
+    def __getitem__(self, index: int) -> types.Name:
+        """
+        Returns the `index`-th entry as a Name, with the values of each of its parts.
+        """
+        index = self._index(index)
+        name = types.Name(list)
+        for column in self.columns[1:]:
+            value = self._value(column, index)
+            if value:
+                name[column] = value.split(UNIT_SEPARATOR)
+        name["fullname"] = self._value("fullname", index)
+        return name
+
+    def random(self) -> types.Name:
+        """
+        Returns a random entry.
+        """
+        return self[types.rng().randrange(self.count)]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        # Views of the map must be released before it can be closed.
+        for offsets in self._offsets.values():
+            offsets.release()
+        self._offsets = {}
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Offsets:
+    """
+    Reads little-endian offsets on big-endian hosts.
+    """
+
+    def __init__(self, view: memoryview):
+        self.view = view
+
+    def __getitem__(self, index: int) -> int:
+        return struct.unpack_from("<Q", self.view, index * 8)[0]
+
+    def release(self):
+        self.view.release()
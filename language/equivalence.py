@@ -0,0 +1,381 @@
+"""
+Statistical equivalence checks for alternative generation engines.
+
+An engine is any function that generates words or names: the batched and
+vectorized paths of Language.word() and NameGenerator.name(), or a compiled or
+constrained engine yet to be written. Every engine must produce exactly the
+same distribution of words and names as the reference engines, which generate
+one word or name at a time exactly as the original implementation did.
+
+This module draws a large sample from a reference engine and from a candidate
+engine, and compares the distributions of a number of features of their
+output: word lengths, first and last graphemes, affixes, consonant/vowel
+shapes, whole words and how often each grapheme appears, or for names, the
+parts that were filled in and the values of each part. Categorical features
+are compared with a chi-square test of homogeneity, lengths also with a
+two-sample Kolmogorov-Smirnov test, and grapheme counts per word with Welch's
+test.
+
+Every check runs many tests, so p-values are compared against a Bonferroni
+corrected threshold: with the default alpha of 0.001, an engine that is truly
+equivalent fails a full run less than one time in a thousand.
+
+pytest runs a small, seeded sample of every language (tests/test_equivalence.py);
+run this module for the full check.
+
+Usage:
+    >>> report = compare_words(elvish.Language, reference_words, batched_words)
+    >>> report.passed()
+    True
+
+    % python -m language.equivalence 2000 elvish dwarvish
+    elvish words                 2000 x 2  34 tests  min p=0.0027  ok
+    ...
+"""
+import math
+import sys
+from collections import Counter
+from typing import Callable
+
+from language import types
+
+# The family-wise false alarm rate of a full run.
+ALPHA = 0.001
+
+# Categories expected to occur fewer times than this are pooled, as the
+# chi-square approximation is poor for rare categories.
+MINIMUM_EXPECTED = 5
+
+SAMPLES = 5000
+
+
+def reference_words(language: types.Language, count: int) -> list:
+    """
+    The reference word engine: generate words one at a time.
+    """
+    return _retry(lambda: language.word(1)[0], count)
+
+
+def batched_words(language: types.Language, count: int) -> list:
+    """
+    Generate words in batches, using the vectorized backend where possible.
+    """
+    return _retry(lambda: language.word(256), count)
+
+
+def reference_names(generator: types.NameGenerator, count: int) -> list:
+    """
+    The reference name engine: generate names one at a time, one part at a time.
+    """
+
+    def name():
+        parts = []
+        for part in generator.templates.random():
+            value = generator.add_part(part).strip()
+            if value:
+                parts.append((part, value))
+        return parts
+
+    return _retry(name, count)
+
+
+def batched_names(generator: types.NameGenerator, count: int) -> list:
+    """
+    Generate names in batches with NameGenerator.name().
+    """
+
+    def names():
+        return [
+            [(part, value) for part in name if part != "fullname" for value in name[part]]
+            for name in generator.name(256)
+        ]
+
+    return _retry(names, count)
+
+
+def _retry(draw: Callable, count: int) -> list:
+    """
+    Returns `count` results of draw(), which may return one result or a list
+    of results. Draws which exhaust their attempts at a valid word are
+    repeated, as a caller would.
+    """
+    results = []
+    while len(results) < count:
+        try:
+            result = draw()
+        except types.ImprobableTemplateError:
+            continue
+        if isinstance(result, list) and (not result or not isinstance(result[0], tuple)):
+            results.extend(result)
+        else:
+            results.append(result)
+    return results[:count]
+
+
+def _gamma_q(a: float, x: float) -> float:
+    """
+    The regularized upper incomplete gamma function Q(a, x).
+    """
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        # Series expansion of P(a, x).
+        term = total = 1 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1 - total * math.exp(log_prefix))
+    # Continued fraction for Q(a, x), by the modified Lentz method.
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def chi_square(first: Counter, second: Counter) -> tuple:
+    """
+    Chi-square test of homogeneity of two samples of categories. Returns
+    (statistic, degrees of freedom, p-value).
+    """
+    n1, n2 = sum(first.values()), sum(second.values())
+    total = n1 + n2
+    if not n1 or not n2:
+        return 0.0, 0, 1.0
+    # Pool rare categories, so every cell's expected count is large enough.
+    smaller = min(n1, n2) / total
+    common, pooled = [], [0, 0]
+    for category in set(first) | set(second):
+        a, b = first.get(category, 0), second.get(category, 0)
+        if (a + b) * smaller < MINIMUM_EXPECTED:
+            pooled[0] += a
+            pooled[1] += b
+        else:
+            common.append((a, b))
+    if sum(pooled) * smaller >= MINIMUM_EXPECTED:
+        common.append(tuple(pooled))
+    if len(common) < 2:
+        return 0.0, 0, 1.0
+    statistic = 0.0
+    for a, b in common:
+        row = a + b
+        for observed, n in ((a, n1), (b, n2)):
+            expected = row * n / total
+            statistic += (observed - expected) ** 2 / expected
+    df = len(common) - 1
+    return statistic, df, _gamma_q(df / 2, statistic / 2)
+
+
+def kolmogorov_smirnov(first: list, second: list) -> tuple:
+    """
+    Two-sample Kolmogorov-Smirnov test. Returns (statistic, p-value), using the
+    asymptotic distribution; the test is conservative for discrete values such
+    as lengths.
+    """
+    n1, n2 = len(first), len(second)
+    first, second = Counter(first), Counter(second)
+    statistic = 0.0
+    cdf1 = cdf2 = 0.0
+    for value in sorted(set(first) | set(second)):
+        cdf1 += first[value] / n1
+        cdf2 += second[value] / n2
+        statistic = max(statistic, abs(cdf1 - cdf2))
+    n = n1 * n2 / (n1 + n2)
+    x = (math.sqrt(n) + 0.12 + 0.11 / math.sqrt(n)) * statistic
+    if x < 0.2:
+        return statistic, 1.0
+    p = 2 * sum((-1) ** (k - 1) * math.exp(-2 * k * k * x * x) for k in range(1, 101))
+    return statistic, min(max(p, 0.0), 1.0)
+
+
+def welch(first: list, second: list) -> tuple:
+    """
+    Welch's two-sample test for a difference in means, using the normal
+    approximation, which is accurate for samples of this size. Returns (z, p-value).
+    """
+    n1, n2 = len(first), len(second)
+    mean1, mean2 = sum(first) / n1, sum(second) / n2
+    var1 = sum((x - mean1) ** 2 for x in first) / max(n1 - 1, 1)
+    var2 = sum((x - mean2) ** 2 for x in second) / max(n2 - 1, 1)
+    error = math.sqrt(var1 / n1 + var2 / n2)
+    if not error:
+        return 0.0, 1.0 if mean1 == mean2 else 0.0
+    z = (mean1 - mean2) / error
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+class Report:
+    """
+    The results of comparing two engines.
+
+    Attributes:
+        name    - what was compared
+        samples - the sample size drawn from each engine
+        tests   - (feature, test, statistic, p-value) for each test
+    """
+
+    def __init__(self, name: str, samples: int):
+        self.name = name
+        self.samples = samples
+        self.tests = []
+
+    def add(self, feature: str, test: str, statistic: float, p: float):
+        self.tests.append((feature, test, statistic, p))
+
+    def compare(self, feature: str, first: list, second: list, ordinal: bool = False):
+        """
+        Compare the distributions of one feature of the two samples.
+        """
+        statistic, df, p = chi_square(Counter(first), Counter(second))
+        self.add(feature, "chi-square", statistic, p)
+        if ordinal:
+            statistic, p = kolmogorov_smirnov(first, second)
+            self.add(feature, "ks", statistic, p)
+
+    def compare_counts(self, feature: str, first: list, second: list):
+        """
+        Compare how often each grapheme appears in the words of the two
+        samples. Graphemes within a word are not independent, so rather than
+        pooling them, each grapheme's count per word is compared with Welch's
+        test.
+        """
+        totals = Counter("".join(first)) + Counter("".join(second))
+        for grapheme, total in sorted(totals.items()):
+            if total < MINIMUM_EXPECTED * 2:
+                continue
+            statistic, p = welch([word.count(grapheme) for word in first], [word.count(grapheme) for word in second])
+            self.add(f"{feature} {grapheme!r}", "welch", statistic, p)
+
+    def failures(self, threshold: float) -> list:
+        return [test for test in self.tests if test[3] < threshold]
+
+    def passed(self, alpha: float = ALPHA) -> bool:
+        return not self.failures(alpha / max(len(self.tests), 1))
+
+    @property
+    def minimum(self) -> float:
+        return min((test[3] for test in self.tests), default=1.0)
+
+
+def _shape(language: types.Language, word: str) -> str:
+    vowels = set("".join(language.vowels.members))
+    return "".join("v" if c in vowels else "c" for c in word)
+
+
+def compare_words(
+    language: types.Language,
+    reference: Callable = reference_words,
+    candidate: Callable = batched_words,
+    samples: int = SAMPLES,
+    name: str = "",
+) -> Report:
+    """
+    Compare the words generated by two word engines.
+    """
+    first, second = reference(language, samples), candidate(language, samples)
+    report = Report(name or f"{language.name} words", samples)
+    features = [
+        ("length", len, True),
+        ("first grapheme", lambda word: word[:1], False),
+        ("last grapheme", lambda word: word[-1:], False),
+        ("prefix", lambda word: word[:2], False),
+        ("suffix", lambda word: word[-2:], False),
+        ("shape", lambda word: _shape(language, word), False),
+        ("word", lambda word: word, False),
+    ]
+    for feature, measure, ordinal in features:
+        report.compare(feature, [measure(word) for word in first], [measure(word) for word in second], ordinal)
+    report.compare_counts("grapheme", first, second)
+    return report
+
+
+def compare_names(
+    generator: types.NameGenerator,
+    reference: Callable = reference_names,
+    candidate: Callable = batched_names,
+    samples: int = SAMPLES,
+    name: str = "",
+) -> Report:
+    """
+    Compare the names generated by two name engines.
+    """
+    first, second = reference(generator, samples), candidate(generator, samples)
+    report = Report(name or f"{generator.language.name} names", samples)
+    report.compare("template", [tuple(p for (p, v) in n) for n in first], [tuple(p for (p, v) in n) for n in second])
+    report.compare(
+        "length",
+        [len(" ".join(v for (p, v) in n)) for n in first],
+        [len(" ".join(v for (p, v) in n)) for n in second],
+        ordinal=True,
+    )
+    parts = sorted({p for n in first + second for (p, v) in n})
+    for part in parts:
+        report.compare(
+            part, [v for n in first for (p, v) in n if p == part], [v for n in second for (p, v) in n if p == part]
+        )
+    first_names = [" ".join(v for (p, v) in n) for n in first]
+    second_names = [" ".join(v for (p, v) in n) for n in second]
+    report.compare("name", first_names, second_names)
+    report.compare_counts("grapheme", first_names, second_names)
+    return report
+
+
+def check(languages: dict, samples: int = SAMPLES, alpha: float = ALPHA, out=sys.stdout) -> bool:
+    """
+    Compare the batched word and name engines against the reference engines
+    for every language, and print a summary. Returns True if every engine is
+    equivalent at a family-wise false alarm rate of `alpha`.
+    """
+    reports = []
+    for name, module in languages.items():
+        reports.append(compare_words(module.Language, samples=samples, name=f"{name} words"))
+        reports.append(compare_names(module.Name, samples=samples, name=f"{name} names"))
+        if module.NobleName is not module.Name:
+            reports.append(compare_names(module.NobleName, samples=samples, name=f"{name} noble names"))
+
+    threshold = alpha / sum(len(report.tests) for report in reports)
+    passed = True
+    for report in reports:
+        failures = report.failures(threshold)
+        passed = passed and not failures
+        print(
+            f"{report.name:28s} {report.samples} x 2 {len(report.tests):3d} tests  "
+            f"min p={report.minimum:.4f}  {'FAIL' if failures else 'ok'}",
+            file=out,
+        )
+        for feature, test, statistic, p in failures:
+            print(f"    {feature} ({test}): statistic={statistic:.3f} p={p:.3g}", file=out)
+    return passed
+
+
+def main(args: list) -> int:
+    """
+    Usage: python -m language.equivalence [SAMPLES] [LANGUAGE ...]
+    """
+    import language
+
+    samples = int(args.pop(0)) if args and args[0].isdigit() else SAMPLES
+    languages = language.load_language_pack()[1]
+    if args:
+        languages = dict((name, languages[name]) for name in args)
+    return 0 if check(languages, samples=samples) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,500 @@
+"""
+Language identification and plausibility scoring.
+
+Given a string -- a player-submitted name, say, or a word from legacy campaign
+notes -- score it against every language in a language pack and report which
+language most likely produced it.
+
+Each language is compiled once into a WordModel: the probability of every
+grapheme of every type, the probability of every syllable template, and the
+rate at which the language's rules accept candidate words. The probability
+that the language generates a given word is then computed exactly, with a
+dynamic program over the template slots that sums over every way of spelling
+the word with the language's graphemes. Because it is exact, scoring doesn't
+need to sample words at all.
+
+Names contain parts that aren't produced by the language itself, such as the
+surname suffixes of a NameGenerator, so each word's probability is mixed with
+a small probability under a background model of the language's characters.
+A word is "plausible" in a language if the language itself could have
+generated it.
+
+Usage:
+    >>> identifier = Identifier(supported_languages)
+    >>> result = identifier.identify("Tiny Châ Pothesadottyr")
+    >>> result.language
+    'dwarvish'
+    >>> result.plausible["dwarvish"]
+    0.67
+
+The `fanlang identify` command scores a stream of strings in batches across
+multiple processes.
+
+Scoring is exact, not fast: against the thirteen languages of the default
+pack, a three-word name takes 0.5-0.8ms on one core, or roughly 1500 names a
+second. A million distinct names is about ten minutes of CPU time, divided
+among the worker processes; words that repeat are only scored once.
+"""
+import math
+import multiprocessing
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, Union
+
+from language import types
+
+# The weight given to the background character model of each language.
+BACKGROUND_WEIGHT = 0.05
+
+# The share of the background model given to characters that a language never
+# generates, spread over UNSEEN_CHARACTERS possible characters.
+SMOOTHING = 0.01
+UNSEEN_CHARACTERS = 100
+
+# The most words a single generated word may span, for languages whose graphemes contain spaces.
+MAXIMUM_SPAN = 3
+
+
+def _distribution(weighted_set: types.WeightedSet) -> dict:
+    distribution = defaultdict(float)
+    total = sum(weighted_set.weights)
+    for member, weight in zip(weighted_set.members, weighted_set.weights):
+        distribution[member] += weight / total
+    return dict(distribution)
+
+
+def _acceptance(language: types.Language, samples: int) -> float:
+    """
+    Returns the fraction of candidate words which pass the language's rules.
+    """
+    if not language.rules:
+        return 1.0
+    accepted = sum(1 for _ in range(samples) if language.validate(language.candidate()))
+    return max(accepted, 1) / samples
+
+
+def _empirical(handler, samples: int) -> dict:
+    counts = Counter(handler() for _ in range(samples))
+    return dict((member, count / samples) for (member, count) in counts.items())
+
+
+class _Node:
+    """
+    A node in a trie of syllable template slots.
+
+    Attributes:
+        weight   - the probability of the template which ends at this node, if any
+        children - the nodes for each slot which may follow this one
+        shortest - the fewest characters the templates through this node can spell from its slot onwards
+        longest  - the most characters the templates through this node can spell from its slot onwards
+    """
+
+    def __init__(self):
+        self.weight = 0.0
+        self.children = {}
+        self.shortest = 0
+        self.longest = 0
+
+    def bound(self, lengths: dict, slot: tuple = ()):
+        for child_slot, child in self.children.items():
+            child.bound(lengths, child_slot)
+        remaining = [(child.shortest, child.longest) for child in self.children.values()]
+        if self.weight:
+            remaining.append((0, 0))
+        self.shortest = min(shortest for (shortest, longest) in remaining)
+        self.longest = max(longest for (shortest, longest) in remaining)
+        if slot:
+            self.shortest += min(lengths[name][0] for name in slot)
+            self.longest += max(lengths[name][1] for name in slot)
+
+
+class WordModel:
+    """
+    The probability of words under one Language.
+
+    Grapheme types whose handlers are the standard ones (get_grapheme_vowel,
+    get_grapheme_consonant, ...) use the language's WeightedSets directly;
+    custom handlers, such as Draconic's stops around vowels, are measured by
+    sampling them.
+    """
+
+    def __init__(self, language: types.Language, samples: int = 2000):
+        self.language = language
+        self.templates = [
+            (weight, [[grapheme.lower() for grapheme in slot.split("|")] for slot in member.template.split(",")])
+            for (member, weight) in zip(language.syllables.members, language.syllables.weights)
+        ]
+        total = sum(weight for (weight, slots) in self.templates)
+        self.templates = [
+            (weight / total, slots)
+            for (weight, slots) in self.templates
+            if len(slots) >= language.minimum_grapheme_count
+        ]
+
+        names = {grapheme for (weight, slots) in self.templates for slot in slots for grapheme in slot}
+        self.graphemes = dict((name, self._graphemes(name, samples)) for name in names)
+        self.prefixes = self._graphemes("prefix", samples) if language.prefixes else {"": 1.0}
+        self.suffixes = self._graphemes("suffix", samples) if language.suffixes else {"": 1.0}
+
+        # Index each grapheme type by first character, so the dynamic program
+        # only considers graphemes which can match at each position.
+        self.index = {}
+        for name, distribution in self.graphemes.items():
+            by_first = defaultdict(list)
+            for grapheme, p in distribution.items():
+                by_first[grapheme[:1]].append((grapheme, p))
+            self.index[name] = dict(by_first)
+
+        self.valid_sequences = sum(p * self._sequences(slots) for (p, slots) in self.templates)
+        self.trie = self._trie()
+        self.acceptance = _acceptance(language, samples)
+
+        # The expected number of times each character appears in a word, for the background model.
+        characters = defaultdict(float)
+        for p_template, slots in self.templates:
+            for slot in slots:
+                for name in slot:
+                    for grapheme, p in self.graphemes[name].items():
+                        for character in grapheme:
+                            characters[character] += p_template * p / len(slot)
+        self._background(characters)
+
+    def _graphemes(self, name: str, samples: int) -> dict:
+        handler = f"get_grapheme_{name}"
+        if types._defined_by(self.language.__class__, handler) is types.Language:
+            attribute = {"vowel": "vowels", "consonant": "consonants"}.get(name, f"{name}es")
+            return _distribution(getattr(self.language, attribute))
+        return _empirical(self.language.handlers[handler], samples)
+
+    def _sequences(self, slots: list) -> float:
+        """
+        Returns the probability that a template's grapheme type sequence passes validate_graphemes().
+        """
+        states = {(None, 0): 1.0}
+        for slot in slots:
+            following = defaultdict(float)
+            for (last, run), p in states.items():
+                for name in slot:
+                    length = run + 1 if name == last else 1
+                    if length < 3:
+                        following[(name, length)] += p / len(slot)
+            states = following
+        return sum(states.values())
+
+    def _trie(self) -> "_Node":
+        """
+        Merge the templates into a trie of slots, so that templates which begin
+        with the same slots share the work of spelling them.
+        """
+        lengths = dict(
+            (name, (min(map(len, distribution)), max(map(len, distribution))))
+            for (name, distribution) in self.graphemes.items()
+        )
+        root = _Node()
+        for p, slots in self.templates:
+            node = root
+            for slot in slots:
+                node = node.children.setdefault(tuple(slot), _Node())
+            node.weight += p
+        root.bound(lengths)
+        return root
+
+    def _spellings(self, word: str, node: "_Node", states: dict) -> float:
+        """
+        Returns the probability that the templates below a trie node spell the
+        rest of the word, summed over every valid grapheme type sequence and
+        every choice of graphemes.
+        """
+        end = len(word)
+        total = node.weight * sum(p for ((position, last, run), p) in states.items() if position == end)
+        for slot, child in node.children.items():
+            following = defaultdict(float)
+            for (position, last, run), p in states.items():
+                # Skip spellings that can no longer fill the rest of the word exactly.
+                if not child.shortest <= end - position <= child.longest:
+                    continue
+                p_slot = p / len(slot)
+                for name in slot:
+                    length = run + 1 if name == last else 1
+                    if length == 3:
+                        continue
+                    index = self.index[name]
+                    for grapheme, p_grapheme in index.get("", ()):
+                        following[(position, name, length)] += p_slot * p_grapheme
+                    if position < end:
+                        for grapheme, p_grapheme in index.get(word[position], ()):
+                            if word.startswith(grapheme, position):
+                                following[(position + len(grapheme), name, length)] += p_slot * p_grapheme
+            if following:
+                total += self._spellings(word, child, following)
+        return total
+
+    def core(self, word: str) -> float:
+        """
+        Returns the probability that the language generates the word before prefixes and suffixes are added.
+        """
+        if not word or not self.language.validate(word):
+            return 0.0
+        raw = self._spellings(word, self.trie, {(0, None, 0): 1.0})
+        return raw / self.valid_sequences / self.acceptance
+
+    def probability(self, word: str) -> float:
+        """
+        Returns the probability that Language.word() generates the word.
+        """
+        # Most words contain a character that most languages never use.
+        if not self.alphabet.issuperset(word):
+            return 0.0
+        cores = {}
+        total = 0.0
+        for prefix, p_prefix in self.prefixes.items():
+            if not word.startswith(prefix):
+                continue
+            for suffix, p_suffix in self.suffixes.items():
+                if len(prefix) + len(suffix) < len(word) and word.endswith(suffix):
+                    core = word[len(prefix) : len(word) - len(suffix)]
+                    if core not in cores:
+                        cores[core] = self.core(core)
+                    total += p_prefix * p_suffix * cores[core]
+        return total
+
+    def _background(self, characters: dict):
+        """
+        Build the background model from the expected number of times each character appears in a word.
+        """
+        length = sum(characters.values())
+        self.unseen = math.log(SMOOTHING / UNSEEN_CHARACTERS)
+        self.characters = dict(
+            (c, math.log((1 - SMOOTHING) * n / length + SMOOTHING / UNSEEN_CHARACTERS)) for (c, n) in characters.items()
+        )
+        self.alphabet = set(characters).union(*self.prefixes, *self.suffixes)
+        self.stop = math.log(1 / (length + 1))
+        self.go = math.log(1 - 1 / (length + 1))
+        self.spans_words = any(" " in c for c in characters)
+
+    def background(self, characters: dict, length: int) -> float:
+        """
+        Returns the log probability of a word under a model of the language's
+        characters alone, given the number of times each character appears in
+        the word and the word's length.
+        """
+        log_p = sum(n * self.characters.get(c, self.unseen) for (c, n) in characters.items())
+        return log_p + length * self.go + self.stop
+
+
+class NgramWordModel(WordModel):
+    """
+    The probability of words under an NgramLanguage, read from its transition tables.
+    """
+
+    def __init__(self, language, samples: int = 2000):
+        self.language = language
+        self.prefixes = self._graphemes("prefix", samples) if language.prefixes else {"": 1.0}
+        self.suffixes = self._graphemes("suffix", samples) if language.suffixes else {"": 1.0}
+        model = language.model
+        self.transitions = []
+        for context in range(len(model.contexts)):
+            start, end = model.offsets[context], model.offsets[context + 1]
+            count = end - start
+            p = [model.probability[i] / count for i in range(start, end)]
+            for i in range(start, end):
+                if model.alias[i] != i - start:
+                    p[model.alias[i]] += (1 - model.probability[i]) / count
+            self.transitions.append(
+                dict((model.symbols[i], (p[i - start], model.following[i])) for i in range(start, end))
+            )
+
+        self.acceptance = _acceptance(language, samples)
+
+        # Sampling the model is cheap, so the mean word length is measured rather than derived.
+        length = sum(len(model.sample(language.max_length)) for _ in range(samples)) / samples
+        total = sum(model.frequencies.values())
+        self._background(dict((c, n / total * length) for (c, n) in model.frequencies.items()))
+
+    def core(self, word: str) -> float:
+        from language.ngram import END
+
+        if not word or len(word) > self.language.max_length or not self.language.validate(word):
+            return 0.0
+        context = self.language.model.start
+        p = 1.0
+        for character in word + END:
+            try:
+                p_character, context = self.transitions[context][character]
+            except KeyError:
+                return 0.0
+            p *= p_character
+        return p / self.acceptance
+
+
+def word_model(language: types.Language, samples: int = 2000) -> WordModel:
+    """
+    Returns the appropriate WordModel for a language.
+
+    The samples are drawn from a seed of the language's own, so that the model,
+    and so every score, is the same in every process.
+    """
+    from language.ngram import NgramLanguage
+
+    with types.seeded(f"{language.name}:word-model"):
+        if isinstance(language, NgramLanguage):
+            return NgramWordModel(language, samples)
+        return WordModel(language, samples)
+
+
+class Identification:
+    """
+    The scores of one string against every language.
+
+    Attributes:
+        text      - the string that was scored
+        scores    - a dict of language names to log-likelihoods per character
+        plausible - a dict of language names to the fraction of words the language could have generated
+        language  - the name of the most likely language
+    """
+
+    def __init__(self, text: str, scores: dict, plausible: dict):
+        self.text = text
+        self.scores = scores
+        self.plausible = plausible
+        self.language = max(scores, key=scores.get) if scores else None
+
+    def __str__(self):
+        return f"{self.text}\t{self.language}\t{self.scores[self.language]:.3f}\t{self.plausible[self.language]:.2f}"
+
+
+class Identifier:
+    """
+    Scores strings against every language in a set of languages.
+    """
+
+    def __init__(self, languages: dict, samples: int = 2000):
+        """
+        Args:
+            languages - a dict of language names to Language instances or language modules
+            samples   - the number of words to sample when measuring rule acceptance and custom graphemes
+        """
+        self.models = dict(
+            (name, word_model(getattr(language, "Language", language), samples))
+            for (name, language) in languages.items()
+        )
+        self.spans_words = any(model.spans_words for model in self.models.values())
+        self.score_word = lru_cache(maxsize=100000)(self._score_word)
+
+    def _score_word(self, word: str) -> tuple:
+        """
+        Returns ((log-likelihood, plausible) for each language) for one word.
+        """
+        characters = Counter(word)
+        scores = []
+        for model in self.models.values():
+            p = model.probability(word)
+            background = math.log(BACKGROUND_WEIGHT) + model.background(characters, len(word))
+            if p > 0:
+                log_p = math.log(1 - BACKGROUND_WEIGHT) + math.log(p)
+                top = max(log_p, background)
+                scores.append((top + math.log(math.exp(log_p - top) + math.exp(background - top)), True))
+            else:
+                scores.append((background, False))
+        return tuple(scores)
+
+    def identify(self, text: str) -> Identification:
+        """
+        Score a string against every language.
+
+        Each word of the string is scored separately. Some languages have
+        graphemes containing spaces, so for those languages runs of up to
+        MAXIMUM_SPAN words are also scored as single words, and the most likely
+        way of dividing the string is used.
+        """
+        words = text.lower().split()
+        if not words:
+            return Identification(text, {}, {})
+        span = MAXIMUM_SPAN if self.spans_words else 1
+        groups = dict(
+            ((i, j), self.score_word(" ".join(words[i:j])))
+            for i in range(len(words))
+            for j in range(i + 1, min(i + span, len(words)) + 1)
+        )
+
+        characters = sum(len(word) for word in words)
+        scores = {}
+        plausible = {}
+        for index, (name, model) in enumerate(self.models.items()):
+            width = MAXIMUM_SPAN if model.spans_words else 1
+            # best[j] is (log-likelihood, plausible words) of the most likely division of words[:j].
+            best = [(0.0, 0)]
+            for j in range(1, len(words) + 1):
+                best.append(
+                    max(
+                        (
+                            best[j - k][0] + groups[(j - k, j)][index][0],
+                            best[j - k][1] + k * groups[(j - k, j)][index][1],
+                        )
+                        for k in range(1, min(width, j) + 1)
+                    )
+                )
+            scores[name] = best[-1][0] / characters
+            plausible[name] = best[-1][1] / len(words)
+        return Identification(text, scores, plausible)
+
+
+# The key of the languages of the Identifier built for this process, and the Identifier.
+_identifier = None
+
+
+def _key(languages: dict) -> tuple:
+    return tuple((name, id(getattr(language, "Language", language))) for (name, language) in languages.items())
+
+
+def _initialize(languages: Union[dict, None], pack: str, names: Union[tuple, None] = None) -> Identifier:
+    """
+    Returns the Identifier for a dict of languages or, if languages is None,
+    for the named languages of a language pack (by default, all of them). The
+    Identifier is built once, and rebuilt only when the languages change.
+    """
+    global _identifier
+    if languages is None:
+        import language
+
+        supported = language.load_language_pack(pack, lazy=names is not None)[1]
+        languages = dict((name, supported[name]) for name in (supported if names is None else names))
+    key = _key(languages)
+    if _identifier is None or _identifier[0] != key:
+        _identifier = (key, Identifier(languages))
+    return _identifier[1]
+
+
+def _identify_batch(lines: list) -> list:
+    identifier = _identifier[1]
+    return [identifier.identify(line) for line in lines]
+
+
+def identify_stream(
+    lines: Iterable[str],
+    languages: Union[dict, None] = None,
+    pack: str = "",
+    processes: Union[int, None] = None,
+    batch_size: int = 1000,
+) -> Iterator[Identification]:
+    """
+    Yields an Identification for each line, in order. Lines are scored in
+    batches across `processes` worker processes (by default, one per CPU).
+
+    Worker processes score the lines with the languages of the same names
+    from the language pack. The Identifier is built before the workers start,
+    so workers that are forked inherit it rather than rebuilding it.
+    """
+    identifier = _initialize(languages, pack)
+    lines = (line.rstrip("\n") for line in lines)
+    batches = iter(lambda: list(islice(lines, batch_size)), [])
+    if processes == 1:
+        for batch in batches:
+            yield from (identifier.identify(line) for line in batch)
+        return
+    with multiprocessing.Pool(
+        processes, initializer=_initialize, initargs=(None, pack, tuple(identifier.models))
+    ) as pool:
+        for results in pool.imap(_identify_batch, batches):
+            yield from results
@@ -1,7 +1,11 @@
 """
 Abyssal
 """
+from language import lazy
+
 from .base import Language
-from .names import Name, NobleName
 
-__all__ = [Language, Name, NobleName]
+__all__ = ["Language", "Name", "NobleName"]
+
+# The generators are only imported and built when first used; see language.lazy().
+__getattr__ = lazy(globals(), Name=".names", NobleName=".names")
@@ -1,4 +1,4 @@
-from language import defaults, types
+from language import defaults, lazy, types
 from language.languages.common import Language
 
 suffixes = types.equal_weights(
@@ -56,27 +56,28 @@ suffixes = types.equal_weights(
     ]
 )
 
-Name = types.NameGenerator(
-    language=Language,
-    syllables=types.SyllableSet(
-        (types.Syllable(template="vowel|consonant"), 0.01),
-        (types.Syllable(template="consonant,vowel"), 0.2),
-        (types.Syllable(template="consonant,vowel") * 2, 1.0),
-    ),
-    templates=types.NameSet(
-        (types.NameTemplate("adjective,title,name,surname,count"), 1.0),
-        (types.NameTemplate("title,name,name,surname,count"), 1.0),
-        (types.NameTemplate("title,name,name,surname,surname,count"), 1.0),
-    ),
-    names=None,
-    surnames=None,
-    nicknames=None,
-    adjectives=defaults.adjectives,
-    titles=defaults.titles,
-    counts=defaults.counts,
-    suffixes=suffixes,
-)
-Name.language.prefixes = None
-Name.language.suffixes = None
 
-NobleName = Name
+def _name() -> types.NameGenerator:
+    return types.NameGenerator(
+        language=Language.copy(prefixes=None, suffixes=None),
+        syllables=types.SyllableSet(
+            (types.Syllable(template="vowel|consonant"), 0.01),
+            (types.Syllable(template="consonant,vowel"), 0.2),
+            (types.Syllable(template="consonant,vowel") * 2, 1.0),
+        ),
+        templates=types.NameSet(
+            (types.NameTemplate("adjective,title,name,surname,count"), 1.0),
+            (types.NameTemplate("title,name,name,surname,count"), 1.0),
+            (types.NameTemplate("title,name,name,surname,surname,count"), 1.0),
+        ),
+        names=None,
+        surnames=None,
+        nicknames=None,
+        adjectives=defaults.adjectives,
+        titles=defaults.titles,
+        counts=defaults.counts,
+        suffixes=suffixes,
+    )
+
+
+__getattr__ = lazy(globals(), Name=_name, NobleName=lambda: __getattr__("Name"))
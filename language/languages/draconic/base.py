@@ -28,7 +28,7 @@ class DraconicLanguage(types.Language):
     stops = types.equal_weights(["'"], 1.0)
 
     def get_grapheme_vowel(self) -> str:
-        return self.stops.random() + self.vowels.random() + self.stops.random()
+        return types.choice(self.stops) + types.choice(self.vowels) + types.choice(self.stops)
 
 
 Language = DraconicLanguage(
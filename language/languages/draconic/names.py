@@ -1,4 +1,4 @@
-from language import defaults, types
+from language import defaults, lazy, types
 from language.languages.draconic import Language
 
 # dragon_titles = types.equal_weights([
@@ -19,7 +19,10 @@ class DraconicNameGenerator(types.NameGenerator):
         self.suffixes = types.equal_weights(["us", "ius", "eus", "a", "an", "is"], 1.0, blank=False)
 
     def get_name(self) -> str:
-        return super().get_name() + self.suffixes.random()
+        return super().get_name() + types.choice(self.suffixes)
+
+    def batch_name(self, count: int) -> list:
+        return [name + suffix for (name, suffix) in zip(super().batch_name(count), types.sample(self.suffixes, count))]
 
 
 class NobleDraconicNameGenerator(types.NameGenerator):
@@ -77,12 +80,17 @@ class NobleDraconicNameGenerator(types.NameGenerator):
     def get_title(self) -> str:
         p = ""
         while not p:
-            p = defaults.personality.random()
+            p = types.choice(defaults.personality)
         return p
 
     def get_surname(self) -> str:
-        return super().get_name().replace("'", "").title() + self.suffixes.random()
+        return super().get_name().replace("'", "").title() + types.choice(self.suffixes)
+
+    def batch_surname(self, count: int) -> list:
+        return [
+            name.replace("'", "").title() + suffix
+            for (name, suffix) in zip(super().batch_name(count), types.sample(self.suffixes, count))
+        ]
 
 
-Name = DraconicNameGenerator()
-NobleName = NobleDraconicNameGenerator()
+__getattr__ = lazy(globals(), Name=DraconicNameGenerator, NobleName=NobleDraconicNameGenerator)
@@ -55,7 +55,7 @@ suffixes = types.equal_weights(
 class DruidicLanguage(types.Language):
 
     def get_grapheme_glottal_stop(self) -> str:
-        return glottal_stops.random()
+        return types.choice(glottal_stops)
 
 
 Language = DruidicLanguage(
@@ -1,13 +1,6 @@
-from language import types
+from language import lazy, types
 from language.languages.druidic import Language
 
-Name = types.NameGenerator(
-    language=Language,
-    templates=types.NameSet(
-        (types.NameTemplate("name"), 1.0),
-    ),
-)
-
 
 class DruidicNameGenerator(types.NameGenerator):
     def __init__(self):
@@ -32,8 +25,10 @@ class NobleDruidicNameGenerator(types.NameGenerator):
         self.suffixes = types.equal_weights(["as", "es", "is", "os", "us"], 1.0, blank=False)
 
     def get_name(self) -> str:
-        return super().get_name() + self.suffixes.random()
+        return super().get_name() + types.choice(self.suffixes)
+
+    def batch_name(self, count: int) -> list:
+        return [name + suffix for (name, suffix) in zip(super().batch_name(count), types.sample(self.suffixes, count))]
 
 
-Name = DruidicNameGenerator()
-NobleName = NobleDruidicNameGenerator()
+__getattr__ = lazy(globals(), Name=DruidicNameGenerator, NobleName=NobleDruidicNameGenerator)
@@ -1,4 +1,4 @@
-from language import defaults, types
+from language import defaults, lazy, types
 from language.languages.dwarvish import Language
 
 
@@ -18,8 +18,11 @@ class DwarvishNameGenerator(types.NameGenerator):
         self.suffixes = types.equal_weights(["son", "sson", "zhon", "dottir", "dothir", "dottyr"], 1.0)
 
     def get_surname(self) -> str:
-        return super().get_surname() + self.suffixes.random()
+        return super().get_surname() + types.choice(self.suffixes)
 
+    def batch_surname(self, count: int) -> list:
+        names = super().batch_surname(count)
+        return [name + suffix for (name, suffix) in zip(names, types.sample(self.suffixes, count))]
 
-Name = DwarvishNameGenerator()
-NobleName = Name
+
+__getattr__ = lazy(globals(), Name=DwarvishNameGenerator, NobleName=lambda: __getattr__("Name"))
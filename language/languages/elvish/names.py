@@ -1,20 +1,25 @@
-from language import defaults, types
+from functools import cache
+
+from language import defaults, lazy, types
 from language.languages.elvish import Language
 from language.languages.elvish.base import suffixes
 
-PlaceName = types.NameGenerator(
-    language=Language,
-    syllables=types.SyllableSet(
-        (types.Syllable(template="vowel,vowel|consonant,vowel|consonant"), 1.0),
-        (types.Syllable(template="consonant,vowel|consonant,vowel|consonant"), 0.3),
-    ),
-    templates=types.NameSet(
-        (types.NameTemplate("affix,name"), 1.0),
-    ),
-    affixes=types.WeightedSet(("el", 1.0)),
-    adjectives=defaults.adjectives,
-    suffixes=suffixes,
-)
+
+@cache
+def _place_name() -> types.NameGenerator:
+    return types.NameGenerator(
+        language=Language,
+        syllables=types.SyllableSet(
+            (types.Syllable(template="vowel,vowel|consonant,vowel|consonant"), 1.0),
+            (types.Syllable(template="consonant,vowel|consonant,vowel|consonant"), 0.3),
+        ),
+        templates=types.NameSet(
+            (types.NameTemplate("affix,name"), 1.0),
+        ),
+        affixes=types.WeightedSet(("el", 1.0)),
+        adjectives=defaults.adjectives,
+        suffixes=suffixes,
+    )
 
 
 class ElvishNameGenerator(types.NameGenerator):
@@ -31,11 +36,14 @@ class ElvishNameGenerator(types.NameGenerator):
             suffixes=suffixes,
         )
         self.language.minimum_grapheme_count = 2
-        self.place_generator = PlaceName
+        self.place_generator = _place_name()
 
     def get_surname(self) -> str:
         return self.place_generator.name()[0]["name"][0]
 
+    def batch_surname(self, count: int) -> list:
+        return [name["name"][0] for name in self.place_generator.name(count)]
+
 
 class NobleElvishNameGenerator(types.NameGenerator):
     def __init__(self):
@@ -50,7 +58,7 @@ class NobleElvishNameGenerator(types.NameGenerator):
             titles=defaults.titles,
         )
         self.language.minimum_grapheme_count = 2
-        self.place_generator = PlaceName
+        self.place_generator = _place_name()
         self.suffixes = types.equal_weights(
             [
                 "ieth",
@@ -71,8 +79,13 @@ class NobleElvishNameGenerator(types.NameGenerator):
         )
 
     def get_surname(self) -> str:
-        return self.place_generator.name()[0]["name"][0] + self.suffixes.random()
+        return self.place_generator.name()[0]["name"][0] + types.choice(self.suffixes)
+
+    def batch_surname(self, count: int) -> list:
+        return [
+            name["name"][0] + suffix
+            for (name, suffix) in zip(self.place_generator.name(count), types.sample(self.suffixes, count))
+        ]
 
 
-Name = ElvishNameGenerator()
-NobleName = NobleElvishNameGenerator()
+__getattr__ = lazy(globals(), PlaceName=_place_name, Name=ElvishNameGenerator, NobleName=NobleElvishNameGenerator)
@@ -1,10 +1,14 @@
-from language import types
+from language import lazy, types
 from language.languages.gnomish import Language
 
-Name = types.NameGenerator(
-    language=Language,
-    templates=types.NameSet(
-        (types.NameTemplate("name,surname"), 1.0),
-    ),
-)
-NobleName = Name
+
+def _name() -> types.NameGenerator:
+    return types.NameGenerator(
+        language=Language,
+        templates=types.NameSet(
+            (types.NameTemplate("name,surname"), 1.0),
+        ),
+    )
+
+
+__getattr__ = lazy(globals(), Name=_name, NobleName=lambda: __getattr__("Name"))
@@ -1,4 +1,4 @@
-from language import defaults, types
+from language import defaults, lazy, types
 from language.languages.halfling import Language
 
 
@@ -6,12 +6,18 @@ class HalflingNameGenerator(types.NameGenerator):
     def get_name(self) -> str:
         return super().get_name().lower().capitalize()
 
+    def batch_name(self, count: int) -> list:
+        return [name.lower().capitalize() for name in super().batch_name(count)]
 
-Name = HalflingNameGenerator(
-    language=Language,
-    nicknames=defaults.positive_adjectives,
-    templates=types.NameSet(
-        (types.NameTemplate("name,name,name,nickname"), 1.0),
-    ),
-)
-NobleName = Name
+
+def _name() -> types.NameGenerator:
+    return HalflingNameGenerator(
+        language=Language,
+        nicknames=defaults.positive_adjectives,
+        templates=types.NameSet(
+            (types.NameTemplate("name,name,name,nickname"), 1.0),
+        ),
+    )
+
+
+__getattr__ = lazy(globals(), Name=_name, NobleName=lambda: __getattr__("Name"))
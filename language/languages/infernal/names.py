@@ -1,4 +1,4 @@
-from language import types
+from language import lazy, types
 from language.languages.infernal import Language
 
 adjectives = types.equal_weights(
@@ -64,7 +64,10 @@ class InfernalNameGenerator(types.NameGenerator):
         self.suffixes = types.equal_weights(["us", "ius", "eus", "a", "an", "is"], 1.0, blank=False)
 
     def get_name(self) -> str:
-        return super().get_name() + self.suffixes.random()
+        return super().get_name() + types.choice(self.suffixes)
+
+    def batch_name(self, count: int) -> list:
+        return [name + suffix for (name, suffix) in zip(super().batch_name(count), types.sample(self.suffixes, count))]
 
 
 class NobleInfernalNameGenerator(types.NameGenerator):
@@ -80,8 +83,10 @@ class NobleInfernalNameGenerator(types.NameGenerator):
         self.suffixes = types.equal_weights(["us", "ius", "to", "tro", "eus", "a", "an", "is"], 1.0, blank=False)
 
     def get_name(self) -> str:
-        return super().get_name() + self.suffixes.random()
+        return super().get_name() + types.choice(self.suffixes)
+
+    def batch_name(self, count: int) -> list:
+        return [name + suffix for (name, suffix) in zip(super().batch_name(count), types.sample(self.suffixes, count))]
 
 
-Name = InfernalNameGenerator()
-NobleName = NobleInfernalNameGenerator()
+__getattr__ = lazy(globals(), Name=InfernalNameGenerator, NobleName=NobleInfernalNameGenerator)
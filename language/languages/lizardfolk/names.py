@@ -1,4 +1,4 @@
-from language import types
+from language import lazy, types
 from language.languages.lizardfolk import Language
 
 
@@ -12,8 +12,15 @@ class LizardfolkNameGenerator(types.NameGenerator):
         )
 
     def get_surname(self) -> str:
-        return self.language.consonants.random().title()
+        return types.choice(self.language.consonants).title()
 
+    def batch_surname(self, count: int) -> list:
+        return [name.title() for name in types.sample(self.language.consonants, count)]
 
-Name = LizardfolkNameGenerator()
-NobleName = Name
+    def space_surname(self):
+        from language import permute
+
+        return permute.Values(self.language.consonants.members, str.title)
+
+
+__getattr__ = lazy(globals(), Name=LizardfolkNameGenerator, NobleName=lambda: __getattr__("Name"))
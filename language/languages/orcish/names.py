@@ -1,4 +1,4 @@
-from language import defaults, types
+from language import defaults, lazy, types
 from language.languages.orcish import Language
 
 
@@ -53,8 +53,23 @@ class OrcishNameGenerator(types.NameGenerator):
         )
 
     def get_surname(self) -> str:
-        return self.language.add_grapheme(word="", template="consonant").strip().title() + self.suffixes.random()
+        return self.language.add_grapheme(word="", template="consonant").strip().title() + types.choice(self.suffixes)
 
+    def batch_surname(self, count: int) -> list:
+        return [
+            consonant.strip().title() + suffix
+            for (consonant, suffix) in zip(
+                types.sample(self.language.consonants, count), types.sample(self.suffixes, count)
+            )
+        ]
 
-Name = OrcishNameGenerator()
-NobleName = Name
+    def space_surname(self):
+        from language import permute
+
+        return permute.Concatenation(
+            permute.Values(self.language.consonants.members, lambda consonant: consonant.strip().title()),
+            permute.Values(self.suffixes.members),
+        )
+
+
+__getattr__ = lazy(globals(), Name=OrcishNameGenerator, NobleName=lambda: __getattr__("Name"))
@@ -20,5 +20,4 @@ def cannot_start_with_repeated_consonants(language: Language, word: str) -> bool
     return True
 
 
-rules = default_rules
-rules.add(cannot_start_with_repeated_consonants)
+rules = default_rules | {cannot_start_with_repeated_consonants}
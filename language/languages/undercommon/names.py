@@ -1,18 +1,21 @@
-import random
+from functools import cache
 
-from language import defaults, types
+from language import defaults, lazy, types
 from language.languages.undercommon import Language
 
-PlaceName = types.NameGenerator(
-    language=Language,
-    syllables=Language.syllables,
-    templates=types.NameSet(
-        (types.NameTemplate("affix,name"), 1.0),
-    ),
-    affixes=types.WeightedSet(("el", 1.0)),
-    adjectives=defaults.adjectives,
-    suffixes=Language.suffixes,
-)
+
+@cache
+def _place_name() -> types.NameGenerator:
+    return types.NameGenerator(
+        language=Language,
+        syllables=Language.syllables,
+        templates=types.NameSet(
+            (types.NameTemplate("affix,name"), 1.0),
+        ),
+        affixes=types.WeightedSet(("el", 1.0)),
+        adjectives=defaults.adjectives,
+        suffixes=Language.suffixes,
+    )
 
 
 class DrowName(types.NameGenerator):
@@ -25,13 +28,18 @@ class DrowName(types.NameGenerator):
             ),
         )
         self.language.minimum_grapheme_count = 2
-        self.place_generator = PlaceName
+        self.place_generator = _place_name()
         self.affixes = types.equal_weights(["am", "an", "al", "um"], weight=1.0, blank=False)
 
     def get_surname(self) -> str:
         name = self.place_generator.name()[0]["name"][0]
-        return (self.affixes.random() + name + random.choice(["th", "s", "r", "n"])).title()
+        return (types.choice(self.affixes) + name + types.rng().choice(["th", "s", "r", "n"])).title()
+
+    def batch_surname(self, count: int) -> list:
+        names = [name["name"][0] for name in self.place_generator.name(count)]
+        affixes = types.sample(self.affixes, count)
+        endings = types.rng().choices(["th", "s", "r", "n"], k=count)
+        return [(affix + name + ending).title() for (affix, name, ending) in zip(affixes, names, endings)]
 
 
-Name = DrowName()
-NobleName = Name
+__getattr__ = lazy(globals(), PlaceName=_place_name, Name=DrowName, NobleName=lambda: __getattr__("Name"))
@@ -1,10 +1,5 @@
-import logging
-import re
-
+from language.phonotactics import VOWELS, Bigrams, Phonotactics
 from language.rules import default_rules
-from language.types import Language
-
-logger = logging.getLogger()
 
 valid_consonant_sequences = [
     "cc",
@@ -60,29 +55,12 @@ valid_consonant_sequences = [
 ]
 
 
-def valid_sequences(language: Language, word: str) -> bool:
-    found = re.compile(r"([bcdfghjklmnpqrstvwxz]{2})").findall(word)
-    if not found:
-        return True
-
-    invalid = [seq for seq in found if seq not in valid_consonant_sequences]
-    if invalid:
-        logger.debug(f"{word} contains invalid consonant sequences: {invalid}")
-        return False
-    return True
-
-
-def too_many_vowels(language: Language, word: str) -> bool:
-    found = re.compile(r"[" + "".join(language.vowels.members) + r"]{3}").findall(word)
-    if found == []:
-        return True
-    logger.debug(f"{word} has too many contiguous vowels: {found}")
-    return False
-
-
 rules = default_rules.union(
     {
-        valid_sequences,
-        too_many_vowels,
+        Phonotactics(
+            name="undercommon",
+            runs=[(VOWELS, 2)],
+            bigrams=Bigrams("bcdfghjklmnpqrstvwxz", permitted=valid_consonant_sequences),
+        ),
     }
 )
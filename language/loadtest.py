@@ -0,0 +1,361 @@
+"""
+A load generator for the name service; see language.service.
+
+Requests are drawn at random from a weighted mix, such as 70% common names,
+20% elvish noble names and 10% celestial text, and sent over a pool of
+keep-alive connections in one of two modes:
+
+    closed loop - `concurrency` clients each send a request as soon as their
+                  last one is answered, optionally paced to a total of `rate`
+                  requests per second; this measures the most the service can
+                  do.
+    open loop   - requests arrive at `rate` per second, as a Poisson process,
+                  whether or not earlier ones have been answered, over at most
+                  `concurrency` connections; this measures how the service
+                  behaves under a given load. Latency is measured from when
+                  each request was due, so time spent queueing behind slow
+                  requests is counted rather than hidden.
+
+The report holds throughput, latency percentiles and error rates, overall and
+for each kind of request, along with the versions of the package, the
+language pack and Python, so that reports saved as JSON can be compared
+across versions with compare().
+
+Usage:
+    % fanlang serve &
+    % fanlang loadtest --mix common:names:0.7,elvish:noble:0.2,celestial:text:0.1 --duration 10 --output v1.json
+    request          requests    req/s  errors      p50      p90      p99    p99.9      max
+    common:names          967     95.9   0.00%   66.5ms  254.5ms  469.3ms  568.4ms  568.4ms
+    elvish:noble          264     26.2   0.00%   60.1ms  226.7ms  278.3ms  309.1ms  309.1ms
+    celestial:text        150     14.9   0.00%  238.8ms  406.7ms  549.7ms  553.6ms  553.6ms
+    total                1381    136.9   0.00%   81.2ms  273.1ms  469.3ms  566.4ms  568.4ms
+
+This was measured with the service and the load generator sharing a single
+CPU. Celestial text is much slower to generate than names, and holds up the
+requests queued behind it.
+"""
+import asyncio
+import json
+import math
+import platform
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Union
+
+# The default request mix, as language:kind:weight.
+MIX = "common:names:0.7,elvish:noble:0.2,celestial:text:0.1"
+
+KINDS = ("names", "noble", "text")
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+_PERCENTILE_KEYS = tuple(f"p{percent:g}" for percent in PERCENTILES)
+
+
+class Request:
+    """
+    One kind of request in a mix.
+
+    Attributes:
+        label  - the request as language:kind, such as "elvish:noble"
+        target - the path and query to GET
+        weight - the relative frequency of the request in the mix
+    """
+
+    def __init__(self, language: str, kind: str, weight: float = 1.0, count: int = 1, words: int = 25):
+        if kind not in KINDS:
+            raise ValueError(f"Unsupported kind of request {kind}; use one of {', '.join(KINDS)}.")
+        self.label = f"{language}:{kind}"
+        self.weight = weight
+        if kind == "text":
+            self.target = f"/text?language={language}&words={words}"
+        else:
+            self.target = f"/names?language={language}&count={count}" + ("&noble=1" if kind == "noble" else "")
+
+
+def parse_mix(mix: str, count: int = 1, words: int = 25) -> list:
+    """
+    Returns the Requests of a mix given as comma-separated language:kind:weight
+    entries, such as "common:names:0.7,celestial:text:0.3". The kind defaults to
+    names and the weight to 1.
+    """
+    requests = []
+    for entry in mix.split(","):
+        language, kind, weight = (entry.strip().split(":") + ["", ""])[:3]
+        try:
+            requests.append(Request(language, kind or "names", float(weight or 1), count=count, words=words))
+        except ValueError as e:
+            raise ValueError(f"Invalid request {entry!r} in mix: {e}")
+    if sum(request.weight for request in requests) <= 0:
+        raise ValueError("The weights of the mix must add up to more than zero.")
+    return requests
+
+
+class Client:
+    """
+    Sends GET requests over a pool of at most `size` keep-alive connections,
+    to a TCP port or, if `path` is given, a Unix socket.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8089, path: str = "", size: int = 16):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.slots = asyncio.Semaphore(size)
+        self.idle = []
+
+    async def connect(self) -> tuple:
+        if self.path:
+            return await asyncio.open_unix_connection(self.path)
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def get(self, target: str) -> int:
+        """
+        Returns the status of the response to a GET of `target`.
+        """
+        async with self.slots:
+            reader, writer = self.idle.pop() if self.idle else await self.connect()
+            try:
+                writer.write(f"GET {target} HTTP/1.1\r\nHost: {self.host}\r\n\r\n".encode("latin-1"))
+                await writer.drain()
+                status = int((await reader.readuntil(b"\r\n")).split()[1])
+                length = 0
+                while True:
+                    line = await reader.readuntil(b"\r\n")
+                    if line == b"\r\n":
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+            except BaseException:
+                writer.close()
+                raise
+            self.idle.append((reader, writer))
+            return status
+
+    def close(self):
+        for reader, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+
+async def _send(client: Client, request: Request, due: float, results: list):
+    try:
+        status = await client.get(request.target)
+        outcome = "ok" if status == 200 else f"HTTP {status}"
+    except (OSError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+        outcome = e.__class__.__name__
+    results.append((request.label, time.perf_counter() - due, outcome))
+
+
+async def closed_loop(
+    client: Client, requests: list, duration: float, concurrency: int, rate: float, rng: random.Random
+) -> list:
+    """
+    Returns (label, latency, outcome) for every request sent by `concurrency`
+    clients sending back to back, or each paced at rate / concurrency requests
+    per second, for `duration` seconds.
+    """
+    results = []
+    weights = [request.weight for request in requests]
+    end = time.perf_counter() + duration
+
+    async def worker():
+        due = time.perf_counter()
+        while due < end:
+            await _send(client, rng.choices(requests, weights)[0], time.perf_counter(), results)
+            due = due + concurrency / rate if rate else time.perf_counter()
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results
+
+
+async def open_loop(client: Client, requests: list, duration: float, rate: float, rng: random.Random) -> list:
+    """
+    Returns (label, latency, outcome) for every request of a Poisson process
+    of `rate` requests per second lasting `duration` seconds. Latency is
+    measured from when each request was due.
+    """
+    if rate <= 0:
+        raise ValueError("An open-loop test needs a rate.")
+    results = []
+    weights = [request.weight for request in requests]
+    tasks = set()
+    due = time.perf_counter()
+    end = due + duration
+    while due < end:
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        task = asyncio.create_task(_send(client, rng.choices(requests, weights)[0], due, results))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        due += rng.expovariate(rate)
+    if tasks:
+        await asyncio.gather(*tasks)
+    return results
+
+
+def percentile(latencies: list, percent: float) -> float:
+    """
+    Returns the nearest-rank percentile of a sorted list of latencies.
+    """
+    return latencies[max(0, min(len(latencies), math.ceil(percent * len(latencies) / 100)) - 1)]
+
+
+def summarize(results: list, elapsed: float) -> dict:
+    """
+    Returns the throughput, error rate and latency percentiles, in milliseconds, of (label, latency, outcome) results.
+    """
+    latencies = sorted(latency for (label, latency, outcome) in results)
+    errors = Counter(outcome for (label, latency, outcome) in results if outcome != "ok")
+    summary = dict(
+        requests=len(results),
+        throughput=len(results) / elapsed if elapsed else 0.0,
+        errors=sum(errors.values()),
+        error_rate=sum(errors.values()) / len(results) if results else 0.0,
+        error_kinds=dict(errors),
+        latency_ms={},
+    )
+    if latencies:
+        summary["latency_ms"]["mean"] = 1000 * sum(latencies) / len(latencies)
+        for percent in PERCENTILES:
+            summary["latency_ms"][f"p{percent:g}"] = 1000 * percentile(latencies, percent)
+        summary["latency_ms"]["max"] = 1000 * latencies[-1]
+    return summary
+
+
+def versions() -> dict:
+    """
+    Returns the versions of everything that might change the results of a load test.
+    """
+    import language
+
+    try:
+        from importlib.metadata import version
+
+        package = version("dnd-name-generator")
+    except Exception:
+        package = "unknown"
+    return dict(
+        package=package,
+        pack=language.load_language_pack(lazy=True)[0].__name__,
+        pack_hash=language.pack_hash(),
+        python=f"{platform.python_implementation()} {platform.python_version()}",
+    )
+
+
+async def run(
+    client: Client,
+    requests: list,
+    duration: float = 10.0,
+    concurrency: int = 16,
+    rate: float = 0.0,
+    mode: str = "closed",
+    warmup: float = 1.0,
+    seed: Union[int, str, None] = None,
+    label: str = "",
+) -> dict:
+    """
+    Run a load test in "closed" or "open" loop mode, and return its report.
+    """
+    if mode not in ("closed", "open"):
+        raise ValueError(f"Unsupported mode {mode}; use closed or open.")
+    rng = random.Random(seed)
+
+    async def phase(seconds: float) -> list:
+        if mode == "open":
+            return await open_loop(client, requests, seconds, rate, rng)
+        return await closed_loop(client, requests, seconds, concurrency, rate, rng)
+
+    if warmup:
+        await phase(warmup)
+    start = time.perf_counter()
+    results = await phase(duration)
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    by_request = defaultdict(list)
+    for result in results:
+        by_request[result[0]].append(result)
+    return dict(
+        label=label,
+        time=time.time(),
+        versions=versions(),
+        config=dict(
+            mode=mode,
+            duration=duration,
+            concurrency=concurrency,
+            rate=rate,
+            warmup=warmup,
+            mix=dict((request.label, request.weight) for request in requests),
+        ),
+        total=summarize(results, elapsed),
+        requests=dict((request.label, summarize(by_request[request.label], elapsed)) for request in requests),
+    )
+
+
+def _row(label: str, summary: dict) -> str:
+    latency = summary["latency_ms"]
+    columns = [f"{latency[key]:6.1f}ms" if key in latency else f"{'-':>8s}" for key in (*_PERCENTILE_KEYS, "max")]
+    return (
+        f"{label:16s} {summary['requests']:8d} {summary['throughput']:8.1f} {summary['error_rate']:7.2%} "
+        + " ".join(columns)
+    )
+
+
+def format_report(report: dict) -> str:
+    """
+    Returns a report as a table of the results of each kind of request, and of all of them.
+    """
+    lines = [
+        f"{'request':16s} {'requests':>8s} {'req/s':>8s} {'errors':>7s} "
+        + " ".join(f"{key:>8s}" for key in (*_PERCENTILE_KEYS, "max"))
+    ]
+    lines += [_row(label, summary) for (label, summary) in report["requests"].items()]
+    lines.append(_row("total", report["total"]))
+    errors = report["total"]["error_kinds"]
+    if errors:
+        lines.append("errors: " + ", ".join(f"{kind} ({count})" for (kind, count) in errors.items()))
+    return "\n".join(lines)
+
+
+def compare(report: dict, baseline: dict) -> str:
+    """
+    Returns the changes in throughput, error rate and latency percentiles from
+    a baseline report to a new one, for each kind of request both include.
+    """
+    name = baseline.get("label") or baseline["versions"]["pack_hash"][:8]
+    lines = [f"Compared with {name} ({baseline['versions']['package']}, {baseline['versions']['python']}):"]
+    if baseline["config"] != report["config"]:
+        lines.append("  (warning: the tests were run with different settings)")
+    pairs = [(label, summary, baseline["requests"].get(label)) for (label, summary) in report["requests"].items()]
+    pairs.append(("total", report["total"], baseline["total"]))
+    for label, new, old in pairs:
+        if not old or not old["requests"]:
+            continue
+        changes = [f"req/s {_change(new['throughput'], old['throughput'])}"]
+        changes.append(f"errors {new['error_rate'] - old['error_rate']:+.2%}")
+        changes += [
+            f"{key} {_change(new['latency_ms'][key], old['latency_ms'][key])}"
+            for key in _PERCENTILE_KEYS
+            if key in new["latency_ms"] and key in old["latency_ms"]
+        ]
+        lines.append(f"  {label:16s} " + "  ".join(changes))
+    return "\n".join(lines)
+
+
+def _change(new: float, old: float) -> str:
+    return f"{(new - old) / old:+.1%}" if old else "n/a"
+
+
+def save(report: dict, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
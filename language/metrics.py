@@ -0,0 +1,288 @@
+"""
+Export the generation metrics of a language pack.
+
+Every Language and NameGenerator keeps a Metrics instance (see types.py)
+counting the calls made to it, the words or names it generated, the attempts
+and safe-word fallbacks spent on them, ImprobableTemplateError raised, lookups
+of the vectorized backend and a histogram of the latency of each call; each
+language's RuleOrder estimates the words rejected by each rule from the words
+it profiles. The counters are always on, and cost about a microsecond per call.
+
+This module collects them for every language module that has been loaded --
+the module's Language, the Name and NobleName generators that have been built,
+the languages those generators use, and any generators nested in them -- and
+exports them in the Prometheus text format, over a local HTTP endpoint, or as
+a JSON summary dumped periodically to a file.
+
+Usage:
+    >>> from language import metrics
+    >>> server = metrics.serve(supported_languages, port=9464)
+    % curl -s localhost:9464/metrics | grep 'fanlang_generated_total{language="elvish"'
+    fanlang_generated_total{language="elvish",component="Name",kind="names"} 1000
+    fanlang_generated_total{language="elvish",component="Name",kind="words"} 2113
+
+    >>> reporter = metrics.Reporter(supported_languages, "metrics.json", interval=10).start()
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Union
+
+from language import LazyLanguages, types
+
+logger = logging.getLogger(__name__)
+
+# The port the metrics endpoint listens on by default.
+PORT = 9464
+
+# The number of seconds between JSON dumps.
+INTERVAL = 10.0
+
+# (name, type, help, counter) for each metric exported from the Metrics counters.
+COUNTERS = (
+    ("fanlang_calls_total", "counter", "Calls to word() or name().", "calls"),
+    ("fanlang_generated_total", "counter", "Words or names generated.", "items"),
+    ("fanlang_word_attempts_total", "counter", "Candidate words checked against the rules.", "attempts"),
+    ("fanlang_improbable_template_errors_total", "counter", "Calls that raised ImprobableTemplateError.", "improbable"),
+    ("fanlang_safe_word_fallbacks_total", "counter", "Words replaced by a safe word under a budget.", "fallbacks"),
+    ("fanlang_vectorized_cache_hits_total", "counter", "Lookups of an already built NumPy backend.", "cache_hits"),
+    ("fanlang_vectorized_cache_misses_total", "counter", "Lookups that built the NumPy backend.", "cache_misses"),
+)
+
+
+def loaded(languages) -> dict:
+    """
+    Returns the language modules of a mapping of languages that have already
+    been imported, so that collecting metrics never imports a language.
+    """
+    if isinstance(languages, LazyLanguages):
+        modules = ((name, sys.modules.get(f"{languages.module_name}.{name}")) for name in languages)
+        return dict((name, module) for (name, module) in modules if module is not None)
+    return dict(languages)
+
+
+def components(languages) -> Iterator[tuple]:
+    """
+    Yields (language, component, kind, instance) for every Language and
+    NameGenerator of the loaded languages. The component is the name of the
+    module attribute the instance belongs to, such as "Name", or
+    "NobleName.place_generator" for a nested generator; the kind is "words" for
+    a Language and "names" for a NameGenerator.
+    """
+    for name, module in loaded(languages).items():
+        seen = set()
+        # Look the generators up without building them; see language.lazy().
+        pending = [(attr, vars(module).get(attr)) for attr in ("Language", "Name", "NobleName")]
+        while pending:
+            component, instance = pending.pop(0)
+            if id(instance) in seen or not isinstance(instance, (types.Language, types.NameGenerator)):
+                continue
+            seen.add(id(instance))
+            if isinstance(instance, types.Language):
+                yield name, component, "words", instance
+                continue
+            yield name, component, "names", instance
+            pending.append((component, instance.language))
+            pending += [
+                (f"{component}.{attr.lstrip('_')}", value)
+                for (attr, value) in vars(instance).items()
+                if isinstance(value, types.NameGenerator)
+            ]
+
+
+def collect(languages) -> list:
+    """
+    Returns the current totals of every component, as a list of dictionaries
+    holding the labels of the component, its Metrics totals and, for
+    languages, the rejections of each rule.
+    """
+    samples = []
+    for name, component, kind, instance in components(languages):
+        sample = dict(language=name, component=component, kind=kind, **instance.metrics.totals())
+        sample["rejections"] = instance.rule_order.rejected() if kind == "words" else {}
+        samples.append(sample)
+    return samples
+
+
+def _labels(sample: dict, **extra) -> str:
+    labels = dict(language=sample["language"], component=sample["component"], kind=sample["kind"], **extra)
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for (k, v) in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus(samples: list) -> str:
+    """
+    Returns the collected samples in the Prometheus text exposition format.
+    """
+    lines = []
+    for metric, kind, description, counter in COUNTERS:
+        lines += [f"# HELP {metric} {description}", f"# TYPE {metric} {kind}"]
+        lines += [f"{metric}{_labels(sample)} {sample[counter]}" for sample in samples]
+
+    metric = "fanlang_rule_rejections_total"
+    lines += [f"# HELP {metric} Candidate words rejected by each rule.", f"# TYPE {metric} counter"]
+    for sample in samples:
+        lines += [f"{metric}{_labels(sample, rule=rule)} {count}" for (rule, count) in sample["rejections"].items()]
+
+    metric = "fanlang_generation_seconds"
+    lines += [f"# HELP {metric} The duration of each call to word() or name().", f"# TYPE {metric} histogram"]
+    for sample in samples:
+        cumulative = 0
+        for bound, count in zip((*types.LATENCY_BUCKETS, "+Inf"), sample["latency"]):
+            cumulative += count
+            lines.append(f"{metric}_bucket{_labels(sample, le=bound)} {cumulative}")
+        lines.append(f"{metric}_sum{_labels(sample)} {sample['seconds']}")
+        lines.append(f"{metric}_count{_labels(sample)} {sample['calls']}")
+    return "\n".join(lines) + "\n"
+
+
+def percentile(latency: list, fraction: float) -> Union[float, None]:
+    """
+    Returns the upper bound of the latency histogram bucket holding the given
+    fraction of calls, or None if there were no calls, or if it lies beyond the
+    last bucket.
+    """
+    total = sum(latency)
+    if not total:
+        return None
+    cumulative = 0
+    for bound, count in zip(types.LATENCY_BUCKETS, latency):
+        cumulative += count
+        if cumulative >= fraction * total:
+            return bound
+    return None
+
+
+def summary(samples: list, previous: Union[list, None] = None, elapsed: float = 0.0) -> list:
+    """
+    Returns a JSON-friendly summary of the collected samples: their totals,
+    the ratios derived from them, and, given the samples of an earlier call
+    and the number of seconds since, the number of words or names generated
+    per second in between. Components that have never been called are left out.
+    """
+    before = dict(((s["language"], s["component"], s["kind"]), s) for s in previous or [])
+    results = []
+    for sample in samples:
+        if not sample["calls"]:
+            continue
+        last = before.get((sample["language"], sample["component"], sample["kind"]))
+        lookups = sample["cache_hits"] + sample["cache_misses"]
+        result = dict(
+            language=sample["language"],
+            component=sample["component"],
+            kind=sample["kind"],
+            calls=sample["calls"],
+            generated=sample["items"],
+            per_second=(sample["items"] - (last["items"] if last else 0)) / elapsed if elapsed else None,
+            improbable_template_errors=sample["improbable"],
+            p50_seconds=percentile(sample["latency"], 0.5),
+            p99_seconds=percentile(sample["latency"], 0.99),
+        )
+        if sample["kind"] == "words":
+            result.update(
+                attempts_per_word=sample["attempts"] / sample["items"] if sample["items"] else None,
+                fallback_rate=sample["fallbacks"] / sample["items"] if sample["items"] else None,
+                cache_hit_rate=sample["cache_hits"] / lookups if lookups else None,
+                rejections=dict((rule, count) for (rule, count) in sample["rejections"].items() if count),
+            )
+        results.append(result)
+    return results
+
+
+class Reporter:
+    """
+    Dumps a JSON summary of the metrics to a file every `interval` seconds,
+    from a background thread, and once more when stopped.
+
+    Each dump replaces the file in one step, so readers never see a partial
+    dump; a path of "-" writes each dump to stderr, one per line, instead.
+    """
+
+    def __init__(self, languages, path: Union[str, Path], interval: float = INTERVAL):
+        self.languages = languages
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._previous = None
+        self._last = time.monotonic()
+
+    def dump(self):
+        """
+        Write a summary of the metrics since the last dump.
+        """
+        now = time.monotonic()
+        samples = collect(self.languages)
+        report = dict(
+            time=time.time(),
+            interval=now - self._last,
+            components=summary(samples, self._previous, now - self._last),
+        )
+        self._previous, self._last = samples, now
+        if str(self.path) == "-":
+            print(json.dumps(report), file=sys.stderr, flush=True)
+            return
+        path = Path(self.path)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}")
+        temporary.write_text(json.dumps(report, indent=2) + "\n")
+        os.replace(temporary, path)
+
+    def start(self) -> "Reporter":
+        self._thread = threading.Thread(target=self._run, name="fanlang-metrics", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.dump()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.dump()
+            except OSError as e:
+                logger.error(f"Could not write metrics to {self.path}: {e}")
+
+
+def serve(languages, host: str = "127.0.0.1", port: int = PORT) -> ThreadingHTTPServer:
+    """
+    Serve the metrics from a background thread: in the Prometheus text format
+    at /metrics, and as a JSON summary at /metrics.json. Returns the server;
+    call its shutdown() method to stop it.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = prometheus(collect(languages)), "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body, content_type = json.dumps(summary(collect(languages))), "application/json"
+            else:
+                self.send_error(404)
+                return
+            body = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fanlang-metrics-server", daemon=True).start()
+    logger.info(f"Serving metrics at http://{host}:{server.server_port}/metrics")
+    return server
@@ -0,0 +1,391 @@
+"""
+Languages trained from a corpus of existing names.
+
+Rather than describing a language's graphemes and syllables by hand, an
+NgramLanguage learns which characters follow which from a corpus of names --
+say, the place names of an existing setting -- and generates new words that
+mimic them. Words are sampled one character at a time from the distribution
+of characters that followed the previous `order - 1` characters in the
+corpus.
+
+Training streams the corpus and only keeps counts of distinct n-grams, so
+memory is bounded by the size of the alphabet rather than the size of the
+corpus. The counts are then compiled into flat arrays: for every context, the
+characters that may follow it, an alias table for choosing one of them in
+constant time, and the index of the context that follows. Sampling a word is
+therefore O(word length).
+
+Usage:
+    >>> trainer = NgramTrainer(order=3)
+    >>> trainer.update(open("names.txt"))
+    >>> model = trainer.model()
+    >>> model.save("names.ngram")
+    >>> Language = NgramLanguage(name="names", model=NgramModel.load("names.ngram"))
+    >>> Language.word(3)
+    ['aldric', 'brenna', 'corwin']
+
+The `fanlang train` command trains a model and writes a language module
+around it, which can be used in a language pack like any other language.
+"""
+import json
+import struct
+import sys
+import unicodedata
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Iterable, Union
+
+from language import types
+
+# Markers for the start and end of a word; these never appear in names.
+START = "\x02"
+END = "\x03"
+
+MAGIC = b"FNGM"
+VERSION = 1
+
+# Characters whose base letter is one of these are treated as vowels.
+VOWEL_LETTERS = "aeiouy"
+
+# No context index follows the end of a word.
+NO_CONTEXT = 0xFFFFFFFF
+
+
+class NgramTrainer:
+    """
+    Counts the n-grams in a stream of names.
+    """
+
+    def __init__(self, order: int = 3):
+        if order < 2:
+            raise types.LanguageError("The n-gram order must be at least 2.")
+        self.order = order
+        self.counts = Counter()
+        self.names = 0
+
+    def update(self, lines: Iterable[str]):
+        """
+        Count the n-grams in each word of each line.
+        """
+        order = self.order
+        pad = START * (order - 1)
+        for line in lines:
+            for word in line.lower().split():
+                text = pad + word + END
+                self.counts.update([text[i : i + order] for i in range(len(text) - order + 1)])
+                self.names += 1
+
+    def model(self) -> "NgramModel":
+        """
+        Compile the counts into an NgramModel.
+        """
+        successors = defaultdict(dict)
+        for ngram, count in self.counts.items():
+            successors[ngram[:-1]][ngram[-1]] = count
+        return NgramModel.build(self.order, successors)
+
+
+def _alias_table(weights: list) -> tuple:
+    """
+    Build the alias table for Vose's alias method, which chooses an index with
+    probability proportional to its weight in constant time.
+    """
+    count = len(weights)
+    total = sum(weights)
+    scaled = [weight * count / total for weight in weights]
+    probability = [1.0] * count
+    alias = list(range(count))
+    small = [i for (i, p) in enumerate(scaled) if p < 1.0]
+    large = [i for (i, p) in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] = scaled[more] + scaled[less] - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+    return probability, alias
+
+
+class NgramModel:
+    """
+    Character transition tables compiled from n-gram counts.
+
+    Each context (a string of order - 1 characters) has a contiguous range of
+    entries in the flat arrays, starting at offsets[context]:
+
+        symbols     - the characters which may follow the context
+        probability - alias table probabilities for choosing among them
+        alias       - alias table alternatives
+        following   - the index of the context after each character
+    """
+
+    def __init__(
+        self,
+        order: int,
+        contexts: list,
+        offsets: array,
+        symbols: str,
+        probability: array,
+        alias: array,
+        following: array,
+        frequencies: dict,
+    ):
+        self.order = order
+        self.contexts = contexts
+        self.offsets = offsets
+        self.symbols = symbols
+        self.probability = probability
+        self.alias = alias
+        self.following = following
+        self.frequencies = frequencies
+        self.start = contexts.index(START * (order - 1))
+
+    @classmethod
+    def build(cls, order: int, successors: dict) -> "NgramModel":
+        contexts = sorted(successors)
+        index = dict((context, i) for (i, context) in enumerate(contexts))
+        offsets = array("I", [0])
+        symbols = []
+        probability = array("d")
+        alias = array("I")
+        following = array("I")
+        frequencies = Counter()
+        for context in contexts:
+            characters = sorted(successors[context])
+            weights = [successors[context][character] for character in characters]
+            p, a = _alias_table(weights)
+            probability.extend(p)
+            alias.extend(a)
+            for character, weight in zip(characters, weights):
+                symbols.append(character)
+                following.append(NO_CONTEXT if character == END else index[(context + character)[1:]])
+                if character != END:
+                    frequencies[character] += weight
+            offsets.append(len(symbols))
+        return cls(order, contexts, offsets, "".join(symbols), probability, alias, following, dict(frequencies))
+
+    def sample(self, max_length: int = 32) -> str:
+        """
+        Returns a random word, or an empty string if the word grew longer than max_length.
+        """
+        offsets, probability, alias, following, symbols = (
+            self.offsets,
+            self.probability,
+            self.alias,
+            self.following,
+            self.symbols,
+        )
+        draw = types.rng().random
+        context = self.start
+        word = []
+        while True:
+            start = offsets[context]
+            count = offsets[context + 1] - start
+            i = int(draw() * count)
+            if draw() >= probability[start + i]:
+                i = alias[start + i]
+            character = symbols[start + i]
+            if character == END:
+                return "".join(word)
+            if len(word) == max_length:
+                return ""
+            word.append(character)
+            context = following[start + i]
+
+    def save(self, path: Union[str, Path]):
+        """
+        Write the model to a snapshot file.
+        """
+        header = json.dumps(
+            {
+                "order": self.order,
+                "contexts": self.contexts,
+                "symbols": self.symbols,
+                "frequencies": self.frequencies,
+                "byteorder": sys.byteorder,
+            }
+        ).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(MAGIC + struct.pack("<II", VERSION, len(header)))
+            f.write(header)
+            for table in (self.offsets, self.probability, self.alias, self.following):
+                f.write(struct.pack("<Q", len(table)))
+                table.tofile(f)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "NgramModel":
+        """
+        Read a model from a snapshot file.
+        """
+        with open(path, "rb") as f:
+            if f.read(4) != MAGIC:
+                raise types.LanguageError(f"{path} is not an n-gram model snapshot.")
+            version, length = struct.unpack("<II", f.read(8))
+            if version != VERSION:
+                raise types.LanguageError(f"{path} has unsupported snapshot version {version}.")
+            header = json.loads(f.read(length).decode("utf-8"))
+            tables = []
+            for typecode in ("I", "d", "I", "I"):
+                (count,) = struct.unpack("<Q", f.read(8))
+                table = array(typecode)
+                table.fromfile(f, count)
+                if header["byteorder"] != sys.byteorder:
+                    table.byteswap()
+                tables.append(table)
+        offsets, probability, alias, following = tables
+        return cls(
+            header["order"],
+            header["contexts"],
+            offsets,
+            header["symbols"],
+            probability,
+            alias,
+            following,
+            header["frequencies"],
+        )
+
+
+def _is_vowel(character: str) -> bool:
+    return unicodedata.normalize("NFD", character)[0] in VOWEL_LETTERS
+
+
+class NgramLanguage(types.Language):
+    """
+    A Language whose words are sampled from an NgramModel.
+
+    The vowels and consonants of the language are, by default, the characters
+    of the corpus, weighted by their frequency, so rules which refer to them
+    (such as must_have_a_vowel) work as they do for any other language. Words
+    are validated against the language's rules, and prefixes and suffixes are
+    added, exactly as they are for other languages.
+
+    Words are always sampled from the model: vowels, consonants and syllables
+    may be replaced, as by a NameGenerator or a dialect, but only change what
+    the rules and grapheme handlers see.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: NgramModel,
+        prefixes: types.WeightedSet = None,
+        suffixes: types.WeightedSet = None,
+        rules: set = set(),
+        max_length: int = 32,
+        vowels: types.WeightedSet = None,
+        consonants: types.WeightedSet = None,
+        syllables: types.SyllableSet = None,
+        minimum_grapheme_count: int = 1,
+    ):
+        self.model = model
+        self.max_length = max_length
+        frequencies = sorted(model.frequencies.items())
+        if vowels is None:
+            vowels = types.WeightedSet(*[(c, n) for (c, n) in frequencies if _is_vowel(c)])
+        if consonants is None:
+            consonants = types.WeightedSet(*[(c, n) for (c, n) in frequencies if not _is_vowel(c)])
+        super().__init__(
+            name=name,
+            vowels=vowels,
+            consonants=consonants,
+            prefixes=prefixes,
+            suffixes=suffixes,
+            syllables=syllables or types.SyllableSet((types.Syllable(template="vowel"), 1.0)),
+            rules=rules,
+            minimum_grapheme_count=minimum_grapheme_count,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs) -> "NgramLanguage":
+        """
+        Create a language from a model snapshot file.
+        """
+        return cls(model=NgramModel.load(path), **kwargs)
+
+    def candidate(self) -> str:
+        return self.model.sample(self.max_length)
+
+    def validate_syllable_set(self):
+        # Words are sampled from the model rather than built from the syllables, so there is nothing to check.
+        pass
+
+    def copy(self, **changes):
+        options = dict(
+            name=self.name,
+            model=self.model,
+            prefixes=self.prefixes,
+            suffixes=self.suffixes,
+            rules=self.rules,
+            max_length=self.max_length,
+            vowels=self.vowels,
+            consonants=self.consonants,
+            syllables=self.syllables,
+            minimum_grapheme_count=self.minimum_grapheme_count,
+        )
+        unsupported = sorted(set(changes) - set(options))
+        if unsupported:
+            raise types.LanguageError(f"Cannot change {', '.join(unsupported)} of the n-gram language {self.name}.")
+        options.update(changes)
+        return self.__class__(**options)
+
+
+MODULE_TEMPLATES = {
+    "__init__.py": '''"""
+{title}
+"""
+from language import lazy
+
+from .base import Language
+
+__all__ = ["Language", "Name", "NobleName"]
+
+# The generators are only imported and built when first used; see language.lazy().
+__getattr__ = lazy(globals(), Name=".names", NobleName=".names")
+''',
+    "base.py": """from pathlib import Path
+
+from language import ngram
+
+from .rules import rules
+
+Language = ngram.NgramLanguage.load(Path(__file__).parent / "{snapshot}", name="{name}", rules=rules)
+""",
+    "names.py": """from language import lazy, types
+
+from .base import Language
+
+
+def _name() -> types.NameGenerator:
+    return types.NameGenerator(
+        language=Language,
+        templates=types.NameSet(
+            (types.NameTemplate("name,surname"), 1.0),
+        ),
+    )
+
+
+__getattr__ = lazy(globals(), Name=_name, NobleName=lambda: __getattr__("Name"))
+""",
+    "rules.py": """# Words are sampled from the n-gram statistics of the corpus, so they already
+# follow its conventions. Add rule callables or phonotactics specifications
+# here to constrain them further.
+rules = set()
+""",
+}
+
+
+def write_module(model: NgramModel, name: str, path: Union[str, Path]) -> Path:
+    """
+    Write a language module named `name` in the directory `path`, containing
+    the model snapshot and a Language and NameGenerator built on it. Returns
+    the path of the new module.
+    """
+    module = Path(path) / name
+    module.mkdir(parents=True, exist_ok=True)
+    snapshot = f"{name}.ngram"
+    model.save(module / snapshot)
+    title = name.replace("_", " ").title()
+    for filename, template in MODULE_TEMPLATES.items():
+        (module / filename).write_text(template.format(title=title, name=name, snapshot=snapshot))
+    return module
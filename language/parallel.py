@@ -0,0 +1,161 @@
+"""
+Generate samples from many languages at once, across a pool of processes.
+
+Languages differ wildly in how long they take to generate: a handful of
+Celestial words or Elvish noble names take longer than samples of every other
+language combined. Sampling every language in turn makes the whole pack wait
+for the slowest; sampling them in parallel lets each language's results be
+shown as soon as they are ready, along with how long they took -- a quick
+side-by-side review of a language pack, and a cheap smoke benchmark of it.
+
+Usage:
+    >>> for sample in sample_all(["elvish", "gnomish"], kind="names", count=2):
+    ...     print(sample.language, f"{sample.elapsed:.3f}s", sample.values)
+    gnomish 0.001s ['Tue Nio', 'Bi Fea']
+    elvish 0.004s ['Näoa an Drufln', 'Echea an Dhood']
+"""
+import os
+import random
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, Union
+
+from language import types
+
+KINDS = ("names", "noble", "text")
+
+# The number of words in each chunk of a passage generated by text().
+CHUNK_WORDS = 10000
+
+
+class Sample:
+    """
+    The samples generated for one language.
+
+    Attributes:
+        language - the name of the language
+        kind     - "names", "noble" or "text"
+        values   - the generated names, or paragraphs of text
+        elapsed  - the time taken to generate them, in seconds, not including importing the language
+        error    - a description of the error that stopped generation, if any
+    """
+
+    def __init__(self, language: str, kind: str, values: list, elapsed: float, error: str = ""):
+        self.language = language
+        self.kind = kind
+        self.values = values
+        self.elapsed = elapsed
+        self.error = error
+
+
+def generate(pack: str, language: str, kind: str = "names", count: int = 3, words: int = 20) -> Sample:
+    """
+    Generate `count` names, noble names or paragraphs of `words` words in one language.
+    """
+    import language as fanlang
+
+    module = fanlang.load_language_pack(pack, lazy=True)[1][language]
+    start = time.perf_counter()
+    values = []
+    try:
+        while len(values) < count:
+            try:
+                if kind == "text":
+                    values.append(module.Language.text(words))
+                else:
+                    generator = module.NobleName if kind == "noble" else module.Name
+                    values += [name["fullname"] for name in generator.name(count - len(values))]
+            except types.ImprobableTemplateError:
+                continue
+    except Exception as e:
+        return Sample(language, kind, values, time.perf_counter() - start, f"{e.__class__.__name__}: {e}")
+    return Sample(language, kind, values, time.perf_counter() - start)
+
+
+def sample_all(
+    languages: list,
+    kind: str = "names",
+    count: int = 3,
+    words: int = 20,
+    pack: str = "",
+    processes: Union[int, None] = None,
+    ordered: bool = False,
+) -> Iterator[Sample]:
+    """
+    Yields a Sample for each language, generated in a pool of `processes`
+    worker processes (by default, one per CPU, up to one per language).
+
+    Samples are yielded as soon as each language finishes, or in the order of
+    `languages` if ordered is True.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unsupported kind of sample {kind}; use one of {', '.join(KINDS)}.")
+    pack = pack or os.getenv("FANLANG_LANGUAGE_PACK", "language.languages")
+    processes = processes or min(os.cpu_count() or 1, len(languages))
+    if processes == 1:
+        for language in languages:
+            yield generate(pack, language, kind, count, words)
+        return
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(generate, pack, language, kind, count, words) for language in languages]
+        for future in futures if ordered else as_completed(futures):
+            yield future.result()
+
+
+def text_chunk(
+    pack: str, language: str, seed: Union[int, str], index: int, start: int, size: int, phrases: list
+) -> str:
+    """
+    Returns the `index`-th chunk of a passage generated by text(): `size`
+    words starting with the `start`-th word of the passage, stitched with the
+    phrases of the passage's plan that it overlaps.
+    """
+    import language as fanlang
+
+    module = fanlang.load_language_pack(pack, lazy=True)[1][language]
+    # Any one of thousands of words may run out of attempts, so replace those with safe words rather than fail.
+    with types.seeded(types.derive_seed(seed, index)), types.budget():
+        words = module.Language.word(size)
+    return types.stitch(words, phrases, offset=start)
+
+
+def text(
+    language: str,
+    count: int,
+    seed: Union[int, str],
+    pack: str = "",
+    processes: Union[int, None] = None,
+) -> Iterator[str]:
+    """
+    Yields the pieces of a passage of `count` words, generated in chunks of
+    CHUNK_WORDS words across a pool of `processes` worker processes (by
+    default, one per CPU).
+
+    The words of each chunk are drawn from a seed derived from `seed` and the
+    chunk's index, and the phrases and punctuation of the whole passage are
+    planned up front from a seed of their own (see types.text_plan()), so the
+    passage is the same however many processes generate it. Pieces are
+    yielded in order as soon as they are ready.
+
+    Usage:
+        >>> passage = "".join(text("elvish", 1000000, seed=1234))
+    """
+    pack = pack or os.getenv("FANLANG_LANGUAGE_PACK", "language.languages")
+    phrases, end = types.text_plan(count, random.Random(types.derive_seed(seed, -1)))
+    chunks = []
+    for index, start in enumerate(range(0, count, CHUNK_WORDS)):
+        size = min(CHUNK_WORDS, count - start)
+        # The phrase the chunk starts in, and every phrase starting within it.
+        first = bisect_left(phrases, (start + 1,)) - 1
+        last = bisect_left(phrases, (start + size,))
+        chunks.append((pack, language, seed, index, start, size, phrases[first:last]))
+
+    processes = processes or min(os.cpu_count() or 1, len(chunks))
+    if processes <= 1:
+        for chunk in chunks:
+            yield text_chunk(*chunk)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            yield from executor.map(text_chunk, *zip(*chunks))
+    yield end
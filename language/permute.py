@@ -0,0 +1,499 @@
+"""
+Walk every possible word or name exactly once, in a random order.
+
+Some name spaces are small enough to exhaust: Lizardfolk names are a family
+and two scents, Gnomish names two short words, Orcish surnames a consonant and
+a suffix. Drawing names at random from such a space repeats names long before
+it runs out of new ones; a Permutation instead visits every name exactly once,
+in an order that looks random, and remembers nothing about the names it has
+already produced.
+
+Every word or name the generator could produce is given an index:
+
+    Values         a finite list of values, such as the members of a WeightedSet
+    Concatenation  one value from each of several spaces, concatenated
+    Alternatives   a value from any one of several spaces
+    Mapped         the values of another space, transformed
+
+A word is a Concatenation of a prefix, a body and a suffix, where the body is
+an Alternatives over the language's syllable templates of Concatenations of
+graphemes; a name is a choice of name template and a value for each of its
+parts. The indexes are shuffled with a keyed Feistel network, a
+format-preserving permutation of any range of integers; indexes of values
+that fail the language's rules, or that spell a word or name already spelled
+by a smaller index, are skipped.
+
+Generators describe the values of each part of a name with space_ methods,
+alongside their get_ and batch_ methods. A part whose get_ method has been
+overridden without also overriding its space_ method can't be enumerated.
+
+Usage:
+    >>> space = lizardfolk.Name.space()
+    >>> len(space)
+    98000
+    >>> for name in space.permute(seed=1234):
+    ...     print(name["fullname"])
+    Roasted Grapefruit Grape
+    Burnt Isovaleric Medicine
+    ...
+"""
+from hashlib import blake2b
+from itertools import combinations
+from typing import Callable, Iterator, Union
+
+from language import types
+
+# The number of rounds of the Feistel network.
+ROUNDS = 6
+
+# Spaces with more candidates than this are too large to count the valid values of.
+MAXIMUM_SCAN = 10000000
+
+
+class Space:
+    """
+    A finite set of candidate values, each with an index in range(size).
+
+    Not every index holds a value: value() returns None for a candidate that
+    is invalid, or that duplicates a value with a smaller index.
+    """
+
+    size = 0
+
+    def value(self, index: int) -> Union[str, None]:
+        raise NotImplementedError()
+
+    def index(self, value: str) -> Union[int, None]:
+        """
+        Returns the smallest index of a value, or None if the space doesn't contain it.
+        """
+        raise NotImplementedError(f"Values of {self.__class__.__name__} can't be looked up.")
+
+    def matches(self, text: str, start: int) -> Iterator[tuple]:
+        """
+        Yields (end, index) for every value that text[start:end] spells.
+        """
+        for end in range(start, len(text) + 1):
+            index = self.index(text[start:end])
+            if index is not None:
+                yield end, index
+
+    def count(self) -> int:
+        """
+        Returns the number of values in the space, by checking every candidate.
+        """
+        if not hasattr(self, "_count"):
+            if self.size > MAXIMUM_SCAN:
+                raise types.LanguageError(f"{self.size} candidates are too many to count.")
+            self._count = sum(1 for index in range(self.size) if self.value(index) is not None)
+        return self._count
+
+    def nonblank(self) -> int:
+        """
+        Returns the number of values that aren't blank.
+        """
+        return self.count()
+
+    def blank(self) -> Union[int, None]:
+        """
+        Returns the index of the blank value, or None if the space has no blank value.
+        """
+        return None
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self.size):
+            value = self.value(index)
+            if value is not None:
+                yield value
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+class Values(Space):
+    """
+    A finite list of values, with duplicates removed.
+    """
+
+    def __init__(self, members, transform: Union[Callable, None] = None):
+        self.values = []
+        self.indexes = {}
+        for member in members:
+            value = transform(member) if transform else member
+            if value not in self.indexes:
+                self.indexes[value] = len(self.values)
+                self.values.append(value)
+        self.size = len(self.values)
+        self.lengths = sorted({len(value) for value in self.values})
+
+    def value(self, index: int) -> str:
+        return self.values[index]
+
+    def index(self, value: str) -> Union[int, None]:
+        return self.indexes.get(value)
+
+    def matches(self, text: str, start: int) -> Iterator[tuple]:
+        for length in self.lengths:
+            index = self.indexes.get(text[start : start + length])
+            if index is not None:
+                yield start + length, index
+
+    def count(self) -> int:
+        return self.size
+
+    def nonblank(self) -> int:
+        return sum(1 for value in self.values if value.strip())
+
+    def blank(self) -> Union[int, None]:
+        for index, value in enumerate(self.values):
+            if not value.strip():
+                return index
+        return None
+
+
+class Concatenation(Space):
+    """
+    The concatenation of one value from each of several spaces, optionally
+    checked by a callable that returns True if the concatenation is valid.
+    """
+
+    def __init__(self, *spaces: Space, valid: Union[Callable, None] = None):
+        self.spaces = spaces
+        self.valid = valid
+        self.size = 1
+        for space in spaces:
+            self.size *= space.size
+
+    def _components(self, index: int) -> list:
+        components = []
+        for space in reversed(self.spaces):
+            index, component = divmod(index, space.size)
+            components.append(component)
+        return components[::-1]
+
+    def _index(self, components: list) -> int:
+        index = 0
+        for space, component in zip(self.spaces, components):
+            index = index * space.size + component
+        return index
+
+    def _parses(self, text: str, slot: int, start: int) -> Iterator[list]:
+        if slot == len(self.spaces):
+            if start == len(text):
+                yield []
+            return
+        if slot == len(self.spaces) - 1:
+            # The last value must be the rest of the text.
+            index = self.spaces[slot].index(text[start:])
+            if index is not None:
+                yield [index]
+            return
+        for end, index in self.spaces[slot].matches(text, start):
+            for rest in self._parses(text, slot + 1, end):
+                yield [index] + rest
+
+    def value(self, index: int) -> Union[str, None]:
+        values = []
+        for space, component in zip(self.spaces, self._components(index)):
+            value = space.value(component)
+            if value is None:
+                return None
+            values.append(value)
+        text = "".join(values)
+        # The same text may be spelled by more than one combination of values; only the first counts.
+        if self.index(text) != index:
+            return None
+        return text
+
+    def index(self, value: str) -> Union[int, None]:
+        if self.valid and not self.valid(value):
+            return None
+        return min((self._index(components) for components in self._parses(value, 0, 0)), default=None)
+
+
+class Alternatives(Space):
+    """
+    A value from any one of several spaces. A value in more than one of them
+    belongs to the first.
+    """
+
+    def __init__(self, *spaces: Space):
+        self.spaces = spaces
+        self.size = sum(space.size for space in spaces)
+
+    def value(self, index: int) -> Union[str, None]:
+        for position, space in enumerate(self.spaces):
+            if index < space.size:
+                value = space.value(index)
+                if value is None or any(earlier.index(value) is not None for earlier in self.spaces[:position]):
+                    return None
+                return value
+            index -= space.size
+        raise IndexError(index)
+
+    def index(self, value: str) -> Union[int, None]:
+        offset = 0
+        for space in self.spaces:
+            index = space.index(value)
+            if index is not None:
+                return offset + index
+            offset += space.size
+        return None
+
+
+class Mapped(Space):
+    """
+    The values of another space, transformed by a callable that never maps two values to the same one.
+    """
+
+    def __init__(self, space: Space, transform: Callable):
+        self.space = space
+        self.transform = transform
+        self.size = space.size
+
+    def value(self, index: int) -> Union[str, None]:
+        value = self.space.value(index)
+        return None if value is None else self.transform(value)
+
+    def count(self) -> int:
+        return self.space.count()
+
+
+def word_space(language: types.Language) -> Space:
+    """
+    Returns the space of every word the language can generate.
+    """
+    cls = language.__class__
+    for method in ("word", "candidate"):
+        if types._defined_by(cls, method) is not types.Language:
+            raise types.LanguageError(f"{language.name} overrides {method}(), so its words can't be enumerated.")
+
+    graphemes = {}
+
+    def grapheme(template: str) -> Space:
+        if template not in graphemes:
+            handler = f"space_grapheme_{template}"
+            if not issubclass(_defined_by(cls, handler), _defined_by(cls, f"get_grapheme_{template}") or object):
+                raise types.LanguageError(
+                    f"{language.name} has a custom get_grapheme_{template}() without a {handler}(), "
+                    "so its words can't be enumerated."
+                )
+            graphemes[template] = getattr(language, handler)()
+        return graphemes[template]
+
+    shapes = []
+    for member in language.syllables.members:
+        alternatives = [[""]]
+        for syllable in member.template.split(","):
+            alternatives = [shape + [t.lower()] for shape in alternatives for t in syllable.split("|")]
+        for shape in alternatives:
+            shape = tuple(shape[1:])
+            if shape not in shapes and language.validate_graphemes(shape):
+                shapes.append(shape)
+
+    body = Alternatives(*[Concatenation(*[grapheme(t) for t in shape], valid=language.validate) for shape in shapes])
+    if not (language.prefixes or language.suffixes):
+        return body
+    return Concatenation(
+        grapheme("prefix") if language.prefixes else Values([""]),
+        body,
+        grapheme("suffix") if language.suffixes else Values([""]),
+    )
+
+
+def _defined_by(cls: type, attribute: str) -> type:
+    return types._defined_by(cls, attribute) or object
+
+
+class NameSpace:
+    """
+    The space of every name a NameGenerator can generate: a choice of name
+    template, and a value for each of its parts.
+
+    Two choices make the same name if their parts that aren't blank are the
+    same; only the choice with the smallest index counts.
+    """
+
+    def __init__(self, generator: types.NameGenerator):
+        self.generator = generator
+        self.templates = []
+        for member in generator.templates.members:
+            template = tuple(part.lower() for part in member.template.split(","))
+            if template not in self.templates:
+                self.templates.append(template)
+        self.parts = dict((part, self._part(part)) for template in self.templates for part in template)
+        self.sizes = []
+        for template in self.templates:
+            size = 1
+            for part in template:
+                size *= self.parts[part].size
+            self.sizes.append(size)
+        self.size = sum(self.sizes)
+
+    def _part(self, part: str) -> Space:
+        cls = self.generator.__class__
+        handler = f"space_{part}"
+        if not issubclass(_defined_by(cls, handler), _defined_by(cls, f"get_{part}")):
+            raise types.LanguageError(
+                f"{cls.__name__} has a custom get_{part}() without a {handler}(), so its names can't be enumerated."
+            )
+        return getattr(self.generator, handler)()
+
+    def _locate(self, index: int) -> tuple:
+        for position, size in enumerate(self.sizes):
+            if index < size:
+                return position, index
+            index -= size
+        raise IndexError(index)
+
+    def value(self, index: int) -> Union[types.Name, None]:
+        """
+        Returns the name with the given index, or None if the index is skipped.
+        """
+        position, local = self._locate(index)
+        template = self.templates[position]
+        components = []
+        for part in reversed(template):
+            local, component = divmod(local, self.parts[part].size)
+            components.append(component)
+        components.reverse()
+
+        name = types.Name(list)
+        fullname = []
+        filled = []
+        for part, component in zip(template, components):
+            value = self.parts[part].value(component)
+            if value is None:
+                return None
+            value = value.strip()
+            if not value:
+                continue
+            name[part].append(value)
+            fullname.append(value)
+            filled.append((part, component))
+        if self.index(filled) != index:
+            return None
+        name["fullname"] = " ".join(fullname)
+        return name
+
+    def index(self, filled: list) -> Union[int, None]:
+        """
+        Returns the smallest index of the name made of the (part, index) pairs
+        in `filled`, with every other part of its template left blank.
+        """
+        offset = 0
+        for template, size in zip(self.templates, self.sizes):
+            indexes = [self._embed(template, filled, slots) for slots in self._slots(template, filled)]
+            indexes = [index for index in indexes if index is not None]
+            if indexes:
+                return offset + min(indexes)
+            offset += size
+        return None
+
+    def _slots(self, template: tuple, filled: list) -> Iterator[tuple]:
+        parts = [part for (part, component) in filled]
+        for slots in combinations(range(len(template)), len(filled)):
+            if [template[slot] for slot in slots] == parts:
+                yield slots
+
+    def _embed(self, template: tuple, filled: list, slots: tuple) -> Union[int, None]:
+        components = dict(zip(slots, (component for (part, component) in filled)))
+        index = 0
+        for slot, part in enumerate(template):
+            space = self.parts[part]
+            component = components.get(slot)
+            if component is None:
+                component = space.blank()
+                if component is None:
+                    return None
+            index = index * space.size + component
+        return index
+
+    def shapes(self) -> set:
+        """
+        Returns every distinct sequence of parts that aren't blank.
+        """
+        shapes = set()
+        for template in self.templates:
+            optional = [slot for (slot, part) in enumerate(template) if self.parts[part].blank() is not None]
+            for count in range(len(optional) + 1):
+                for blanks in combinations(optional, count):
+                    shapes.add(tuple(part for (slot, part) in enumerate(template) if slot not in blanks))
+        return shapes
+
+    def __len__(self) -> int:
+        """
+        Returns the number of distinct names.
+        """
+        total = 0
+        for shape in self.shapes():
+            count = 1
+            for part in shape:
+                count *= self.parts[part].nonblank()
+            total += count
+        return total
+
+    def __iter__(self) -> Iterator[types.Name]:
+        for index in range(self.size):
+            name = self.value(index)
+            if name is not None:
+                yield name
+
+    def permute(self, seed: Union[int, str, None] = None) -> Iterator[types.Name]:
+        """
+        Yields every name exactly once, in an order shuffled by `seed`.
+        """
+        for index in Permutation(self.size, seed):
+            name = self.value(index)
+            if name is not None:
+                yield name
+
+
+class Permutation:
+    """
+    A pseudo-random permutation of range(size), keyed by a seed.
+
+    Indexes are shuffled by a balanced Feistel network over the smallest even
+    number of bits that covers the range; results outside the range are fed
+    back through the network until they land in it ("cycle walking"). Any
+    element of the permutation can be computed in constant time and memory.
+
+    Usage:
+        >>> [*Permutation(10, seed=1234)]
+        [2, 6, 1, 8, 7, 9, 0, 3, 5, 4]
+    """
+
+    def __init__(self, size: int, seed: Union[int, str, None] = None):
+        if seed is None:
+            seed = types.rng().getrandbits(64)
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        self.half = (bits + 1) // 2
+        self.mask = (1 << self.half) - 1
+        self.width = (self.half + 7) // 8
+        self.keys = [blake2b(f"{seed}:{r}".encode("utf-8"), digest_size=16).digest() for r in range(ROUNDS)]
+
+    def _round(self, key: bytes, value: int) -> int:
+        digest = blake2b(value.to_bytes(self.width, "big"), key=key, digest_size=min(64, self.width)).digest()
+        return int.from_bytes(digest, "big") & self.mask
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self.half, value & self.mask
+        for key in self.keys:
+            left, right = right, left ^ self._round(key, right)
+        return (left << self.half) | right
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def __iter__(self) -> Iterator[int]:
+        for index in range(self.size):
+            yield self[index]
+
+    def __len__(self) -> int:
+        return self.size
@@ -0,0 +1,386 @@
+"""
+Declarative phonotactic rules.
+
+A Phonotactics instance describes the shape of valid words -- how long runs of
+vowels and consonants may be, which clusters may begin a word, which consonant
+pairs are allowed, and which sequences are forbidden or required -- and
+compiles that description into a single deterministic finite automaton (DFA).
+Checking a word is then one linear pass over its characters, no matter how
+many constraints the specification contains.
+
+Phonotactics instances are callables with the same signature as any other
+rule, so they can be included in a Language's rules alongside (or instead of)
+hand-written rule functions.
+
+Usage:
+    >>> from language.phonotactics import Phonotactics, StartingClusters, VOWELS
+    >>> rules = {
+            Phonotactics(
+                runs=[(VOWELS, 3), ("bcdfghklmnprstvw", 2)],
+                starting_clusters=StartingClusters("bcdfghklmnpqrstvwxz", permitted=["ch", "th"]),
+                required=VOWELS,
+                distinct=True,
+            )
+        }
+"""
+import logging
+import threading
+from typing import Union
+
+logger = logging.getLogger("phonotactics")
+
+DEAD = 0
+
+# The number of automata each Phonotactics instance keeps; the oldest is dropped to make room for another.
+AUTOMATA = 64
+
+
+class LanguageGraphemes:
+    """
+    A reference to one of the grapheme sets of the language being validated,
+    such as its vowels. Resolved each time the specification is compiled for a
+    language.
+    """
+
+    def __init__(self, attribute: str):
+        self.attribute = attribute
+
+    def members(self, language) -> list:
+        graphemes = getattr(language, self.attribute)
+        return list(graphemes.members) if graphemes else []
+
+    def __repr__(self):
+        return f"LanguageGraphemes({self.attribute!r})"
+
+
+VOWELS = LanguageGraphemes("vowels")
+
+
+def _charset(spec, language) -> frozenset:
+    if isinstance(spec, LanguageGraphemes):
+        return frozenset("".join(spec.members(language)))
+    return frozenset(spec)
+
+
+class StartingClusters:
+    """
+    Constrains the cluster at the start of a word. If the first `length`
+    characters of a word all belong to `charset`, the cluster they form must
+    be one of `permitted` (if given), and must not be one of `forbidden`.
+    """
+
+    def __init__(self, charset, length: int = 2, permitted: list = None, forbidden: list = None):
+        self.charset = charset
+        self.length = length
+        self.permitted = None if permitted is None else frozenset(permitted)
+        self.forbidden = frozenset(forbidden or [])
+
+
+class Bigrams:
+    """
+    Constrains pairs of adjacent characters from `charset` to those in
+    `permitted`. Pairs are matched from left to right without overlapping, as
+    re.findall() would match them.
+    """
+
+    def __init__(self, charset, permitted: list):
+        self.charset = charset
+        self.permitted = frozenset(permitted)
+
+
+class _Run:
+    """Rejects words containing more than `maximum` consecutive characters from `charset`."""
+
+    def __init__(self, charset: frozenset, maximum: int):
+        self.charset = charset
+        self.maximum = maximum
+
+    def start(self):
+        return 0
+
+    def step(self, state, char):
+        if char not in self.charset:
+            return 0
+        if state == self.maximum:
+            return None
+        return state + 1
+
+    def accepts(self, state) -> bool:
+        return True
+
+
+class _StartingClusters:
+    """Tracks the leading characters of a word until its starting cluster is known."""
+
+    DONE = True
+
+    def __init__(self, spec: StartingClusters, charset: frozenset):
+        self.spec = spec
+        self.charset = charset
+
+    def start(self):
+        return ""
+
+    def step(self, state, char):
+        if state is self.DONE:
+            return state
+        if char not in self.charset:
+            return self.DONE
+        cluster = state + char
+        if len(cluster) < self.spec.length:
+            return cluster
+        if cluster in self.spec.forbidden or (self.spec.permitted is not None and cluster not in self.spec.permitted):
+            return None
+        return self.DONE
+
+    def accepts(self, state) -> bool:
+        return True
+
+
+class _Bigrams:
+    """Holds the first character of a potential pair until the next character arrives."""
+
+    def __init__(self, spec: Bigrams, charset: frozenset):
+        self.spec = spec
+        self.charset = charset
+
+    def start(self):
+        return ""
+
+    def step(self, state, char):
+        if char not in self.charset:
+            return ""
+        if not state:
+            return char
+        if state + char not in self.spec.permitted:
+            return None
+        return ""
+
+    def accepts(self, state) -> bool:
+        return True
+
+
+class _Substrings:
+    """
+    Matches any of a set of substrings, tracking the longest suffix of the
+    input that is a prefix of one of them (an Aho-Corasick automaton whose
+    transitions are built on demand).
+    """
+
+    FOUND = True
+
+    def __init__(self, substrings: list, required: bool):
+        self.substrings = frozenset(substrings)
+        self.prefixes = frozenset(s[:i] for s in self.substrings for i in range(len(s) + 1))
+        self.required = required
+
+    def start(self):
+        if "" in self.substrings:
+            return self.FOUND if self.required else None
+        return ""
+
+    def step(self, state, char):
+        if state is self.FOUND:
+            return state
+        text = state + char
+        if any(text[i:] in self.substrings for i in range(len(text))):
+            return self.FOUND if self.required else None
+        while text not in self.prefixes:
+            text = text[1:]
+        return text
+
+    def accepts(self, state) -> bool:
+        return state is self.FOUND or not self.required
+
+
+class _Distinct:
+    """Rejects words longer than one character that consist of a single repeated character."""
+
+    MIXED = True
+
+    def start(self):
+        return ""
+
+    def step(self, state, char):
+        if state is self.MIXED:
+            return state
+        if not state:
+            return char
+        if state[0] != char:
+            return self.MIXED
+        return char * 2
+
+    def accepts(self, state) -> bool:
+        return state is self.MIXED or len(state) < 2
+
+
+class Automaton:
+    """
+    The product of a set of components, determinized lazily: each state is a
+    tuple of component states, and transitions are computed the first time
+    they are needed and then cached, so checking a word costs one table lookup
+    per character.
+
+    Several threads may check words at once: new states and transitions are
+    added under a lock, and a transition is only published once its target
+    state is complete, so lookups of known transitions need no lock.
+    """
+
+    def __init__(self, components: list):
+        self.components = components
+        self.ids = {}
+        self.states = [None]
+        self.accepting = [False]
+        self.delta = [{}]
+        self._lock = threading.Lock()
+        self.start = self._state(tuple(c.start() for c in components))
+
+    def _state(self, state) -> int:
+        if state is None:
+            return DEAD
+        try:
+            return self.ids[state]
+        except KeyError:
+            pass
+        self.states.append(state)
+        self.accepting.append(all(c.accepts(s) for (c, s) in zip(self.components, state)))
+        self.delta.append({})
+        self.ids[state] = len(self.states) - 1
+        return self.ids[state]
+
+    def _transition(self, state: int, char: str) -> int:
+        with self._lock:
+            # Another thread may have added the transition while this one waited for the lock.
+            target = self.delta[state].get(char)
+            if target is not None:
+                return target
+            following = []
+            for component, substate in zip(self.components, self.states[state]):
+                substate = component.step(substate, char)
+                if substate is None:
+                    following = None
+                    break
+                following.append(substate)
+            target = self._state(None if following is None else tuple(following))
+            self.delta[state][char] = target
+        return target
+
+    def accepts(self, word: str) -> bool:
+        state = self.start
+        delta = self.delta
+        for char in word:
+            try:
+                state = delta[state][char]
+            except KeyError:
+                state = self._transition(state, char)
+            if state == DEAD:
+                return False
+        return self.accepting[state]
+
+    def __len__(self):
+        return len(self.states)
+
+
+class Phonotactics:
+    """
+    A declarative rule set, compiled into a single automaton per language.
+
+    Usage:
+        >>> spec = Phonotactics(
+                runs=[("aeiou", 2), ("bcdfghjklmnpqrstvwxz", 2)],
+                bigrams=Bigrams("bcdfghjklmnpqrstvwxz", permitted=["nd", "st", "th"]),
+                forbidden=["uu"],
+                required=VOWELS,
+            )
+        >>> spec(language, "strand")
+        False
+    """
+
+    def __init__(
+        self,
+        name: str = "phonotactics",
+        runs: list = (),
+        starting_clusters: Union[StartingClusters, list, None] = None,
+        bigrams: Union[Bigrams, list, None] = None,
+        forbidden: list = (),
+        required: list = None,
+        distinct: bool = False,
+    ):
+        """
+        Args:
+            name              - friendly name for the rule set, used in debugging output
+            runs              - a list of (charset, maximum) pairs limiting runs of characters
+            starting_clusters - a StartingClusters instance, or a list of them
+            bigrams           - a Bigrams instance, or a list of them
+            forbidden         - substrings that may not appear anywhere in a word
+            required          - words must contain at least one of these substrings
+            distinct          - if True, reject words made of one repeated character
+
+        Any charset may be a string of characters or a LanguageGraphemes
+        reference such as VOWELS; `required` may also be VOWELS.
+        """
+        self.__name__ = name
+        self.runs = list(runs)
+        self.starting_clusters = _as_list(starting_clusters)
+        self.bigrams = _as_list(bigrams)
+        self.forbidden = [substring for substring in forbidden if substring]
+        self.required = required
+        self.distinct = distinct
+        self._automata = {}
+        # The grapheme sets of the language the specification refers to, such as "vowels".
+        references = [charset for (charset, maximum) in self.runs]
+        references += [spec.charset for spec in self.starting_clusters + self.bigrams] + [required]
+        self._references = tuple(sorted({r.attribute for r in references if isinstance(r, LanguageGraphemes)}))
+
+    def compile(self, language) -> Automaton:
+        """
+        Return the automaton for the given language. Automata are cached by the
+        grapheme sets the specification refers to, so languages and copies of
+        languages sharing those sets share the automaton; up to AUTOMATA of
+        them are kept.
+        """
+        graphemes = tuple(getattr(language, attribute) for attribute in self._references)
+        key = tuple(id(members) for members in graphemes)
+        try:
+            cached, automaton = self._automata[key]
+            if all(a is b for (a, b) in zip(cached, graphemes)):
+                return automaton
+        except KeyError:
+            pass
+
+        components = [_Run(_charset(charset, language), maximum) for (charset, maximum) in self.runs]
+        components += [_StartingClusters(spec, _charset(spec.charset, language)) for spec in self.starting_clusters]
+        components += [_Bigrams(spec, _charset(spec.charset, language)) for spec in self.bigrams]
+        if self.forbidden:
+            components.append(_Substrings(self.forbidden, required=False))
+        if self.required is not None:
+            required = self.required
+            if isinstance(required, LanguageGraphemes):
+                required = required.members(language)
+            components.append(_Substrings(required, required=True))
+        if self.distinct:
+            components.append(_Distinct())
+
+        automaton = Automaton(components)
+        # Each entry holds on to the grapheme sets it was built for, so only keep the most recent ones.
+        while len(self._automata) >= AUTOMATA:
+            self._automata.pop(next(iter(self._automata)), None)
+        self._automata[key] = (graphemes, automaton)
+        return automaton
+
+    def __call__(self, language, word: str) -> bool:
+        if self.compile(language).accepts(word):
+            return True
+        logger.debug(f"{word} is not permitted by {self.__name__}.")
+        return False
+
+    def __repr__(self):
+        return f"<Phonotactics {self.__name__}>"
+
+
+def _as_list(value) -> list:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
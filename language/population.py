@@ -0,0 +1,244 @@
+"""
+Generate the people of a whole settlement, in a mix of languages.
+
+People live in households, and households belong to families, which share a
+surname. Families grow by a Yule process: each new household founds a family
+of its own with probability `new_family`, and otherwise joins an existing
+family with probability proportional to the number of households it already
+has. This gives the heavy-tailed reuse of surnames seen in real towns -- a few
+very common surnames, and a long tail of rare ones. A fraction of families are
+noble, and their members' names are drawn from the language's NobleName
+generator instead of Name.
+
+The households and families are planned up front from the seed, which is
+cheap. Each family's surname is then generated once, and the people of each
+household are generated with it (see NameGenerator.family()), both in chunks
+across a pool of worker processes. Every chunk is generated from its own seed,
+so the population is the same however many processes generate it, and chunks
+are written out in order as soon as they are ready.
+
+The output is tab-separated, one column per field (see COLUMNS), with a header.
+
+Usage:
+    % fanlang population --size 100000 --mix common:0.6,dwarvish:0.2,elvish:0.1,halfling:0.1 --output city.tsv
+"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import islice
+from typing import Iterator, TextIO, Union
+
+from language import types
+
+# The relative frequency of each household size.
+HOUSEHOLD_SIZES = ((1, 0.28), (2, 0.34), (3, 0.15), (4, 0.13), (5, 0.06), (6, 0.03), (7, 0.01))
+
+# The probability that a new household founds a family, rather than joining one.
+NEW_FAMILY = 0.35
+
+# The fraction of families that are noble.
+NOBLE = 0.02
+
+# The number of surnames or people in each chunk of work.
+CHUNK_SIZE = 5000
+
+COLUMNS = ("id", "household", "family", "language", "noble", "name", "surname", "fullname")
+
+
+def parse_mix(mix: str) -> list:
+    """
+    Returns (language, weight) for each entry of a mix such as "common:0.6,elvish:0.4". Weights default to 1.
+    """
+    languages = []
+    for entry in mix.split(","):
+        language, _, weight = entry.strip().partition(":")
+        try:
+            languages.append((language, float(weight or 1)))
+        except ValueError:
+            raise ValueError(f"Invalid weight in {entry!r}.")
+    if sum(weight for (language, weight) in languages) <= 0:
+        raise ValueError("The weights of the mix must add up to more than zero.")
+    return languages
+
+
+def apportion(size: int, mix: list) -> list:
+    """
+    Returns (language, people) for each language of a mix, dividing `size` people by weight.
+    """
+    total = sum(weight for (language, weight) in mix)
+    counts = [int(size * weight / total) for (language, weight) in mix]
+    # Hand out the people lost to rounding down, largest remainders first.
+    remainders = sorted(range(len(mix)), key=lambda i: (size * mix[i][1] / total) - counts[i], reverse=True)
+    for i in remainders[: size - sum(counts)]:
+        counts[i] += 1
+    return [(language, count) for ((language, weight), count) in zip(mix, counts)]
+
+
+class Plan:
+    """
+    The households and families of the people of one language.
+
+    Attributes:
+        language   - the name of the language
+        households - (size, family) for each household, where family indexes families
+        families   - whether each family is noble
+    """
+
+    def __init__(
+        self, language: str, people: int, rng: random.Random, new_family: float = NEW_FAMILY, noble: float = NOBLE
+    ):
+        self.language = language
+        self.households = []
+        self.families = []
+        sizes, weights = zip(*HOUSEHOLD_SIZES)
+        remaining = people
+        while remaining > 0:
+            size = min(remaining, rng.choices(sizes, weights)[0])
+            if not self.households or rng.random() < new_family:
+                family = len(self.families)
+                self.families.append(rng.random() < noble)
+            else:
+                # Joining the family of a random household picks each family in proportion to its households.
+                family = self.households[rng.randrange(len(self.households))][1]
+            self.households.append((size, family))
+            remaining -= size
+
+
+@cache
+def _module(pack: str, language: str, seed: Union[int, str]):
+    import language as fanlang
+
+    module = fanlang.load_language_pack(pack, lazy=True)[1][language]
+    # Build the reserves of safe words from the same seed, in the same order, in every process, so that the
+    # population doesn't depend on which process generates which chunk.
+    with types.seeded(types.derive_seed(f"{seed}:{language}", -1)):
+        module.Name.prepare()
+        module.NobleName.prepare()
+    return module
+
+
+def _generator(pack: str, language: str, noble: bool, seed: Union[int, str]) -> types.NameGenerator:
+    module = _module(pack, language, seed)
+    return module.NobleName if noble else module.Name
+
+
+def generate_surnames(pack: str, language: str, noble: bool, seed: Union[int, str], index: int, count: int) -> list:
+    """
+    Returns the surnames of the `index`-th chunk of `count` common or noble families of a language.
+    """
+    generator = _generator(pack, language, noble, seed)
+    with types.seeded(types.derive_seed(f"{seed}:{language}:{noble}:surnames", index)), types.budget():
+        return [surname.strip() for surname in generator.add_parts("surname", count)]
+
+
+def generate_people(pack: str, language: str, seed: Union[int, str], index: int, households: list) -> list:
+    """
+    Returns (name, surname, fullname) for each person of the `index`-th chunk
+    of a language's households, given as (size, noble, surname). The surname is
+    blank for people whose names have no surname.
+    """
+    people = []
+    for size, noble, surname in households:
+        people += [(noble, surname)] * size
+    names = [None] * len(people)
+    with types.seeded(types.derive_seed(f"{seed}:{language}:people", index)), types.budget():
+        # Generate the commoners and the nobles of the chunk in one batch each.
+        for noble in (False, True):
+            indices = [i for (i, person) in enumerate(people) if person[0] == noble]
+            if indices:
+                generator = _generator(pack, language, noble, seed)
+                for i, name in zip(indices, generator.family([people[i][1] for i in indices], len(indices))):
+                    names[i] = name
+    return [
+        (" ".join(name["name"]), surname if "surname" in name else "", name["fullname"])
+        for ((noble, surname), name) in zip(people, names)
+    ]
+
+
+def _chunks(items: list, size: int = CHUNK_SIZE) -> Iterator[tuple]:
+    for index, start in enumerate(range(0, len(items), size)):
+        yield index, start, items[start : start + size]
+
+
+def generate(
+    size: int,
+    mix: list,
+    seed: Union[int, str],
+    pack: str = "",
+    processes: Union[int, None] = None,
+    new_family: float = NEW_FAMILY,
+    noble: float = NOBLE,
+) -> Iterator[tuple]:
+    """
+    Yields a row of COLUMNS for each of `size` people, divided between the
+    (language, weight) pairs of `mix`, generated in a pool of `processes`
+    worker processes (by default, one per CPU).
+    """
+    pack = pack or os.getenv("FANLANG_LANGUAGE_PACK", "language.languages")
+    rng = random.Random(types.derive_seed(seed, -1))
+    plans = [Plan(language, people, rng, new_family, noble) for (language, people) in apportion(size, mix) if people]
+
+    processes = processes or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=processes) if processes > 1 else None
+
+    def run(function, *arguments):
+        if executor is None:
+            return map(function, *arguments)
+        return executor.map(function, *arguments)
+
+    try:
+        # Generate every family's surname once, in chunks of common and of noble families.
+        jobs = []
+        for plan in plans:
+            for kind in (False, True):
+                families = [family for (family, is_noble) in enumerate(plan.families) if is_noble == kind]
+                jobs += [(plan, kind, index, chunk) for (index, start, chunk) in _chunks(families)]
+        results = []
+        if jobs:
+            arguments = [(pack, plan.language, kind, seed, index, len(chunk)) for (plan, kind, index, chunk) in jobs]
+            results = run(generate_surnames, *zip(*arguments))
+        surnames = dict((id(plan), [""] * len(plan.families)) for plan in plans)
+        for (plan, kind, index, chunk), values in zip(jobs, results):
+            for family, surname in zip(chunk, values):
+                surnames[id(plan)][family] = surname
+
+        # Then generate the people of every household, in chunks of households.
+        jobs = []
+        offset = 0
+        for plan in plans:
+            households = [
+                (size, plan.families[family], surnames[id(plan)][family]) for (size, family) in plan.households
+            ]
+            chunks = _chunks(households, CHUNK_SIZE // 3)
+            jobs += [(plan, offset, index, start, chunk) for (index, start, chunk) in chunks]
+            offset += len(plan.families)
+        results = []
+        if jobs:
+            arguments = [(pack, plan.language, seed, index, chunk) for (plan, _, index, _, chunk) in jobs]
+            results = run(generate_people, *zip(*arguments))
+
+        person = household = 0
+        for (plan, offset, index, start, chunk), people in zip(jobs, results):
+            people = iter(people)
+            for size, family in plan.households[start : start + len(chunk)]:
+                household += 1
+                for name, surname, fullname in islice(people, size):
+                    person += 1
+                    noble = int(plan.families[family])
+                    yield person, household, offset + family + 1, plan.language, noble, name, surname, fullname
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def write(rows: Iterator[tuple], f: TextIO) -> int:
+    """
+    Write rows as tab-separated values, after a header, and return the number of rows written.
+    """
+    f.write("\t".join(COLUMNS) + "\n")
+    count = 0
+    for row in rows:
+        f.write("\t".join(str(value).replace("\t", " ") for value in row) + "\n")
+        count += 1
+    return count
@@ -0,0 +1,421 @@
+"""
+Names generated by one process and served to many, through shared memory.
+
+A web tier running many worker processes would otherwise generate names in
+every one of them. Instead, a single producer process generates names into a
+ring buffer in shared memory for each language, and consumer processes pop
+names straight out of it: a pop is a few reads and writes of shared memory,
+with no locks and no round-trips to another process.
+
+Python has no atomic compare-and-swap between processes, so consumers cannot
+safely share one ring. Each ring is instead divided into lanes, one for each
+consumer, and every lane has a single producer and a single consumer:
+
+    - the producer only writes the lane's head and its empty slots;
+    - the consumer only writes the lane's tail;
+    - each slot carries a sequence number, written before and after its
+      contents like a seqlock, so a consumer never accepts a slot that is
+      only partly written.
+
+A consumer claims a free lane when it attaches, and releases it when it
+closes. The segment also holds counters for monitoring: how many names each
+lane holds, how many have been produced and consumed, and the rate at which
+the producer refills the lanes.
+
+Usage:
+    # In the producer process:
+    >>> producer = Producer({"elvish": elvish.Name}, lanes=8)
+    >>> producer.run()
+
+    # In each worker process:
+    >>> with Consumer("elvish") as names:
+    ...     names.pop()["fullname"]
+    'Nyeyias um Adyuss'
+"""
+import itertools
+import logging
+import os
+import struct
+import sys
+import time
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Union
+
+from language import types
+from language.corpus import UNIT_SEPARATOR
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"FNR1"
+VERSION = 1
+
+# magic, version, lanes, capacity, slot size, refill rate (names/s), last refill (time.time()), produced
+HEADER = struct.Struct("<4sIIII4xddQ")
+HEADER_SIZE = 64
+
+# Each lane's head and tail, and the pid of its consumer, on separate cache lines.
+LANE_SIZE = 192
+HEAD, TAIL, OWNER = 0, 64, 128
+
+# Each slot holds a sequence number and the length of its contents, followed by the contents.
+SLOT = struct.Struct("<QI4x")
+
+# Separates the parts of an encoded name.
+RECORD_SEPARATOR = "\x1e"
+
+PREFIX = os.environ.get("FANLANG_RING_PREFIX", "fanlang-")
+LANES = 16
+CAPACITY = 1024
+SLOT_SIZE = 240
+
+# The producer generates names in batches of this size.
+BATCH_SIZE = 1000
+
+# The number of names too long for their slots that one refill skips before giving up.
+MAX_SKIPPED = 10000
+
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+
+
+def encode(name: types.Name) -> bytes:
+    """
+    Encode a name's full name and the values of each of its parts.
+    """
+    fields = [name["fullname"]]
+    for part, values in name.items():
+        if part != "fullname":
+            fields.append(UNIT_SEPARATOR.join([part, *values]))
+    return RECORD_SEPARATOR.join(fields).encode("utf-8")
+
+
+def decode(data: bytes) -> types.Name:
+    fullname, *fields = data.decode("utf-8").split(RECORD_SEPARATOR)
+    name = types.Name(list)
+    for field in fields:
+        part, *values = field.split(UNIT_SEPARATOR)
+        name[part] = values
+    name["fullname"] = fullname
+    return name
+
+
+def _attach(segment: str) -> shared_memory.SharedMemory:
+    # Before Python 3.13, attaching registers the segment with the resource
+    # tracker, which unlinks it when this process exits; only the producer may.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=segment, track=False)
+    from multiprocessing import resource_tracker
+
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=segment)
+    finally:
+        resource_tracker.register = register
+
+
+class Ring:
+    """
+    The lanes of one language's ring buffer, in a shared memory segment.
+
+    Attributes:
+        segment   - the name of the shared memory segment
+        lanes     - the number of lanes, and so of consumers
+        capacity  - the number of names each lane holds
+        slot_size - the largest encoded name, in bytes
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory):
+        self.memory = memory
+        self.buffer = memory.buf
+        magic, version, self.lanes, self.capacity, self.slot_size, _, _, _ = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise types.LanguageError(f"{memory.name} is not a name ring.")
+        if version != VERSION:
+            raise types.LanguageError(f"{memory.name} has unsupported ring version {version}.")
+        self.segment = memory.name
+        self.stride = SLOT.size + self.slot_size
+        self.slots = HEADER_SIZE + self.lanes * LANE_SIZE
+
+    @classmethod
+    def create(cls, segment: str, lanes: int = LANES, capacity: int = CAPACITY, slot_size: int = SLOT_SIZE) -> "Ring":
+        """
+        Create a new, empty ring in a shared memory segment.
+        """
+        slot_size += -slot_size % 8
+        size = HEADER_SIZE + lanes * LANE_SIZE + lanes * capacity * (SLOT.size + slot_size)
+        memory = shared_memory.SharedMemory(name=segment, create=True, size=size)
+        memory.buf[:size] = bytes(size)
+        HEADER.pack_into(memory.buf, 0, MAGIC, VERSION, lanes, capacity, slot_size, 0.0, 0.0, 0)
+        return cls(memory)
+
+    @classmethod
+    def attach(cls, segment: str) -> "Ring":
+        """
+        Attach to an existing ring.
+        """
+        return cls(_attach(segment))
+
+    def _lane(self, lane: int, field: int) -> int:
+        return HEADER_SIZE + lane * LANE_SIZE + field
+
+    def _slot(self, lane: int, position: int) -> int:
+        return self.slots + (lane * self.capacity + position % self.capacity) * self.stride
+
+    def head(self, lane: int) -> int:
+        return _U64.unpack_from(self.buffer, self._lane(lane, HEAD))[0]
+
+    def tail(self, lane: int) -> int:
+        return _U64.unpack_from(self.buffer, self._lane(lane, TAIL))[0]
+
+    def occupancy(self, lane: int) -> int:
+        """
+        Returns the number of names waiting in a lane.
+        """
+        return self.head(lane) - self.tail(lane)
+
+    def push(self, lane: int, data: bytes) -> bool:
+        """
+        Append an encoded name to a lane. Returns False if the lane is full.
+        Only the producer may push.
+        """
+        head = self.head(lane)
+        if head - self.tail(lane) >= self.capacity:
+            return False
+        offset = self._slot(lane, head)
+        SLOT.pack_into(self.buffer, offset, 2 * head + 1, 0)
+        self.buffer[offset + SLOT.size : offset + SLOT.size + len(data)] = data
+        SLOT.pack_into(self.buffer, offset, 2 * head + 2, len(data))
+        _U64.pack_into(self.buffer, self._lane(lane, HEAD), head + 1)
+        return True
+
+    def pop(self, lane: int) -> Union[bytes, None]:
+        """
+        Remove and return the oldest encoded name in a lane, or None if the
+        lane is empty. Only the lane's consumer may pop.
+        """
+        tail = self.tail(lane)
+        if tail >= self.head(lane):
+            return None
+        offset = self._slot(lane, tail)
+        sequence, length = SLOT.unpack_from(self.buffer, offset)
+        if sequence != 2 * tail + 2:
+            return None
+        data = bytes(self.buffer[offset + SLOT.size : offset + SLOT.size + length])
+        if SLOT.unpack_from(self.buffer, offset)[0] != sequence:
+            return None
+        _U64.pack_into(self.buffer, self._lane(lane, TAIL), tail + 1)
+        return data
+
+    def owner(self, lane: int) -> int:
+        return _I64.unpack_from(self.buffer, self._lane(lane, OWNER))[0]
+
+    def set_owner(self, lane: int, pid: int):
+        _I64.pack_into(self.buffer, self._lane(lane, OWNER), pid)
+
+    def record_refill(self, count: int, elapsed: float):
+        """
+        Add to the count of names produced, and update the refill rate: an
+        exponentially weighted average of names generated per second.
+        """
+        magic, version, lanes, capacity, slot_size, rate, updated, produced = HEADER.unpack_from(self.buffer, 0)
+        if elapsed > 0:
+            rate = count / elapsed if not rate else 0.8 * rate + 0.2 * count / elapsed
+        HEADER.pack_into(
+            self.buffer, 0, magic, version, lanes, capacity, slot_size, rate, time.time(), produced + count
+        )
+
+    def stats(self) -> dict:
+        """
+        Returns the ring's counters.
+        """
+        rate, updated, produced = HEADER.unpack_from(self.buffer, 0)[5:]
+        return {
+            "segment": self.segment,
+            "lanes": self.lanes,
+            "capacity": self.capacity,
+            "occupancy": [self.occupancy(lane) for lane in range(self.lanes)],
+            "consumers": sum(1 for lane in range(self.lanes) if self.owner(lane)),
+            "produced": produced,
+            "consumed": sum(self.tail(lane) for lane in range(self.lanes)),
+            "refill_rate": rate,
+            "last_refill": updated,
+        }
+
+    def close(self):
+        self.buffer = None
+        self.memory.close()
+
+    def unlink(self):
+        self.memory.unlink()
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class Producer:
+    """
+    Keeps the ring of each of a number of name generators full.
+
+    Usage:
+        >>> producer = Producer({"elvish": elvish.Name, "elvish-noble": elvish.NobleName})
+        >>> producer.refill()
+        32768
+        >>> producer.run(interval=0.01)
+    """
+
+    def __init__(
+        self,
+        generators: dict,
+        lanes: int = LANES,
+        capacity: int = CAPACITY,
+        slot_size: int = SLOT_SIZE,
+        prefix: str = PREFIX,
+    ):
+        self.generators = generators
+        self.rings = {}
+        try:
+            for key in generators:
+                self.rings[key] = Ring.create(f"{prefix}{key}", lanes=lanes, capacity=capacity, slot_size=slot_size)
+        except Exception:
+            self.close()
+            raise
+
+    def refill(self, key: Union[str, None] = None) -> int:
+        """
+        Fill every lane of every ring, or of one ring. Returns the number of names added.
+        """
+        added = 0
+        for name in [key] if key else self.rings:
+            ring = self.rings[name]
+            missing = [ring.capacity - ring.occupancy(lane) for lane in range(ring.lanes)]
+            total = sum(missing)
+            if not total:
+                continue
+            start = time.perf_counter()
+            encoded = self._fitting(name, total, ring.slot_size)
+            pushed = 0
+            for lane, count in enumerate(missing):
+                for data in itertools.islice(encoded, count):
+                    ring.push(lane, data)
+                    pushed += 1
+            ring.record_refill(pushed, time.perf_counter() - start)
+            added += pushed
+        return added
+
+    def _fitting(self, key: str, count: int, slot_size: int):
+        """
+        Yields `count` encoded names that fit in slots of `slot_size` bytes.
+        Each name that is too long is skipped and replaced by another, unless
+        so many are skipped that the slots are clearly too small.
+        """
+        skipped = 0
+        while count > 0:
+            for data in self._encoded(key, count):
+                if len(data) > slot_size:
+                    logger.debug(f"Skipping a {key} name of {len(data)} bytes; the slots hold {slot_size}.")
+                    skipped += 1
+                    continue
+                count -= 1
+                yield data
+            if count and skipped > MAX_SKIPPED:
+                logger.warning(f"Skipped {skipped} {key} names too long for {slot_size} byte slots; giving up.")
+                return
+
+    def _encoded(self, key: str, count: int):
+        generator = self.generators[key]
+        while count > 0:
+            try:
+                names = generator.name(min(BATCH_SIZE, count))
+            except types.ImprobableTemplateError:
+                continue
+            count -= len(names)
+            for name in names:
+                yield encode(name)
+
+    def run(self, interval: float = 0.01, stop=None):
+        """
+        Refill the rings every `interval` seconds, until stop() returns True.
+        """
+        while not (stop and stop()):
+            if not self.refill():
+                time.sleep(interval)
+
+    def stats(self) -> dict:
+        return dict((key, ring.stats()) for (key, ring) in self.rings.items())
+
+    def close(self):
+        """
+        Close and remove every ring.
+        """
+        for ring in self.rings.values():
+            ring.close()
+            ring.unlink()
+        self.rings = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Consumer:
+    """
+    Pops names from one lane of a ring.
+
+    If no lane is given, the first lane without a live consumer is claimed;
+    claiming a lane is the only time consumers coordinate with each other.
+    """
+
+    def __init__(self, key: str, lane: Union[int, None] = None, prefix: str = PREFIX):
+        self.ring = Ring.attach(f"{prefix}{key}")
+        self.lane = self.claim() if lane is None else lane
+        if not 0 <= self.lane < self.ring.lanes:
+            self.ring.close()
+            raise types.LanguageError(f"{self.ring.segment} has no lane {self.lane}.")
+        self.ring.set_owner(self.lane, os.getpid())
+
+    def claim(self) -> int:
+        import fcntl
+
+        lock = Path(os.environ.get("TMPDIR", "/tmp")) / f"{self.ring.segment}.lock"
+        with open(lock, "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            for lane in range(self.ring.lanes):
+                owner = self.ring.owner(lane)
+                if not owner or not _alive(owner):
+                    self.ring.set_owner(lane, os.getpid())
+                    return lane
+        self.ring.close()
+        raise types.LanguageError(f"Every lane of {self.ring.segment} has a consumer.")
+
+    def pop(self) -> Union[types.Name, None]:
+        """
+        Returns the next name, or None if the lane is empty.
+        """
+        data = self.ring.pop(self.lane)
+        return None if data is None else decode(data)
+
+    def stats(self) -> dict:
+        return self.ring.stats()
+
+    def close(self):
+        if self.ring.buffer is not None:
+            if self.ring.owner(self.lane) == os.getpid():
+                self.ring.set_owner(self.lane, 0)
+            self.ring.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
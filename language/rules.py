@@ -40,4 +40,6 @@ def must_have_a_vowel(language: Language, word: str) -> bool:
     return False
 
 
-default_rules = {must_have_a_vowel, too_many_vowels, too_many_consonants, cannot_have_just_repeated_vowels}
+# Immutable, so that a language pack extending the defaults can't change the
+# rules of every other language sharing them: use default_rules | {...}.
+default_rules = frozenset({must_have_a_vowel, too_many_vowels, too_many_consonants, cannot_have_just_repeated_vowels})
@@ -0,0 +1,116 @@
+"""
+A thread-scaling benchmark for name generation.
+
+Languages and name generators can be shared by any number of threads: their
+tables are never changed once they are built, rules are immutable, and every
+thread draws from its own random number generator (see types.rng()). On a
+free-threaded build of Python (3.13t or later), throughput should therefore
+grow almost linearly with the number of threads, up to the number of CPUs; on
+a build with the GIL it stays flat, which this benchmark also makes easy to
+see.
+
+Every thread generates the same number of names from the same shared
+generator, and throughput is measured from the moment all of them start to
+the moment the last one finishes.
+
+Usage:
+    % python -m language.scaling elvish 1 2 4 8
+    elvish names, CPython 3.11.7 (GIL enabled), 1 CPUs
+    threads     names/s   speedup  efficiency
+          1       15787     1.00x        100%
+          2       16183     1.03x         51%
+          4       14794     0.94x         23%
+          8       14208     0.90x         11%
+
+The run above is from a single-CPU machine with the GIL, so it only shows that
+sharing a generator between threads costs little; it has not yet been measured
+on a free-threaded build.
+"""
+import os
+import platform
+import sys
+import threading
+import time
+
+from language import types
+
+# The number of names each thread generates.
+COUNT = 20000
+
+# The number of names each thread generates with each call to name().
+BATCH_SIZE = 100
+
+THREADS = (1, 2, 4, 8)
+
+
+def gil_enabled() -> bool:
+    """
+    Returns True if the interpreter is running with the GIL.
+    """
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _generate(generator: types.NameGenerator, count: int, batch_size: int):
+    generated = 0
+    while generated < count:
+        try:
+            generated += len(generator.name(min(batch_size, count - generated)))
+        except types.ImprobableTemplateError:
+            continue
+
+
+def throughput(generator: types.NameGenerator, threads: int, count: int = COUNT, batch_size: int = BATCH_SIZE) -> float:
+    """
+    Returns the number of names per second generated by `threads` threads
+    sharing `generator`, each generating `count` names.
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def work():
+        barrier.wait()
+        _generate(generator, count, batch_size)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * count / (time.perf_counter() - start)
+
+
+def scaling(generator: types.NameGenerator, threads: tuple = THREADS, count: int = COUNT) -> list:
+    """
+    Returns (threads, names per second) for each number of threads.
+    """
+    # Build any lazily compiled tables before timing anything.
+    _generate(generator, BATCH_SIZE, BATCH_SIZE)
+    return [(n, throughput(generator, n, count)) for n in threads]
+
+
+def main(args: list) -> int:
+    """
+    Usage: python -m language.scaling [LANGUAGE] [THREADS ...]
+    """
+    import language
+
+    name = args.pop(0) if args and not args[0].isdigit() else "common"
+    threads = tuple(int(n) for n in args) or THREADS
+    generator = language.load_language_pack(lazy=True)[1][name].Name
+
+    print(
+        f"{name} names, {platform.python_implementation()} {platform.python_version()} "
+        f"(GIL {'enabled' if gil_enabled() else 'disabled'}), {os.cpu_count()} CPUs"
+    )
+    print(f"{'threads':>7s} {'names/s':>11s} {'speedup':>9s} {'efficiency':>11s}")
+    results = scaling(generator, threads)
+    base = results[0][1] / results[0][0]
+    for n, rate in results:
+        speedup = rate / base
+        print(f"{n:7d} {rate:11.0f} {speedup:8.2f}x {speedup / n:11.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
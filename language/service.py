@@ -0,0 +1,168 @@
+"""
+Serve names and text over a local socket.
+
+A small HTTP/1.1 service, built on asyncio and language.aio: generation runs
+in the shared executor, and concurrent requests for the same generator are
+coalesced into shared batches. Connections are kept alive, so a client can
+send any number of requests over each one.
+
+Requests:
+    GET /names?language=elvish&count=3[&noble=1][&deadline_ms=5]
+        {"names": ["Näoa an Drufln", ...]}
+    GET /text?language=celestial&words=20[&deadline_ms=5]
+        {"text": "..."}
+
+With deadline_ms, words that run out of time are replaced by safe words; see
+types.budget(). Unknown languages and bad parameters get a 400 response, and
+generation errors such as ImprobableTemplateError a 500, each with a JSON body
+of the form {"error": "..."}.
+
+Usage:
+    % fanlang serve --port 8089 &
+    % curl -s 'localhost:8089/names?language=elvish&count=2'
+    {"names": ["Echea an Dhood", "Lilion Rhysor"]}
+"""
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+from typing import Union
+from urllib.parse import parse_qs, urlsplit
+
+from language import aio, types
+
+logger = logging.getLogger(__name__)
+
+# The port the service listens on by default.
+PORT = 8089
+
+# The largest number of names or words a single request may ask for.
+MAXIMUM_COUNT = 10000
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+
+class BadRequest(Exception):
+    pass
+
+
+def _integer(query: dict, name: str, default: int, minimum: int = 1, maximum: int = MAXIMUM_COUNT) -> int:
+    try:
+        value = int(query.get(name, [default])[0])
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer.")
+    if not minimum <= value <= maximum:
+        raise BadRequest(f"{name} must be between {minimum} and {maximum}.")
+    return value
+
+
+def _deadline(query: dict) -> Union[float, None]:
+    if "deadline_ms" not in query:
+        return None
+    try:
+        return float(query["deadline_ms"][0])
+    except ValueError:
+        raise BadRequest("deadline_ms must be a number.")
+
+
+async def _text(language: types.Language, words: int, deadline_ms: Union[float, None]) -> str:
+    # Like aio.generate(), but text() returns a single string rather than a list of results.
+    if deadline_ms is None:
+        context = contextvars.copy_context()
+    else:
+        with types.budget(deadline_ms):
+            context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(aio.executor(), functools.partial(context.run, language.text, words))
+
+
+class Service:
+    """
+    Generates names and text from a mapping of language names to language modules.
+    """
+
+    def __init__(self, languages):
+        self.languages = languages
+
+    def module(self, query: dict):
+        name = query.get("language", [""])[0]
+        if name not in self.languages:
+            raise BadRequest(f"Unsupported language {name!r}.")
+        return self.languages[name]
+
+    async def handle(self, target: str) -> tuple:
+        """
+        Returns the (status, body) of the response to a GET of `target`.
+        """
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        try:
+            if url.path == "/names":
+                module = self.module(query)
+                generator = module.NobleName if query.get("noble", ["0"])[0] not in ("0", "") else module.Name
+                count = _integer(query, "count", 1)
+                names = await aio.generate(generator.name, count, deadline_ms=_deadline(query))
+                return 200, {"names": [name["fullname"] for name in names]}
+            if url.path == "/text":
+                module = self.module(query)
+                text = await _text(module.Language, _integer(query, "words", 25), _deadline(query))
+                return 200, {"text": text}
+        except BadRequest as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            logger.debug(f"{target}: {e.__class__.__name__}: {e}")
+            return 500, {"error": f"{e.__class__.__name__}: {e}"}
+        return 404, {"error": f"No such resource {url.path}."}
+
+    async def connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serve the requests of one connection until the client closes it.
+        """
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                method, target, version = (request.decode("latin-1").split() + ["", "", ""])[:3]
+                if method != "GET":
+                    status, body = 400, {"error": f"Unsupported method {method}."}
+                else:
+                    status, body = await self.handle(target)
+                close = headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+                payload = json.dumps(body).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode("latin-1") + payload
+                )
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(languages, host: str = "127.0.0.1", port: int = PORT, path: str = ""):
+    """
+    Serve requests on a TCP port, or on a Unix socket if `path` is given, until cancelled.
+    """
+    service = Service(languages)
+    if path:
+        server = await asyncio.start_unix_server(service.connection, path=path)
+        logger.info(f"Serving names on {path}.")
+    else:
+        server = await asyncio.start_server(service.connection, host=host, port=port)
+        logger.info(f"Serving names on http://{host}:{port}/.")
+    async with server:
+        await server.serve_forever()
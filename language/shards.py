@@ -0,0 +1,299 @@
+"""
+Write very large numbers of names to a directory of compressed shards.
+
+Names are generated in batches of BATCH_SIZE, the k-th batch from the seed
+derive_seed(seed, k) under a budget, so the same seed, count and batch size
+always give the same names. Each batch is handed to a ShardWriter, which
+writes it from a background thread: the names are written one per line to
+the current shard, which is compressed with gzip or xz if asked, and a new
+shard is started once the current one holds `shard_bytes` bytes of names
+before compression. Compression and file I/O run while the next batch is
+generated; only if the writer falls a few batches behind does generation
+wait for it.
+
+Each shard is written under a temporary name and renamed once complete. The
+directory's manifest.json is rewritten after each shard, and records the seed,
+the pack hash, the total count and, for every shard, its file, the index of
+its first name, its number of names and the size and SHA-256 checksum of the
+file, so that loaders can read and verify shards in parallel, each on its own.
+The manifest's "complete" is false until the last shard has been written.
+
+Usage:
+    % fanlang --language elvish names --count 100000000 --seed 1234 --output-dir elvish --compression gzip
+    Wrote 100000000 elvish names to elvish in 24 shards (seed 1234).
+
+    >>> manifest = shards.load("elvish")
+    >>> shards.verify("elvish", manifest["shards"][3])
+    True
+    >>> next(shards.read("elvish", manifest["shards"][3]))
+    'Nyeyias um Adyuss'
+"""
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Iterator, Union
+
+from language import types
+
+VERSION = 1
+
+MANIFEST = "manifest.json"
+
+# The file extension of each kind of compression.
+COMPRESSION = {"none": "", "gzip": ".gz", "xz": ".xz"}
+
+# The largest number of bytes of names in a shard, before compression.
+SHARD_BYTES = 64 * 2**20
+
+# Names are generated, and handed to the writer, in batches of this size.
+BATCH_SIZE = 10000
+
+# The number of batches that may wait for the writer before generation waits too.
+QUEUE_DEPTH = 8
+
+
+class _Digest:
+    """
+    A binary file that counts and hashes the bytes written to it.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.size += len(data)
+        self.sha256.update(data)
+        return self.f.write(data)
+
+    def flush(self):
+        self.f.flush()
+
+
+class _Shard:
+    def __init__(self, directory: Path, file: str, first: int, compression: str):
+        self.path = directory / file
+        self.partial = directory / f".{file}.partial"
+        self.raw = open(self.partial, "wb")
+        self.digest = _Digest(self.raw)
+        if compression == "gzip":
+            # With no file name and no timestamp, the same names always compress to the same bytes.
+            self.f = gzip.GzipFile(fileobj=self.digest, mode="wb", compresslevel=6, mtime=0)
+        elif compression == "xz":
+            self.f = lzma.LZMAFile(self.digest, mode="wb")
+        else:
+            self.f = self.digest
+        self.entry = dict(file=file, first=first, count=0, bytes=0)
+
+    def write(self, data: bytes, count: int):
+        self.f.write(data)
+        self.entry["count"] += count
+        self.entry["bytes"] += len(data)
+
+    def finish(self) -> dict:
+        if self.f is not self.digest:
+            self.f.close()
+        self.raw.close()
+        os.replace(self.partial, self.path)
+        self.entry.update(size=self.digest.size, sha256=self.digest.sha256.hexdigest())
+        return self.entry
+
+    def abandon(self):
+        if self.f is not self.digest:
+            self.f.close()
+        self.raw.close()
+        self.partial.unlink(missing_ok=True)
+
+
+class ShardWriter:
+    """
+    Writes batches of names to a directory of shards from a background thread.
+
+    Usage:
+        >>> with ShardWriter("elvish", prefix="elvish", compression="xz", metadata={"seed": 1234}) as writer:
+        ...     writer.write(["Nyeyias um Adyuss", ...])
+        >>> writer.manifest["count"]
+        10000
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        prefix: str = "names",
+        compression: str = "none",
+        shard_bytes: int = SHARD_BYTES,
+        metadata: Union[dict, None] = None,
+    ):
+        if compression not in COMPRESSION:
+            raise ValueError(f"Unsupported compression {compression}; use one of {', '.join(COMPRESSION)}.")
+        if shard_bytes <= 0:
+            raise ValueError("Shards must hold more than zero bytes.")
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.compression = compression
+        self.shard_bytes = shard_bytes
+        self.manifest = dict(version=VERSION, complete=False, compression=compression, shard_bytes=shard_bytes)
+        self.manifest.update(metadata or {})
+        self.manifest.update(count=0, shards=[])
+        self._queue = queue.Queue(maxsize=QUEUE_DEPTH)
+        self._thread = None
+        self._error = None
+
+    def start(self) -> "ShardWriter":
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="fanlang-shards", daemon=True)
+        self._thread.start()
+        return self
+
+    def write(self, names: list):
+        """
+        Queue a batch of names to be written, waiting only if the writer has fallen QUEUE_DEPTH batches behind.
+        """
+        if self._error:
+            raise self._error
+        self._queue.put(names)
+
+    def close(self, complete: bool = True) -> dict:
+        """
+        Wait for every queued batch to be written, finish the last shard and
+        return the manifest. With complete=False, as when generation failed,
+        the unfinished shard is removed and the manifest left incomplete.
+        """
+        if self._thread:
+            self._queue.put(complete)
+            self._thread.join()
+            self._thread = None
+        if self._error and complete:
+            raise self._error
+        return self.manifest
+
+    def __enter__(self) -> "ShardWriter":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close(complete=exc_type is None)
+
+    def _run(self):
+        shard = None
+        while True:
+            item = self._queue.get()
+            # close() queues whether the names are complete, as the last item.
+            if isinstance(item, bool):
+                break
+            if self._error:
+                # Keep taking batches, so that write() never waits on a writer that has stopped.
+                continue
+            try:
+                data = ("\n".join(item) + "\n").encode("utf-8") if item else b""
+                while data:
+                    if shard is None:
+                        shard = self._open()
+                    room = self.shard_bytes - shard.entry["bytes"]
+                    # Split between names, but give a name longer than a whole shard a shard of its own.
+                    split = len(data) if len(data) <= room else data.rfind(b"\n", 0, room) + 1
+                    if not split and not shard.entry["count"]:
+                        split = data.find(b"\n") + 1
+                    if split:
+                        shard.write(data[:split], data.count(b"\n", 0, split))
+                        data = data[split:]
+                    if data:
+                        self._finish(shard)
+                        shard = None
+            except Exception as e:
+                self._error = e
+        try:
+            if shard is not None:
+                if item and not self._error:
+                    self._finish(shard)
+                else:
+                    shard.abandon()
+            if item and not self._error:
+                self.manifest["complete"] = True
+                self._save()
+        except Exception as e:
+            self._error = self._error or e
+
+    def _open(self) -> "_Shard":
+        number = len(self.manifest["shards"])
+        file = f"{self.prefix}-{number:05d}.txt{COMPRESSION[self.compression]}"
+        return _Shard(self.directory, file, self.manifest["count"], self.compression)
+
+    def _finish(self, shard: "_Shard"):
+        entry = shard.finish()
+        self.manifest["shards"].append(entry)
+        self.manifest["count"] += entry["count"]
+        self._save()
+
+    def _save(self):
+        path = self.directory / MANIFEST
+        temporary = path.with_name(f".{path.name}.{os.getpid()}")
+        temporary.write_text(json.dumps(self.manifest, indent=2) + "\n")
+        os.replace(temporary, path)
+
+
+def write(
+    generator: types.NameGenerator,
+    directory: Union[str, Path],
+    count: int,
+    seed: Union[int, str, None] = None,
+    prefix: str = "names",
+    compression: str = "none",
+    shard_bytes: int = SHARD_BYTES,
+    metadata: Union[dict, None] = None,
+) -> dict:
+    """
+    Generate `count` names and write them to a directory of shards. Returns the manifest.
+    """
+    if seed is None:
+        seed = types.rng().getrandbits(64)
+    # Build the reserves of safe words from the seed, so that they don't depend on which batch first needs them.
+    with types.seeded(types.derive_seed(seed, -1)):
+        generator.prepare()
+    metadata = dict(seed=seed, batch_size=BATCH_SIZE, **(metadata or {}))
+    with ShardWriter(directory, prefix, compression, shard_bytes, metadata) as writer:
+        for index, start in enumerate(range(0, count, BATCH_SIZE)):
+            with types.seeded(types.derive_seed(seed, index)), types.budget():
+                names = generator.name(min(BATCH_SIZE, count - start))
+            writer.write([name["fullname"] for name in names])
+    return writer.manifest
+
+
+def load(directory: Union[str, Path]) -> dict:
+    """
+    Returns the manifest of a directory of shards.
+    """
+    return json.loads((Path(directory) / MANIFEST).read_text())
+
+
+def verify(directory: Union[str, Path], entry: dict) -> bool:
+    """
+    Returns True if a shard's file has the size and checksum recorded in its manifest entry.
+    """
+    path = Path(directory) / entry["file"]
+    try:
+        if path.stat().st_size != entry["size"]:
+            return False
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(2**20), b""):
+                sha256.update(block)
+        return sha256.hexdigest() == entry["sha256"]
+    except FileNotFoundError:
+        return False
+
+
+def read(directory: Union[str, Path], entry: dict) -> Iterator[str]:
+    """
+    Yields the names of a shard, decompressing it if need be.
+    """
+    path = Path(directory) / entry["file"]
+    opener = gzip.open if path.suffix == ".gz" else lzma.open if path.suffix == ".xz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield line.rstrip("\n")
@@ -0,0 +1,96 @@
+"""
+A cold start regression check for the fanlang command-line interface.
+
+fanlang is called from shell scripts and editor plugins many times a day, so
+the time it takes to start matters as much as the time it takes to generate
+anything. This module runs a small fanlang command in fresh interpreters and
+fails if the fastest run exceeds a fixed budget, listing the slowest imports
+to help track down the regression. Timings vary with the machine and its
+load, so the test suite instead checks which modules a cold start imports.
+
+Usage:
+    % python -m language.startup
+    fanlang names --count 1: 0.121s (budget: 0.170s)
+"""
+import os
+import subprocess
+import sys
+import time
+
+# The cold start budget, in seconds: between the cold start before it was optimized (about 0.22s) and since (about
+# 0.12s), so that losing the optimizations fails the check. Override it on slower machines.
+BUDGET = float(os.environ.get("FANLANG_STARTUP_BUDGET", 0.17))
+
+COMMAND = ["names", "--count", "1"]
+
+
+def _run(args: list, *options) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-m", "language.cli", *args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def cold_start(args: list = COMMAND, runs: int = 5) -> float:
+    """
+    Returns the fastest wall-clock time, in seconds, of running fanlang with
+    the given arguments in a fresh interpreter.
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def imported_modules(args: list = COMMAND) -> set:
+    """
+    Returns the names of every module imported by running fanlang with the
+    given arguments in a fresh interpreter, as reported by python -X importtime.
+    """
+    modules = set()
+    for line in _run(args, "-X", "importtime").stderr.splitlines():
+        if line.startswith("import time:"):
+            modules.add(line.split("|")[2].strip())
+    return modules - {"imported package"}
+
+
+def slowest_imports(args: list = COMMAND, count: int = 10) -> list:
+    """
+    Returns (cumulative microseconds, module name) for the slowest top-level
+    imports, as reported by python -X importtime.
+    """
+    imports = []
+    for line in _run(args, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.split("|")
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            continue
+        name = fields[2]
+        # Only report imports made directly by fanlang, not those they make themselves.
+        if name.startswith("  "):
+            continue
+        imports.append((cumulative, name.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main(budget: float = BUDGET) -> int:
+    elapsed = cold_start()
+    print(f"fanlang {' '.join(COMMAND)}: {elapsed:.3f}s (budget: {budget:.3f}s)")
+    if elapsed <= budget:
+        return 0
+    print("Cold start is over budget. Slowest imports:")
+    for cumulative, name in slowest_imports():
+        print(f"  {cumulative / 1000000:.3f}s {name}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Deterministic translation of text into a fantasy language.
+
+Every English word is replaced by a word of the target language, and the same
+English word is always replaced by the same fantasy word: each word's
+translation is generated from a seed derived from the language name and the
+word itself, so it does not depend on the order in which words are seen, or
+on whether they have been seen before. Of several candidate words, the one
+closest in length to the English word is used, so that long words stay long
+and short words stay short. Punctuation, numbers and whitespace are kept as
+they are, and the capitalization of each word is carried over.
+
+Translations are memoized in a Lexicon, an sqlite database on disk, so that
+repeated runs over large documents look earlier translations up rather than
+generating them again. They are stored under the language name and the hash of
+its language pack (see language.pack_hash()), so that changing a language
+invalidates its earlier translations.
+
+Usage:
+    >>> with Lexicon("lexicon.sqlite3") as lexicon:
+    ...     translator = Translator(elvish.Language, lexicon=lexicon)
+    ...     translator.translate("The King is dead. Long live the King!")
+    'Ysi Oewaerm na ylu. Meitha amuaw ysi Oewaerm!'
+"""
+import os
+import re
+import sqlite3
+from hashlib import blake2b
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+from language import pack_hash, types
+
+# Words are runs of letters, possibly joined by apostrophes: "don't", "o'clock".
+WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+
+# The number of candidate words generated for each English word.
+CANDIDATES = 8
+
+DEFAULT_LEXICON = Path(
+    os.environ.get(
+        "FANLANG_LEXICON",
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "fanlang" / "lexicon.sqlite3",
+    )
+)
+
+
+class Lexicon:
+    """
+    An on-disk store of translations, indexed by language and English word.
+
+    Lookups are memoized in memory, and new translations are written in
+    batches of `batch_size`; call flush() or close() (or use the Lexicon as a
+    context manager) to write any that remain.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_LEXICON, batch_size: int = 1000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS lexicon ("
+            "language TEXT NOT NULL, word TEXT NOT NULL, translation TEXT NOT NULL, "
+            "PRIMARY KEY (language, word)) WITHOUT ROWID"
+        )
+        self.memo = {}
+        self.pending = []
+
+    def get(self, language: str, word: str) -> Union[str, None]:
+        key = (language, word)
+        if key not in self.memo:
+            row = self.connection.execute(
+                "SELECT translation FROM lexicon WHERE language = ? AND word = ?", key
+            ).fetchone()
+            self.memo[key] = row[0] if row else None
+        return self.memo[key]
+
+    def set(self, language: str, word: str, translation: str):
+        self.memo[(language, word)] = translation
+        self.pending.append((language, word, translation))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO lexicon VALUES (?, ?, ?)", self.pending)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def match_case(word: str, template: str) -> str:
+    """
+    Returns the word capitalized the same way as the template.
+    """
+    if len(template) > 1 and template.isupper():
+        return word.upper()
+    if template[0].isupper():
+        return word[:1].upper() + word[1:]
+    return word
+
+
+class Translator:
+    """
+    Translates text into a Language.
+    """
+
+    def __init__(self, language: types.Language, lexicon: Union[Lexicon, None] = None, pack: str = ""):
+        """
+        Args:
+            language - the Language to translate into
+            lexicon  - the Lexicon of earlier translations, if any
+            pack     - the name of the language's language pack; defaults to $FANLANG_LANGUAGE_PACK
+        """
+        self.language = language
+        self.lexicon = lexicon
+        # The key of the language's translations in the lexicon.
+        self.key = f"{language.name}:{pack_hash(pack)}" if lexicon is not None else language.name
+        self.memo = {}
+
+    def seed(self, word: str) -> int:
+        """
+        Returns the seed from which the translation of a word is generated.
+        """
+        digest = blake2b(f"{self.language.name}\0{word}".encode("utf-8"), digest_size=16).digest()
+        return int.from_bytes(digest, "big")
+
+    def generate(self, word: str) -> str:
+        """
+        Generate the translation of a lowercase English word.
+
+        Candidates that run out of attempts are replaced by safe words, so
+        that every word has a translation, and always the same one.
+        """
+        with types.seeded(self.seed(word)), types.budget():
+            candidates = self.language.word(CANDIDATES)
+        return min(candidates, key=lambda candidate: abs(len(candidate) - len(word)))
+
+    def word(self, word: str) -> str:
+        """
+        Returns the translation of a single English word, matching its capitalization.
+        """
+        key = word.lower()
+        translation = self.memo.get(key)
+        if translation is None:
+            if self.lexicon is not None:
+                translation = self.lexicon.get(self.key, key)
+            if translation is None:
+                translation = self.generate(key)
+                if self.lexicon is not None:
+                    self.lexicon.set(self.key, key, translation)
+            self.memo[key] = translation
+        return match_case(translation, word)
+
+    def translate(self, text: str) -> str:
+        """
+        Returns the text with every word translated.
+        """
+        return WORD.sub(lambda match: self.word(match.group()), text)
+
+    def stream(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Translate a stream of lines, one at a time.
+        """
+        for line in lines:
+            yield self.translate(line)
@@ -1,9 +1,284 @@
 import inspect
+import logging
 import random
+import threading
+from bisect import bisect_left
 from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from hashlib import blake2b
+from time import perf_counter, perf_counter_ns
 from typing import Union
 from random_sets.sets import WeightedSet, equal_weights
 
+logger = logging.getLogger(__name__)
+
+# Batches at least this large are drawn with NumPy, when it is available.
+NUMPY_THRESHOLD = 512
+
+# Language.word() uses the NumPy backend for at least this many words.
+VECTORIZE_THRESHOLD = 256
+
+# The number of attempts made to create each valid word, unless a Budget says otherwise.
+ATTEMPTS = 10
+
+# The number of valid words each language keeps in reserve; see Language.safe_words().
+SAFE_WORDS = 32
+
+# NameGenerator.name() checks the deadline of a budget after every chunk of this many names.
+BUDGET_CHUNK = 16
+
+# The upper bounds, in seconds, of the buckets of the latency histograms kept by Metrics.
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+_local = threading.local()
+
+
+def rng():
+    """
+    Returns the random number generator of the current thread.
+
+    The main thread uses the random module itself, so that random.seed() still
+    makes its output reproducible. Every other thread gets its own generator,
+    seeded from the operating system, so that threads sharing a Language or a
+    NameGenerator never contend for -- or race on -- the same random state.
+    """
+    try:
+        return _local.rng
+    except AttributeError:
+        _local.rng = random if threading.current_thread() is threading.main_thread() else random.Random()
+        return _local.rng
+
+
+def choice(weighted_set: WeightedSet):
+    """
+    Returns a random member of a WeightedSet, drawn from the current thread's
+    generator. Equivalent to weighted_set.random().
+    """
+    return rng().choices(weighted_set.members, weighted_set.weights)[0]
+
+
+@cache
+def _numpy():
+    """
+    Returns the numpy module, or None if it is not installed. NumPy is only
+    imported the first time it is needed, so that it doesn't slow down
+    importing the language pack.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def sample(weighted_set: WeightedSet, count: int) -> list:
+    """
+    Returns `count` random members of a WeightedSet, drawn at once. This is
+    equivalent to, but much faster than, calling weighted_set.random() `count`
+    times.
+    """
+    numpy = _numpy() if count >= NUMPY_THRESHOLD else None
+    if numpy is not None:
+        # Seed from the thread's generator so that random.seed() still makes the output reproducible.
+        generator = numpy.random.default_rng(rng().getrandbits(64))
+        weights = numpy.asarray(weighted_set.weights, dtype=float)
+        members = weighted_set.members
+        return [members[i] for i in generator.choice(len(weights), size=count, p=weights / weights.sum())]
+    return rng().choices(weighted_set.members, weighted_set.weights, k=count)
+
+
+@contextmanager
+def seeded(seed: Union[int, str, bytes]):
+    """
+    Generate words and names from a fixed seed, without disturbing the random
+    state of the rest of the program. Only the current thread's generator is
+    seeded, so other threads are unaffected.
+
+    Usage:
+        >>> with seeded(1234):
+        ...     Language.word()
+        ['apsoo']
+    """
+    generator = rng()
+    state = generator.getstate()
+    generator.seed(seed)
+    try:
+        yield
+    finally:
+        generator.setstate(state)
+
+
+class Budget:
+    """
+    Limits on the attempts and time spent generating words and names.
+
+    A budget applies to everything generated while it is active, including
+    the words of nested name generators, so that a noble name built from
+    several words and place names keeps to a single deadline.
+
+    Attributes:
+        deadline - the perf_counter() time after which no more attempts are made, or None
+        attempts - the number of attempts made to create each valid word
+        fallback - if True, a word that runs out of attempts or time is replaced by
+                   one of the language's safe words; if False, ImprobableTemplateError
+                   is raised as usual
+    """
+
+    def __init__(self, deadline: Union[float, None] = None, attempts: int = ATTEMPTS, fallback: bool = True):
+        self.deadline = deadline
+        self.attempts = attempts
+        self.fallback = fallback
+
+    def expired(self) -> bool:
+        return self.deadline is not None and perf_counter() >= self.deadline
+
+
+_budget = ContextVar("budget", default=None)
+
+
+def current_budget() -> Union[Budget, None]:
+    """
+    Returns the budget in effect, or None.
+    """
+    return _budget.get()
+
+
+@contextmanager
+def budget(deadline_ms: Union[float, None] = None, attempts: Union[int, None] = None, fallback: bool = True):
+    """
+    Limit the time and attempts spent generating words and names. A budget
+    inside another can only bring the deadline forward.
+
+    Usage:
+        >>> with budget(deadline_ms=2):
+        ...     elvish.NobleName.name(10)
+    """
+    outer = _budget.get()
+    deadline = None if deadline_ms is None else perf_counter() + deadline_ms / 1000
+    if outer and outer.deadline is not None:
+        deadline = outer.deadline if deadline is None else min(deadline, outer.deadline)
+    if attempts is None:
+        attempts = outer.attempts if outer else ATTEMPTS
+    limits = Budget(deadline, attempts, fallback)
+    token = _budget.set(limits)
+    try:
+        yield limits
+    finally:
+        _budget.reset(token)
+
+
+def derive_seed(seed: Union[int, str], index: int, attempt: int = 0) -> int:
+    """
+    Returns the seed of the `index`-th item of the stream of words or names
+    generated from `seed`. Each item has its own seed, so any one of them can
+    be generated without generating the items before it.
+    """
+    key = f"{seed}:{index}" if not attempt else f"{seed}:{index}:{attempt}"
+    digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest, "big")
+
+
+def generate_at(method, seed: Union[int, str], index: int, attempts: int = 10):
+    """
+    Returns the first result of calling `method` with the random state seeded
+    for the `index`-th item of the stream generated from `seed`.
+
+    A seed that leads to an ImprobableTemplateError would fail every time it
+    is used, so the item is instead generated from the next of a fixed series
+    of seeds for the same index; the result is still the same on every call.
+    """
+    for attempt in range(attempts):
+        with seeded(derive_seed(seed, index, attempt)):
+            try:
+                return method()[0]
+            except ImprobableTemplateError:
+                if attempt == attempts - 1:
+                    raise
+
+
+def text_plan(count: int, generator: Union[random.Random, None] = None) -> tuple:
+    """
+    Returns the plan of a paragraph of `count` words: a list of (start,
+    separator, capitalized) for each phrase, giving the index of its first
+    word, the punctuation before it, and whether it starts a sentence; and the
+    punctuation that ends the paragraph. The plan depends only on the number
+    of words, so it can be drawn separately from the words themselves.
+    """
+    generator = generator or rng()
+    starts = []
+    length = 0
+    for index in range(count):
+        if not length:
+            starts.append(index)
+        length += 1
+        if length >= generator.randint(1, 12):
+            length = 0
+
+    phrases = [(0, "", True)]
+    for start in starts[1:]:
+        if generator.choice([0, 0, 1]):
+            phrases.append((start, generator.choice("?!.") + " ", True))
+        else:
+            phrases.append((start, ", ", False))
+    return phrases, generator.choice("?!.")
+
+
+def stitch(words: list, phrases: list, offset: int = 0) -> str:
+    """
+    Returns words punctuated according to the phrases of a text_plan(). The
+    words may be any run of the paragraph's words, starting at index `offset`,
+    as long as `phrases` includes the phrase the run starts in; the stitched
+    runs of a paragraph concatenate to the whole paragraph.
+    """
+    position = bisect_left(phrases, (offset + 1,)) - 1
+    start, separator, capitalized = phrases[position]
+    following = phrases[position + 1][0] if position + 1 < len(phrases) else None
+    parts = []
+    for index, word in enumerate(words, offset):
+        word = str(word)
+        if index == following:
+            position += 1
+            start, separator, capitalized = phrases[position]
+            following = phrases[position + 1][0] if position + 1 < len(phrases) else None
+        # Like phrase.capitalize(): the first letter of a sentence is upper-cased, and the rest lower-cased.
+        if index == start:
+            parts.append(separator + (word.capitalize() if capitalized else word))
+        else:
+            parts.append(" " + (word.lower() if capitalized else word))
+    return "".join(parts)
+
+
+def _defined_by(cls: type, attribute: str) -> Union[type, None]:
+    for klass in cls.__mro__:
+        if attribute in vars(klass):
+            return klass
+    return None
+
+
+@cache
+def _handler_names(cls: type, prefix: str) -> tuple:
+    """
+    Returns the names of the methods of a class that start with prefix. Methods
+    belong to the class, so the scan is done once per class rather than once
+    for every instance and copy.
+    """
+    return tuple(n for (n, v) in inspect.getmembers(cls, inspect.isfunction) if n.startswith(prefix))
+
+
+@cache
+def _batch_handler_names(cls: type) -> tuple:
+    # A batch_ handler is only used if it is at least as specific as the
+    # get_ handler for the same part; a subclass that overrides get_name()
+    # without also overriding batch_name() must not have its override skipped.
+    return tuple(
+        n
+        for n in _handler_names(cls, "batch_")
+        if issubclass(_defined_by(cls, n), _defined_by(cls, "get_" + n[len("batch_") :]) or object)
+    )
+
 
 class LanguageError(Exception):
     """
@@ -77,10 +352,291 @@ class SyllableSet(WeightedSet):
     """
 
     def random(self) -> iter:
-        for syllable in random.choices(self.members, self.weights)[0].template.split(","):
-            grapheme_template = random.choice(syllable.split("|"))
+        generator = rng()
+        for syllable in generator.choices(self.members, self.weights)[0].template.split(","):
+            grapheme_template = generator.choice(syllable.split("|"))
             yield grapheme_template.lower()
 
+    def sample(self, count: int) -> list:
+        """
+        Returns `count` random syllables at once, each as a list of grapheme templates.
+        """
+        generator = rng()
+        return [
+            [generator.choice(syllable.split("|")).lower() for syllable in member.template.split(",")]
+            for member in sample(self, count)
+        ]
+
+
+class _Shard:
+    """
+    The counters of a Metrics instance for one thread.
+    """
+
+    __slots__ = (
+        "calls",
+        "items",
+        "seconds",
+        "latency",
+        "attempts",
+        "improbable",
+        "fallbacks",
+        "cache_hits",
+        "cache_misses",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+        self.seconds = 0.0
+        self.latency = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.attempts = 0
+        self.improbable = 0
+        self.fallbacks = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def observe(self, start: float, items: int):
+        """
+        Record a call that started at perf_counter() time `start` and generated `items` words or names.
+        """
+        elapsed = perf_counter() - start
+        self.calls += 1
+        self.items += items
+        self.seconds += elapsed
+        self.latency[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+
+class Metrics:
+    """
+    Counters of the work done by a Language or a NameGenerator, cheap enough
+    to be kept all the time.
+
+    Every thread counts in its own shard, without locking, and the shards are
+    only summed when the counters are read; see language.metrics for exporting
+    them.
+
+    Counters:
+        calls        - the number of calls to word() or name()
+        items        - the number of words or names they returned
+        seconds      - the total time spent in those calls
+        latency      - a histogram of the duration of each call; see LATENCY_BUCKETS
+        attempts     - the number of candidate words checked against the rules
+        improbable   - the number of calls that raised ImprobableTemplateError
+        fallbacks    - the number of words replaced by a safe word under a Budget
+        cache_hits   - lookups of the vectorized backend that found it already built
+        cache_misses - lookups of the vectorized backend that had to build it
+
+    Usage:
+        >>> Language.word(10)
+        >>> Language.metrics.totals()["items"]
+        10
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+
+    def shard(self) -> _Shard:
+        """
+        Returns the current thread's counters.
+        """
+        try:
+            return self._local.shard
+        except AttributeError:
+            self._local.shard = _Shard()
+            self._shards.append(self._local.shard)
+            return self._local.shard
+
+    def totals(self) -> dict:
+        """
+        Returns the sum of every thread's counters.
+        """
+        totals = dict((name, 0) for name in _Shard.__slots__)
+        totals["latency"] = [0] * (len(LATENCY_BUCKETS) + 1)
+        for shard in self._shards[:]:
+            for name in _Shard.__slots__:
+                if name == "latency":
+                    totals[name] = [a + b for (a, b) in zip(totals[name], shard.latency)]
+                else:
+                    totals[name] += getattr(shard, name)
+        return totals
+
+
+class _Counters(threading.local):
+    """
+    The profiling counters of a RuleOrder, kept separately by each thread.
+    Each thread's counters are added to `shards` so that their rejections can
+    be totalled across threads.
+    """
+
+    def __init__(self, rules: tuple, shards: list):
+        self.rules = rules
+        self.samples = 0
+        self.cost = dict.fromkeys(rules, 0)
+        self.rejections = dict.fromkeys(rules, 0)
+        self.rejected = dict.fromkeys(rules, 0)
+        shards.append(self)
+
+
+class RuleOrder:
+    """
+    Evaluates a collection of rules in order of increasing expected cost.
+
+    Every word must pass every rule, so the verdict does not depend on the
+    order in which rules are checked; the time it takes does. RuleOrder
+    profiles a sample of the words it validates, running every rule against
+    them and recording how long each one takes and how often it rejects. Rules
+    are then sorted by cost per rejection, so that cheap rules that reject many
+    words run first, and expensive or permissive rules run last. The order is
+    re-tuned periodically from the profiled counters, which decay at each
+    re-tune so that the order follows recent behaviour.
+
+    All of the bookkeeping happens in profile(); the other calls to validate()
+    only count down to the next sample and run the rules in the current order,
+    which keeps them as cheap as iterating the rules directly. Each thread
+    profiles with its own counters, and a re-tune replaces the shared order in
+    one assignment, so a RuleOrder can be used by many threads at once without
+    locking; threads racing on the countdown only change which words are
+    sampled.
+
+    Usage:
+        >>> order = RuleOrder({must_have_a_vowel, too_many_consonants})
+        >>> order.validate(language, 'brrr')
+        False
+        >>> order.order
+        (<function too_many_consonants ...>, <function must_have_a_vowel ...>)
+    """
+
+    def __init__(self, rules, sample_interval: int = 64, retune_interval: int = 32):
+        """
+        Args:
+            rules           - the collection of rules callbacks to evaluate
+            sample_interval - profile one in this many calls to validate()
+            retune_interval - re-order the rules after this many profiled calls
+        """
+        self.source = rules
+        self.sample_interval = sample_interval
+        self.retune_interval = retune_interval
+        self.reset()
+
+    def reset(self):
+        # Sorting by name gives a stable starting order; iterating a set of
+        # functions directly would depend on their memory addresses.
+        self.rules = tuple(sorted(set(self.source), key=lambda rule: getattr(rule, "__name__", repr(rule))))
+        self.order = self.rules
+        self.size = len(self.source)
+        self.shards = []
+        self.counters = _Counters(self.rules, self.shards)
+        # The number of calls to validate() before the next profiled one.
+        self.countdown = 0
+
+    def validate(self, language, word: str) -> bool:
+        """
+        Returns True if the word passes all rules.
+        """
+        self.countdown -= 1
+        if self.countdown < 0:
+            return self.profile(language, word)
+        for rule in self.order:
+            if not rule(language, word):
+                return False
+        return True
+
+    def profile(self, language, word: str) -> bool:
+        """
+        Run every rule against the word, recording the cost and the verdict of each.
+        """
+        # A mutable set of rules may have been changed after it was handed to
+        # a Language; pick up any such changes.
+        if len(self.source) != self.size:
+            self.reset()
+        counters = self.counters
+        # Every word is profiled until the first re-tune; after that each
+        # profiled word stands for the sample_interval words around it.
+        warm = counters.samples >= self.retune_interval
+        weight = self.sample_interval if warm else 1
+        valid = True
+        for rule in counters.rules:
+            start = perf_counter_ns()
+            passed = rule(language, word)
+            counters.cost[rule] += perf_counter_ns() - start
+            if not passed:
+                counters.rejections[rule] += 1
+                counters.rejected[rule] += weight
+                valid = False
+        counters.samples += 1
+        if not counters.samples % self.retune_interval:
+            self.retune()
+        self.countdown = self.sample_interval - 1 if counters.samples >= self.retune_interval else 0
+        return valid
+
+    def retune(self):
+        """
+        Sort the rules by the current thread's cost per rejection and decay its counters.
+        """
+        counters = self.counters
+        if set(self.source) != set(counters.rules):
+            self.reset()
+            return
+        self.order = tuple(
+            sorted(counters.rules, key=lambda rule: counters.cost[rule] / max(counters.rejections[rule], 0.5))
+        )
+        for rule in counters.rules:
+            counters.cost[rule] //= 2
+            counters.rejections[rule] /= 2
+
+    def rejected(self) -> dict:
+        """
+        Returns the number of words each rule has rejected, by rule name, across all threads. The counts
+        are estimated from the profiled words, each of which is checked against every rule and, once the
+        order has been tuned, stands for sample_interval words; they are exact for the first words profiled.
+        """
+        totals = dict((getattr(rule, "__name__", repr(rule)), 0) for rule in self.rules)
+        for counters in self.shards[:]:
+            for rule, count in counters.rejected.items():
+                totals[getattr(rule, "__name__", repr(rule))] += count
+        return totals
+
+
+class Overlay:
+    """
+    Changes to a WeightedSet, recorded as deltas so that a dialect only stores
+    what differs from its parent language; see Language.dialect().
+
+    Usage:
+        >>> accent = Overlay(weights={"a": -0.5, "e": 0.5}, add={"å": 0.25}, remove={"y"})
+        >>> accent.apply(Language.vowels).members
+        ('a', 'e', 'i', 'o', 'u', 'å')
+    """
+
+    def __init__(self, weights: Union[dict, None] = None, add: Union[dict, None] = None, remove=()):
+        """
+        Args:
+            weights - amounts to add to the weights of existing members; members whose weight drops to 0 are removed
+            add     - new members and their weights
+            remove  - members to remove
+        """
+        self.weights = weights or {}
+        self.add = add or {}
+        self.remove = frozenset(remove)
+
+    def apply(self, weighted_set: Union[WeightedSet, None]) -> WeightedSet:
+        """
+        Returns a new WeightedSet with the changes applied to `weighted_set`, which is left unchanged.
+        """
+        members = list(weighted_set.members) if weighted_set else []
+        weights = list(weighted_set.weights) if weighted_set else []
+        for member in (set(self.weights) | self.remove) - set(members):
+            raise LanguageError(f"Cannot change {member!r}, which is not a member of the set.")
+        changed = []
+        for member, weight in zip(members, weights):
+            weight += self.weights.get(member, 0)
+            if member not in self.remove and weight > 0:
+                changed.append((member, weight))
+        changed += [(member, weight) for (member, weight) in self.add.items() if member not in members]
+        return WeightedSet(*changed)
+
 
 class Language:
     """
@@ -135,8 +691,20 @@ class Language:
         self.syllables = syllables
         self.minimum_grapheme_count = minimum_grapheme_count
         self.validate_syllable_set()
+        self._vectorized = (None, None)
+        self._safe_words = None
+        self.metrics = Metrics()
+
+        self.handlers = dict((n, getattr(self, n)) for n in _handler_names(self.__class__, "get_"))
 
-        self.handlers = dict([(n, v) for (n, v) in inspect.getmembers(self, inspect.ismethod) if n.startswith("get_")])
+    @property
+    def rules(self):
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules):
+        self._rules = rules
+        self.rule_order = RuleOrder(rules)
 
     def validate(self, word: str) -> bool:
         """
@@ -144,10 +712,7 @@ class Language:
         """
         if not word:
             return False
-        for rule in self.rules:
-            if not rule(self, word):
-                return False
-        return True
+        return self.rule_order.validate(self, word)
 
     def validate_syllable_set(self):
         for syllable in self.syllables.members:
@@ -172,34 +737,172 @@ class Language:
             last = g
         return True
 
-    def word(self, count: int = 1) -> list:
+    def word(self, count: int = 1, deadline_ms: Union[float, None] = None, attempts: Union[int, None] = None) -> list:
         """
         Yields words composed of randomized phonemes built from a random word template.
+
+        Each word is given `attempts` attempts (by default, 10) to pass the
+        language's rules. If deadline_ms is given, the words are generated
+        within a Budget of that many milliseconds: a word that runs out of time
+        or attempts is replaced with a safe word instead of raising
+        ImprobableTemplateError. See budget().
+
+        Large batches are generated by the NumPy backend, if it is available; see vectorized().
         """
+        if deadline_ms is not None or attempts is not None:
+            with budget(deadline_ms, attempts):
+                return self.word(count)
+        start = perf_counter()
+        metrics = self.metrics.shard()
+        if count >= VECTORIZE_THRESHOLD:
+            backend = self.vectorized()
+            if backend:
+                try:
+                    words = backend.words(count)
+                except ImprobableTemplateError:
+                    metrics.improbable += 1
+                    raise
+                metrics.observe(start, count)
+                return words
+        limits = _budget.get()
+        maximum = limits.attempts if limits else ATTEMPTS
         words = []
         for _ in range(count):
             random_word = ""
             attempts = 0
             while not self.validate(random_word):
-                if attempts == 10:
+                if attempts == maximum or (limits and limits.expired()):
+                    if limits and limits.fallback:
+                        metrics.fallbacks += 1
+                        random_word = rng().choice(self.safe_words())
+                        break
+                    metrics.attempts += attempts
+                    metrics.improbable += 1
                     raise ImprobableTemplateError(
                         f"Exhausted all attempts to create a valid word. Last attempt: {random_word}. "
                         "If you're getting this a lot, try enabling debugging to see what rules are failing."
                     )
-                graphemes = []
-                random_word = ""
-                while not self.validate_graphemes(graphemes):
-                    graphemes = list(self.syllables.random())
-                for grapheme in graphemes:
-                    random_word = self.add_grapheme(random_word, grapheme)
+                random_word = self.candidate()
                 attempts += 1
+            metrics.attempts += attempts
             if self.prefixes:
                 random_word = self.get_grapheme_prefix() + random_word
             if self.suffixes:
                 random_word = random_word + self.get_grapheme_suffix()
             words.append(random_word)
+        metrics.observe(start, count)
         return words
 
+    def safe_words(self) -> tuple:
+        """
+        Returns the language's reserve of valid words, used in place of words
+        that run out of time or attempts under a Budget. The reserve is
+        generated the first time it is needed, without any budget; call
+        prepare() to generate it ahead of time.
+
+        The reserve is generated from a seed of its own, so that it is the same
+        in every process, and building it doesn't change the words generated
+        after it from a seed.
+        """
+        if self._safe_words is None:
+            words = []
+            token = _budget.set(None)
+            try:
+                with seeded(f"{self.name}:safe-words"):
+                    for _ in range(SAFE_WORDS * 1000):
+                        word = self.candidate()
+                        if self.validate(word):
+                            words.append(word)
+                            if len(words) == SAFE_WORDS:
+                                break
+            finally:
+                _budget.reset(token)
+            if not words:
+                raise ImprobableTemplateError(f"Could not create any valid words in {self.name}.")
+            self._safe_words = tuple(words)
+        return self._safe_words
+
+    def prepare(self):
+        """
+        Build everything generation needs ahead of time, so that the first
+        words generated under a budget don't pay for it.
+        """
+        self.safe_words()
+        self.vectorized()
+
+    def word_at(self, seed: Union[int, str], index: int) -> str:
+        """
+        Returns the `index`-th word of the stream of words generated from
+        `seed`. The word is generated directly, in constant time, so the same
+        seed and index always produce the same word without storing it.
+
+        Usage:
+            >>> Language.word_at(seed=1234, index=1000)
+            'apsoo'
+        """
+        return generate_at(self.word, seed, index)
+
+    def candidate(self) -> str:
+        """
+        Returns a random word built from a random syllable template, before the language rules are applied.
+        """
+        graphemes = []
+        random_word = ""
+        limits = _budget.get()
+        while not self.validate_graphemes(graphemes):
+            if limits and limits.expired():
+                return ""
+            graphemes = list(self.syllables.random())
+        for grapheme in graphemes:
+            random_word = self.add_grapheme(random_word, grapheme)
+        return random_word
+
+    async def aword(self, count: int = 1, deadline_ms: Union[float, None] = None) -> list:
+        """
+        Like word(), but generates the words in a shared executor without blocking the event loop.
+        """
+        from language import aio
+
+        return await aio.generate(self.word, count, deadline_ms=deadline_ms)
+
+    async def aiter_words(self, count: Union[int, None] = None):
+        """
+        Asynchronously yields `count` words, or an unbounded stream of words if count is None.
+        """
+        from language import aio
+
+        async for word in aio.stream(self.word, count):
+            yield word
+
+    def vectorized(self):
+        """
+        Returns a VectorizedWords backend for the language as it is currently
+        configured, or None if NumPy is not installed or the language uses
+        grapheme handlers the backend does not support.
+        """
+        if _numpy() is None:
+            return None
+        key = (
+            id(self.syllables),
+            self.minimum_grapheme_count,
+            id(self.vowels),
+            id(self.consonants),
+            id(self.prefixes),
+            id(self.suffixes),
+        )
+        if self._vectorized[0] == key:
+            self.metrics.shard().cache_hits += 1
+        else:
+            self.metrics.shard().cache_misses += 1
+            from language.vectorized import UnsupportedLanguage, VectorizedWords
+
+            try:
+                self._vectorized = (key, VectorizedWords(self))
+            except UnsupportedLanguage as e:
+                logger.debug(f"Not vectorizing {self.name}: {e}")
+                self._vectorized = (key, None)
+        return self._vectorized[1]
+
     def add_grapheme(self, word: str, template: str) -> str:
         """
         Returns a random grapheme of a supported type. The class must support a method of the name:
@@ -216,39 +919,66 @@ class Language:
             )
 
     def get_grapheme_consonant(self) -> str:
-        return self.consonants.random()
+        return choice(self.consonants)
 
     def get_grapheme_vowel(self) -> str:
-        return self.vowels.random()
+        return choice(self.vowels)
 
     def get_grapheme_prefix(self) -> str:
-        return self.prefixes.random()
+        return choice(self.prefixes)
 
     def get_grapheme_suffix(self) -> str:
-        return self.suffixes.random()
+        return choice(self.suffixes)
+
+    def space(self):
+        """
+        Returns the space of every word the language can generate; see language.permute.
+
+        Usage:
+            >>> len(gnomish.Language.space())
+            2480
+        """
+        from language import permute
+
+        return permute.word_space(self)
+
+    def space_grapheme_consonant(self):
+        from language import permute
+
+        return permute.Values(self.consonants.members)
+
+    def space_grapheme_vowel(self):
+        from language import permute
+
+        return permute.Values(self.vowels.members)
+
+    def space_grapheme_prefix(self):
+        from language import permute
+
+        return permute.Values(self.prefixes.members)
+
+    def space_grapheme_suffix(self):
+        from language import permute
+
+        return permute.Values(self.suffixes.members)
 
     def text(self, count: int = 25) -> str:
-        phrases = []
-        phrase = []
-        for word in self.word(count):
-            phrase.append(str(word))
-            if len(phrase) >= random.randint(1, 12):
-                phrases.append(" ".join(phrase))
-                phrase = []
-        if phrase:
-            phrases.append(" ".join(phrase))
-
-        paragraph = phrases[0].capitalize()
-        for phrase in phrases[1:]:
-            if random.choice([0, 0, 1]):
-                paragraph = paragraph + random.choice("?!.") + " " + phrase.capitalize()
-            else:
-                paragraph = paragraph + ", " + phrase
-        paragraph = paragraph + random.choice("?!.")
-        return paragraph
+        """
+        Returns a paragraph of `count` words, broken into phrases and sentences; see text_plan().
+        """
+        words = self.word(count)
+        phrases, end = text_plan(count)
+        return stitch(words, phrases) + end
 
-    def copy(self):
-        return self.__class__(
+    def copy(self, **changes):
+        """
+        Returns a copy of the language, with any of its constructor arguments replaced by those in `changes`.
+
+        Usage:
+            >>> Language.copy(prefixes=None, suffixes=None).word()
+            ['apsoo']
+        """
+        options = dict(
             name=self.name,
             vowels=self.vowels,
             consonants=self.consonants,
@@ -258,6 +988,32 @@ class Language:
             syllables=self.syllables,
             minimum_grapheme_count=self.minimum_grapheme_count,
         )
+        options.update(changes)
+        return self.__class__(**options)
+
+    def dialect(self, name: str, add_rules=(), remove_rules=(), **overlays):
+        """
+        Returns a dialect of the language: a copy with some of its weighted sets
+        changed by Overlays, or replaced outright, and rules added or removed.
+
+        Every set that is not changed is shared with the language rather than
+        copied, as are the compiled tables of the NumPy backend for them, so a
+        dialect costs little more than the sets it changes.
+
+        Usage:
+            >>> highland = dwarvish.Language.dialect(
+            ...     "highland",
+            ...     vowels=Overlay(weights={"â": 0.5}, add={"ø": 0.2}),
+            ...     suffixes=Overlay(add={"heim": 0.3}),
+            ...     add_rules={must_end_with_a_consonant},
+            ... )
+        """
+        changes = dict(name=name)
+        for attribute, overlay in overlays.items():
+            changes[attribute] = overlay.apply(getattr(self, attribute)) if isinstance(overlay, Overlay) else overlay
+        if add_rules or remove_rules:
+            changes["rules"] = (frozenset(self.rules) | frozenset(add_rules)) - frozenset(remove_rules)
+        return self.copy(**changes)
 
     def __str__(self) -> str:
         return self.word()[0]
@@ -291,9 +1047,7 @@ class NameGenerator:
         affixes: Union[WeightedSet, None] = None,
         suffixes: Union[WeightedSet, None] = None,
     ):
-        self.language = language.copy()
-        if syllables:
-            self.language.syllables = syllables
+        self.language = language.copy(syllables=syllables) if syllables else language.copy()
         self.templates = templates
         self._names = names
         self._surnames = surnames
@@ -303,19 +1057,106 @@ class NameGenerator:
         self._counts = counts
         self._suffixes = suffixes
         self._affixes = affixes
+        self.metrics = Metrics()
 
-        self.handlers = dict([(n, v) for (n, v) in inspect.getmembers(self, inspect.ismethod) if n.startswith("get_")])
+        self.handlers = dict((n, getattr(self, n)) for n in _handler_names(self.__class__, "get_"))
+        self.batch_handlers = dict((n, getattr(self, n)) for n in _batch_handler_names(self.__class__))
 
-    def name(self, count: int = 1) -> list:
+    def name(
+        self,
+        count: int = 1,
+        deadline_ms: Union[float, None] = None,
+        attempts: Union[int, None] = None,
+        partial: bool = False,
+    ) -> list:
         """
         Generate Name instances.
+
+        Templates for all the names are chosen at once, and names sharing a
+        template are generated together: each part of the template is drawn for
+        the whole group with one call to add_parts(). Every part is still drawn
+        independently, so the names are distributed exactly as if they had been
+        generated one at a time.
+
+        If deadline_ms is given, the names are generated within a Budget of
+        that many milliseconds (see budget()); words that run out of time or
+        attempts are replaced by safe words. If partial is True, generation
+        instead stops at the deadline, and only the names completed by then
+        are returned.
+
+        Usage:
+            >>> names = elvish.NobleName.name(1000, deadline_ms=5, partial=True)
+            >>> len(names) < 1000
+            True
+        """
+        if deadline_ms is not None or attempts is not None:
+            with budget(deadline_ms, attempts):
+                return self.name(count, partial=partial)
+        start = perf_counter()
+        limits = _budget.get()
+        try:
+            if not (partial and limits and limits.deadline is not None):
+                names = self._generate(count)
+            else:
+                names = []
+                while len(names) < count and not limits.expired():
+                    names += self._generate(min(BUDGET_CHUNK, count - len(names)))
+        except ImprobableTemplateError:
+            self.metrics.shard().improbable += 1
+            raise
+        self.metrics.shard().observe(start, len(names))
+        return names
+
+    def family(self, surname: Union[str, list], count: int = 1) -> list:
         """
+        Generate `count` names sharing a surname, or with the surnames in a list
+        of one surname for each name. The first surname in each name's template
+        is the given surname, and any others are left out, so the surname
+        handlers are never called; every other part is generated as usual.
+
+        Usage:
+            >>> [name["fullname"] for name in dwarvish.Name.family("Bâsson", 2)]
+            ['Têshu Bâsson', 'Shâ Bâsson']
+        """
+        if isinstance(surname, str):
+            surname = [surname] * count
+        start = perf_counter()
+        try:
+            names = self._generate(count, surname=surname)
+        except ImprobableTemplateError:
+            self.metrics.shard().improbable += 1
+            raise
+        self.metrics.shard().observe(start, len(names))
+        return names
+
+    def _generate(self, count: int, surname: Union[list, None] = None) -> list:
+        templates = [tuple(template) for template in self.templates.sample(count)]
+        groups = defaultdict(list)
+        for index, template in enumerate(templates):
+            groups[template].append(index)
+
+        parts = [None] * count
+        for template, indices in groups.items():
+            if surname is None:
+                columns = [self.add_parts(part, len(indices)) for part in template]
+            else:
+                columns = []
+                for part in template:
+                    if part.lower() != "surname":
+                        columns.append(self.add_parts(part, len(indices)))
+                    elif any(part.lower() == "surname" for part in template[: len(columns)]):
+                        columns.append([""] * len(indices))
+                    else:
+                        columns.append([surname[index] for index in indices])
+            for row, index in enumerate(indices):
+                parts[index] = [(part, column[row]) for (part, column) in zip(template, columns)]
+
         names = []
-        for _ in range(count):
+        for name_parts in parts:
             name = Name(list)
             fullname = []
-            for part in self.templates.random():
-                thisname = self.add_part(part).strip()
+            for part, thisname in name_parts:
+                thisname = thisname.strip()
                 if not thisname:
                     continue
                 name[part].append(thisname)
@@ -324,6 +1165,76 @@ class NameGenerator:
             names.append(name)
         return names
 
+    def name_at(self, seed: Union[int, str], index: int) -> Name:
+        """
+        Returns the `index`-th name of the stream of names generated from
+        `seed`. Like Language.word_at(), every random choice made while
+        generating the name -- including those of nested generators and
+        rejected words -- is drawn from the seed of that index alone.
+
+        Usage:
+            >>> Name.name_at(seed=1234, index=1000)["fullname"]
+            'Tiny Châ Pothesadottyr'
+        """
+        return generate_at(self.name, seed, index)
+
+    async def aname(self, count: int = 1, deadline_ms: Union[float, None] = None, partial: bool = False) -> list:
+        """
+        Like name(), but generates the names in a shared executor without blocking the event loop.
+        """
+        from language import aio
+
+        if partial:
+            return await aio.generate(self.name, count, deadline_ms=deadline_ms, partial=True)
+        return await aio.generate(self.name, count, deadline_ms=deadline_ms)
+
+    async def aiter_names(self, count: Union[int, None] = None):
+        """
+        Asynchronously yields `count` names, or an unbounded stream of names if count is None.
+        """
+        from language import aio
+
+        async for name in aio.stream(self.name, count):
+            yield name
+
+    def prepare(self):
+        """
+        Prepare the language of the generator, and of any nested generators, ahead of time; see Language.prepare().
+        """
+        self.language.prepare()
+        for value in vars(self).values():
+            if isinstance(value, NameGenerator) and value is not self:
+                value.prepare()
+
+    def space(self):
+        """
+        Returns the space of every name the generator can generate, which can
+        be counted with len() and walked in a random order without repeats.
+        See language.permute.
+
+        Usage:
+            >>> space = lizardfolk.Name.space()
+            >>> len(space)
+            98000
+            >>> next(space.permute(seed=1234))["fullname"]
+            'Roasted Grapefruit Grape'
+        """
+        from language import permute
+
+        return permute.NameSpace(self)
+
+    def add_parts(self, template: str, count: int) -> list:
+        """
+        Returns `count` values for a name part. If the class supports a method of the name:
+            batch_{template}
+        it is used to generate all the values at once; otherwise add_part() is called `count` times.
+        """
+        template = template.lower()
+        handler = self.batch_handlers.get(f"batch_{template}")
+        if handler:
+            return handler(count)
+        return [self.add_part(template) for _ in range(count)]
+
     def add_part(self, template: str) -> str:
         template = template.lower()
         try:
@@ -336,34 +1247,34 @@ class NameGenerator:
             )
 
     def get_name(self) -> str:
-        name = (self._names.random() if self._names else self.language.word())[0]
+        name = (choice(self._names) if self._names else self.language.word())[0]
         return name.title()
 
     def get_surname(self) -> str:
-        name = (self._surnames.random() if self._surnames else self.language.word())[0]
+        name = (choice(self._surnames) if self._surnames else self.language.word())[0]
         if self._suffixes:
-            name = name + self._suffixes.random()
+            name = name + choice(self._suffixes)
         if len(name) == 1:
             name = f"{name}."
         return name.title()
 
     def get_adjective(self) -> str:
-        return (self._adjectives.random() if self._adjectives else "").title()
+        return (choice(self._adjectives) if self._adjectives else "").title()
 
     def get_affix(self) -> str:
-        return self._affixes.random() if self._affixes else ""
+        return choice(self._affixes) if self._affixes else ""
 
     def get_title(self) -> str:
-        return (self._titles.random() if self._titles else "").title()
+        return (choice(self._titles) if self._titles else "").title()
 
     def get_the(self) -> str:
         return "the"
 
     def get_count(self) -> str:
-        return self._counts.random() if self._counts else ""
+        return choice(self._counts) if self._counts else ""
 
     def get_nickname(self) -> str:
-        name = (self._nicknames.random() if self._nicknames else "").title()
+        name = (choice(self._nicknames) if self._nicknames else "").title()
         if name:
             return '"' + name + '"'
         return ""
@@ -371,6 +1282,88 @@ class NameGenerator:
     def get_initial(self) -> str:
         return
 
+    def batch_name(self, count: int) -> list:
+        names = [name[0] for name in sample(self._names, count)] if self._names else self.language.word(count)
+        return [name.title() for name in names]
+
+    def batch_surname(self, count: int) -> list:
+        names = [name[0] for name in sample(self._surnames, count)] if self._surnames else self.language.word(count)
+        if self._suffixes:
+            names = [name + suffix for (name, suffix) in zip(names, sample(self._suffixes, count))]
+        return [(f"{name}." if len(name) == 1 else name).title() for name in names]
+
+    def batch_adjective(self, count: int) -> list:
+        if not self._adjectives:
+            return [""] * count
+        return [adjective.title() for adjective in sample(self._adjectives, count)]
+
+    def batch_affix(self, count: int) -> list:
+        return sample(self._affixes, count) if self._affixes else [""] * count
+
+    def batch_title(self, count: int) -> list:
+        return [title.title() for title in sample(self._titles, count)] if self._titles else [""] * count
+
+    def batch_the(self, count: int) -> list:
+        return ["the"] * count
+
+    def batch_count(self, count: int) -> list:
+        return sample(self._counts, count) if self._counts else [""] * count
+
+    def batch_nickname(self, count: int) -> list:
+        if not self._nicknames:
+            return [""] * count
+        return ['"' + name.title() + '"' if name else "" for name in sample(self._nicknames, count)]
+
+    def space_name(self):
+        from language import permute
+
+        if self._names:
+            return permute.Values([name[0] for name in self._names.members], str.title)
+        return permute.Mapped(self.language.space(), str.title)
+
+    def space_surname(self):
+        from language import permute
+
+        if self._surnames:
+            names = permute.Values([name[0] for name in self._surnames.members])
+        else:
+            names = self.language.space()
+        if self._suffixes:
+            names = permute.Concatenation(names, permute.Values(self._suffixes.members))
+        return permute.Mapped(names, lambda name: (f"{name}." if len(name) == 1 else name).title())
+
+    def space_adjective(self):
+        from language import permute
+
+        return permute.Values(self._adjectives.members if self._adjectives else [""], str.title)
+
+    def space_affix(self):
+        from language import permute
+
+        return permute.Values(self._affixes.members if self._affixes else [""])
+
+    def space_title(self):
+        from language import permute
+
+        return permute.Values(self._titles.members if self._titles else [""], str.title)
+
+    def space_the(self):
+        from language import permute
+
+        return permute.Values(["the"])
+
+    def space_count(self):
+        from language import permute
+
+        return permute.Values(self._counts.members if self._counts else [""])
+
+    def space_nickname(self):
+        from language import permute
+
+        return permute.Values(
+            self._nicknames.members if self._nicknames else [""], lambda name: f'"{name.title()}"' if name else ""
+        )
+
     def __str__(self) -> str:
         return self.name()[0]["fullname"]
 
@@ -0,0 +1,207 @@
+"""
+A NumPy backend for generating large numbers of words at once.
+
+Words are generated in the same way as Language.word() generates them --
+choose a syllable template, choose one grapheme type for each slot in the
+template, reject sequences that fail Language.validate_graphemes(), fill each
+slot with a random grapheme of its type and reject words that fail the
+language's rules -- but every step is performed for thousands of candidate
+words at a time on NumPy arrays. Python strings are only built for candidates
+whose grapheme sequences are valid.
+
+Each candidate is drawn independently from the same distributions as the
+pure-Python path, so the words produced are distributed identically.
+
+Language.word() uses this backend automatically when NumPy is installed, the
+requested count is large enough, and the language only uses the standard
+vowel and consonant grapheme handlers.
+"""
+import weakref
+
+import numpy
+
+from language import types
+
+# The attributes holding the WeightedSet for each grapheme type the backend supports.
+GRAPHEMES = {
+    "vowel": "vowels",
+    "consonant": "consonants",
+}
+
+
+class UnsupportedLanguage(Exception):
+    """
+    Thrown when a language defines graphemes that cannot be vectorized.
+    """
+
+
+# The compiled Graphemes and Templates of each set, shared by every language using the set, such as dialects.
+_graphemes = weakref.WeakKeyDictionary()
+_templates = weakref.WeakKeyDictionary()
+
+
+def compiled(cache: weakref.WeakKeyDictionary, weighted_set, compile):
+    """
+    Returns compile(weighted_set), compiling each set only once for as long as it exists.
+    """
+    try:
+        return cache[weighted_set]
+    except KeyError:
+        pass
+    except TypeError:  # pragma: no cover
+        return compile(weighted_set)
+    cache[weighted_set] = value = compile(weighted_set)
+    return value
+
+
+class Graphemes:
+    """
+    A WeightedSet compiled to arrays, for drawing many graphemes at once.
+    """
+
+    def __init__(self, weighted_set: types.WeightedSet):
+        self.members = numpy.array(list(weighted_set.members), dtype=object)
+        weights = numpy.asarray(weighted_set.weights, dtype=float)
+        self.p = weights / weights.sum()
+
+    def sample(self, rng: numpy.random.Generator, count: int) -> numpy.ndarray:
+        return self.members[rng.choice(len(self.p), size=count, p=self.p)]
+
+
+class Templates:
+    """
+    A SyllableSet compiled to arrays, for drawing many grapheme sequences at once.
+    """
+
+    def __init__(self, syllables: types.SyllableSet):
+        templates = [
+            [[grapheme.lower() for grapheme in syllable.split("|")] for syllable in member.template.split(",")]
+            for member in syllables.members
+        ]
+        self.names = sorted({grapheme for template in templates for slot in template for grapheme in slot})
+
+        weights = numpy.asarray(syllables.weights, dtype=float)
+        self.p = weights / weights.sum()
+        self.width = max(len(template) for template in templates)
+        depth = max(len(slot) for template in templates for slot in template)
+
+        # alternatives[t, s, a] is the grapheme type of the a-th alternative in
+        # slot s of template t; choices[t, s] is the number of alternatives.
+        # Unused slots have no alternatives, and are given the type -1.
+        self.alternatives = numpy.full((len(templates), self.width, depth), -1, dtype=numpy.int16)
+        self.choices = numpy.zeros((len(templates), self.width), dtype=numpy.int16)
+        self.lengths = numpy.array([len(template) for template in templates])
+        for t, template in enumerate(templates):
+            for s, slot in enumerate(template):
+                self.choices[t, s] = len(slot)
+                for a, name in enumerate(slot):
+                    self.alternatives[t, s, a] = self.names.index(name)
+
+
+class VectorizedWords:
+    """
+    Generates words for a language using NumPy.
+
+    Usage:
+        >>> backend = VectorizedWords(language)
+        >>> backend.words(3)
+        ['apsoo', 'nirtoet', 'eelom']
+    """
+
+    def __init__(self, language: types.Language):
+        self.language = language
+        cls = language.__class__
+        for method in ("word", "candidate", "add_grapheme"):
+            if types._defined_by(cls, method) is not types.Language:
+                raise UnsupportedLanguage(f"{cls.__name__} overrides {method}().")
+
+        self.templates = compiled(_templates, language.syllables, Templates)
+        for name in self.templates.names:
+            handler = f"get_grapheme_{name}"
+            if name not in GRAPHEMES or types._defined_by(cls, handler) is not types.Language:
+                raise UnsupportedLanguage(f"Cannot vectorize the grapheme handler {handler}().")
+        self.graphemes = [
+            compiled(_graphemes, getattr(language, GRAPHEMES[name]), Graphemes) for name in self.templates.names
+        ]
+        self.template_p = self.templates.p
+        self.width = self.templates.width
+        self.alternatives = self.templates.alternatives
+        self.choices = self.templates.choices
+        self.lengths = self.templates.lengths
+
+        self.prefixes = compiled(_graphemes, language.prefixes, Graphemes) if language.prefixes else None
+        self.suffixes = compiled(_graphemes, language.suffixes, Graphemes) if language.suffixes else None
+
+    def sequences(self, rng: numpy.random.Generator, count: int) -> numpy.ndarray:
+        """
+        Returns a (count, width) array of grapheme types which pass Language.validate_graphemes().
+        """
+        sequences = numpy.empty((count, self.width), dtype=numpy.int16)
+        pending = numpy.arange(count)
+        slots = numpy.arange(self.width)
+        while len(pending):
+            template = rng.choice(len(self.template_p), size=len(pending), p=self.template_p)
+            choices = self.choices[template]
+            alternative = (rng.random(choices.shape) * choices).astype(numpy.int16)
+            candidates = self.alternatives[template[:, None], slots[None, :], alternative]
+
+            valid = self.lengths[template] >= self.language.minimum_grapheme_count
+            if self.width >= 3:
+                first, second, third = candidates[:, :-2], candidates[:, 1:-1], candidates[:, 2:]
+                valid &= ~((first == second) & (second == third) & (first >= 0)).any(axis=1)
+
+            sequences[pending[valid]] = candidates[valid]
+            pending = pending[~valid]
+        return sequences
+
+    def candidates(self, rng: numpy.random.Generator, count: int) -> list:
+        """
+        Returns `count` candidate words, before the language rules have been applied.
+        """
+        sequences = self.sequences(rng, count)
+        graphemes = numpy.full(sequences.shape, "", dtype=object)
+        for index, grapheme in enumerate(self.graphemes):
+            mask = sequences == index
+            graphemes[mask] = grapheme.sample(rng, int(mask.sum()))
+        return ["".join(row) for row in graphemes.tolist()]
+
+    def words(self, count: int = 1) -> list:
+        """
+        Returns `count` words which pass all the language's rules.
+        """
+        # Seed from the thread's generator so that random.seed() still makes the output reproducible.
+        rng = numpy.random.default_rng(types.rng().getrandbits(64))
+        validate = self.language.validate
+        limits = types.current_budget()
+        maximum = limits.attempts if limits else types.ATTEMPTS
+        metrics = self.language.metrics.shard()
+
+        words = [None] * count
+        attempts = numpy.zeros(count, dtype=numpy.int16)
+        pending = numpy.arange(count)
+        while len(pending):
+            candidates = self.candidates(rng, len(pending))
+            metrics.attempts += len(candidates)
+            valid = numpy.fromiter((validate(word) for word in candidates), dtype=bool, count=len(candidates))
+            for index, word in zip(pending[valid].tolist(), (w for (w, v) in zip(candidates, valid) if v)):
+                words[index] = word
+            pending = pending[~valid]
+            attempts[pending] += 1
+            if len(pending) and (attempts[pending].max() >= maximum or (limits and limits.expired())):
+                if limits and limits.fallback:
+                    metrics.fallbacks += len(pending)
+                    safe = self.language.safe_words()
+                    for index, choice in zip(pending.tolist(), rng.integers(len(safe), size=len(pending)).tolist()):
+                        words[index] = safe[choice]
+                    break
+                raise types.ImprobableTemplateError(
+                    "Exhausted all attempts to create a valid word. "
+                    f"Last attempt: {candidates[int(numpy.flatnonzero(~valid)[-1])]}. "
+                    "If you're getting this a lot, try enabling debugging to see what rules are failing."
+                )
+
+        if self.prefixes:
+            words = [prefix + word for (prefix, word) in zip(self.prefixes.sample(rng, count).tolist(), words)]
+        if self.suffixes:
+            words = [word + suffix for (word, suffix) in zip(words, self.suffixes.sample(rng, count).tolist())]
+        return words
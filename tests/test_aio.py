@@ -0,0 +1,54 @@
+import asyncio
+
+from language import aio
+from language.languages import common, elvish, gnomish
+
+
+def test_chunker_adapts_to_the_target_latency():
+    chunker = aio.Chunker(target=0.005, maximum=100)
+    chunker.record(count=1, elapsed=0.0001)
+    assert chunker.size == 25
+    chunker.record(count=25, elapsed=0)
+    assert chunker.size == 62
+    chunker.record(count=100, elapsed=10)
+    assert chunker.size == 31
+
+
+def test_concurrent_requests_each_get_their_own_results():
+    async def main():
+        return await asyncio.gather(*[elvish.Name.aname(count) for count in (1, 5, 50, 3)])
+
+    results = asyncio.run(main())
+    assert [len(names) for names in results] == [1, 5, 50, 3]
+    assert all(name["fullname"] for names in results for name in names)
+
+
+def test_words_that_run_out_of_attempts_fail_no_request():
+    # Without a budget, one of the thousands of Common names in the shared batch fails every request.
+    async def main():
+        return await asyncio.gather(*[common.Name.aname(1) for _ in range(2000)], return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert [type(result) for result in results] == [list] * 2000
+
+
+def test_deadlines_and_streams():
+    async def main():
+        words = await gnomish.Language.aword(20, deadline_ms=1000)
+        streamed = [word async for word in gnomish.Language.aiter_words(75)]
+        names = [name async for name in elvish.Name.aiter_names(30)]
+        return words, streamed, names
+
+    words, streamed, names = asyncio.run(main())
+    assert len(words) == 20 and len(streamed) == 75 and len(names) == 30
+    assert all(isinstance(word, str) and word for word in words + streamed)
+
+
+def test_errors_reach_every_request():
+    def fail(count):
+        raise ValueError("no names")
+
+    async def main():
+        return await asyncio.gather(aio.generate(fail, 1), aio.generate(fail, 2), return_exceptions=True)
+
+    assert [type(result) for result in asyncio.run(main())] == [ValueError, ValueError]
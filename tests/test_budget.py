@@ -0,0 +1,72 @@
+import pytest
+
+from language import types
+from language.languages import common, elvish
+
+
+def bare(language):
+    """
+    The language without prefixes and suffixes, whose words are exactly those that pass its rules.
+    """
+    return language.copy(prefixes=None, suffixes=None)
+
+
+def fallbacks(language):
+    return language.metrics.totals()["fallbacks"]
+
+
+@pytest.mark.parametrize("count", [100, types.VECTORIZE_THRESHOLD])
+def test_words_that_run_out_of_attempts_are_safe_words(count):
+    language = bare(common.Language)
+    before = fallbacks(language)
+    with types.seeded(1234), types.budget(attempts=1):
+        words = language.word(count)
+    assert len(words) == count
+    assert fallbacks(language) > before
+    assert all(language.validate(word) for word in words)
+
+
+@pytest.mark.parametrize("count", [100, types.VECTORIZE_THRESHOLD])
+def test_expired_budgets_stop_making_attempts(count):
+    language = bare(common.Language)
+    before = language.metrics.totals()["attempts"]
+    with types.seeded(1234), types.budget(deadline_ms=0):
+        words = language.word(count)
+    # The Python backend makes no attempts at all; the NumPy backend makes one for every word at once.
+    assert language.metrics.totals()["attempts"] - before <= count
+    assert all(language.validate(word) for word in words)
+
+
+def test_without_fallback_running_out_raises():
+    with types.seeded(1234), pytest.raises(types.ImprobableTemplateError):
+        with types.budget(attempts=1, fallback=False):
+            common.Language.word(100)
+
+
+def test_budgets_are_deterministic():
+    with types.seeded(1234), types.budget(attempts=1):
+        words = common.Language.word(100)
+    with types.seeded(1234):
+        assert common.Language.word(100, attempts=1) == words
+
+
+def test_nested_budgets_only_bring_the_deadline_forward():
+    with types.budget(deadline_ms=10) as outer:
+        with types.budget(deadline_ms=60000) as inner:
+            assert inner.deadline == outer.deadline
+            assert types.current_budget() is inner
+        with types.budget(attempts=3) as inner:
+            assert inner.deadline == outer.deadline and inner.attempts == 3
+        assert types.current_budget() is outer
+    assert types.current_budget() is None
+
+
+def test_safe_words_do_not_depend_on_when_they_are_built():
+    language = elvish.Language.copy(name=elvish.Language.name)
+    with types.seeded(1234):
+        before = language.word(20)
+    with types.seeded(1234):
+        safe = language.safe_words()
+        assert language.word(20) == before
+    assert safe == elvish.Language.safe_words()
+    assert all(language.validate(word) for word in safe)
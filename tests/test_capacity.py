@@ -0,0 +1,47 @@
+import math
+
+import pytest
+from typer.testing import CliRunner
+
+from language import capacity, types
+from language.cli import app
+from language.languages import gnomish
+
+
+def generator(templates, titles=("sir", "lady")):
+    return types.NameGenerator(
+        language=gnomish.Language,
+        titles=types.equal_weights(titles, 1.0, blank=False),
+        nicknames=types.equal_weights(["the bold", "the quick", "the red"], 1.0, blank=False),
+        templates=types.NameSet(*((types.NameTemplate(template), 1.0) for template in templates)),
+    )
+
+
+def test_equally_likely_names():
+    estimate = capacity.Estimator(generator(["title,nickname"])).estimate()
+    assert estimate.entropy == pytest.approx(math.log2(6))
+    assert estimate.collision == pytest.approx(1 / 6)
+    assert estimate.effective == pytest.approx(6)
+    assert estimate.error == 0
+    assert estimate.templates[0][2].method == "exact"
+
+
+def test_blank_parts_are_the_same_names_as_shorter_templates():
+    # "sir <nickname>" has probability 1/12; a blank title gives the same names as the
+    # second template, so each bare nickname has probability 1/12 + 1/6 = 1/4.
+    estimate = capacity.Estimator(generator(["title,nickname", "nickname"], titles=("sir", ""))).estimate()
+    assert estimate.collision == pytest.approx(3 / 12**2 + 3 / 4**2)
+    assert estimate.entropy == pytest.approx(3 / 12 * math.log2(12) + 3 / 4 * math.log2(4))
+
+
+def test_birthday_curve():
+    estimate = capacity.Estimator(generator(["title,nickname"])).estimate()
+    assert estimate.duplicate_pairs(4) == pytest.approx(1)
+    assert estimate.any_duplicate(4) == pytest.approx(1 - math.exp(-1))
+    assert estimate.population_at(0.5) == math.ceil(math.sqrt(2 * math.log(2) * 6) + 0.5) == 4
+
+
+def test_capacity_of_another_language():
+    result = CliRunner().invoke(app, ["capacity", "--language", "gnomish", "--samples", "200"])
+    assert result.exit_code == 0, result.output
+    assert "Effective names:" in result.output
@@ -0,0 +1,39 @@
+import pytest
+
+from language import corpus, types
+from language.languages import common, elvish
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    monkeypatch.setattr(corpus, "BATCH_SIZE", 100)
+
+
+def test_same_seed_writes_the_same_file(tmp_path):
+    corpus.write(elvish.NobleName, tmp_path / "a.fnc", count=250, seed=1234)
+    corpus.write(elvish.NobleName, tmp_path / "b.fnc", count=250, seed=1234)
+    assert (tmp_path / "a.fnc").read_bytes() == (tmp_path / "b.fnc").read_bytes()
+
+
+def test_round_trip(tmp_path):
+    header = corpus.write(elvish.Name, tmp_path / "elvish.fnc", count=250, seed=1234, metadata={"language": "elvish"})
+    expected = []
+    for index in range(3):
+        with types.seeded(types.derive_seed(1234, index)), types.budget():
+            expected += elvish.Name.name(min(100, 250 - index * 100))
+    with corpus.Corpus(tmp_path / "elvish.fnc") as names:
+        assert names.header == header
+        assert names.header["language"] == "elvish"
+        assert len(names) == 250
+        assert [names.fullname(i) for i in range(250)] == [name["fullname"] for name in expected]
+        assert names[17] == expected[17]
+        assert names[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            names[250]
+
+
+def test_languages_with_improbable_words_finish(tmp_path):
+    corpus.write(common.Name, tmp_path / "common.fnc", count=300, seed=5)
+    with corpus.Corpus(tmp_path / "common.fnc") as names:
+        assert len(names) == 300
+        assert all(names.fullname(i) for i in range(300))
@@ -0,0 +1,67 @@
+import pytest
+
+from language import types, vectorized
+from language.languages import gnomish
+from language.rules import too_many_vowels
+
+
+def must_end_with_a_vowel(language, word):
+    return word[-1] in language.vowels.members
+
+
+def test_overlay_changes_a_copy_of_the_set():
+    vowels = types.WeightedSet(("a", 1.0), ("e", 1.0), ("i", 1.0), ("y", 0.5))
+    accent = types.Overlay(weights={"a": -1.0, "e": 0.5}, add={"å": 0.25, "e": 3.0}, remove={"y"})
+    changed = accent.apply(vowels)
+    assert list(zip(changed.members, changed.weights)) == [("e", 1.5), ("i", 1.0), ("å", 0.25)]
+    assert vowels.members == ("a", "e", "i", "y")
+
+
+@pytest.mark.parametrize("overlay", [types.Overlay(weights={"ø": 1.0}), types.Overlay(remove={"ø"})])
+def test_overlay_rejects_unknown_members(overlay):
+    with pytest.raises(types.LanguageError):
+        overlay.apply(gnomish.Language.vowels)
+
+
+def test_dialect_shares_the_sets_it_does_not_change():
+    language = gnomish.Language
+    dialect = language.dialect("deep", vowels=types.Overlay(add={"ö": 0.5}))
+    assert dialect.name == "deep"
+    assert dialect.vowels is not language.vowels
+    assert "ö" in dialect.vowels.members and "ö" not in language.vowels.members
+    for attribute in ("consonants", "prefixes", "suffixes", "syllables", "rules"):
+        assert getattr(dialect, attribute) is getattr(language, attribute)
+
+
+def test_dialect_shares_compiled_tables():
+    language = gnomish.Language
+    dialect = language.dialect("deep", vowels=types.Overlay(add={"ö": 0.5}))
+    shared, own = language.vectorized(), dialect.vectorized()
+    if shared is None:
+        pytest.skip("NumPy is not installed.")
+    assert own.templates is shared.templates
+    assert own.suffixes is shared.suffixes
+    names = own.templates.names
+    for name, table, base in zip(names, own.graphemes, shared.graphemes):
+        assert (table is base) == (vectorized.GRAPHEMES[name] != "vowels")
+
+
+def test_dialect_rules():
+    language = gnomish.Language
+    dialect = language.dialect("deep", suffixes=None, add_rules={must_end_with_a_vowel}, remove_rules={too_many_vowels})
+    assert must_end_with_a_vowel in dialect.rules and must_end_with_a_vowel not in language.rules
+    assert too_many_vowels not in dialect.rules and too_many_vowels in language.rules
+    with types.seeded(1234), types.budget():
+        words = dialect.word(200)
+    assert all(must_end_with_a_vowel(dialect, word) for word in words)
+
+
+def test_dialect_leaves_the_language_unchanged():
+    language = gnomish.Language
+    with types.seeded(1234):
+        before = language.word(50) + language.word(500)
+    dialect = language.dialect("deep", vowels=types.Overlay(weights={"a": 2.0}), add_rules={must_end_with_a_vowel})
+    with types.seeded(1234), types.budget():
+        dialect.word(500)
+    with types.seeded(1234):
+        assert language.word(50) + language.word(500) == before
@@ -0,0 +1,21 @@
+import pytest
+
+import language
+from language import equivalence, types
+
+# A small sample per language keeps the test quick; `python -m language.equivalence` runs the full check.
+SAMPLES = 400
+
+pack, languages = language.load_language_pack(lazy=True)
+
+
+@pytest.mark.parametrize("name", sorted(languages))
+def test_batched_engines_are_equivalent(name):
+    module = languages[name]
+    with types.seeded(f"equivalence:{name}"):
+        reports = [equivalence.compare_words(module.Language, samples=SAMPLES)]
+        reports.append(equivalence.compare_names(module.Name, samples=SAMPLES))
+        if module.NobleName is not module.Name:
+            reports.append(equivalence.compare_names(module.NobleName, samples=SAMPLES))
+    for report in reports:
+        assert report.passed(), f"{report.name}: {report.failures(equivalence.ALPHA / len(report.tests))}"
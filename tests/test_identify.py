@@ -0,0 +1,56 @@
+import pytest
+
+from language import identify, types
+from language.languages import dwarvish, elvish, gnomish, lizardfolk
+
+LANGUAGES = dict(dwarvish=dwarvish, elvish=elvish, gnomish=gnomish, lizardfolk=lizardfolk)
+
+
+@pytest.fixture(scope="module")
+def identifier():
+    return identify.Identifier(LANGUAGES)
+
+
+@pytest.mark.parametrize("language", LANGUAGES)
+def test_words_are_identified_as_their_language(identifier, language):
+    with types.seeded(1234):
+        words = LANGUAGES[language].Language.word(100)
+    results = [identifier.identify(word) for word in words]
+    assert all(result.plausible[language] == 1.0 for result in results)
+    assert sum(result.language == language for result in results) >= 95
+
+
+def test_identification_is_deterministic(identifier):
+    with types.seeded(1234):
+        names = [name["fullname"] for name in elvish.Name.name(20)]
+    first = [str(identifier.identify(name)) for name in names]
+    assert first == [str(identify.Identifier(LANGUAGES).identify(name)) for name in names]
+
+
+def test_identify_stream_keeps_the_order_of_lines(identifier):
+    with types.seeded(1234):
+        lines = [word for module in LANGUAGES.values() for word in module.Language.word(10)]
+    results = list(identify.identify_stream(lines, languages=LANGUAGES, processes=1, batch_size=7))
+    assert [result.text for result in results] == lines
+    assert [result.language for result in results] == [identifier.identify(line).language for line in lines]
+
+
+def test_empty_strings_have_no_language(identifier):
+    result = identifier.identify("   ")
+    assert result.language is None and result.scores == {}
+
+
+def test_identify_stream_uses_the_languages_it_is_given():
+    line = "Tiny Châ Pothesadottyr"
+    first = next(identify.identify_stream([line], languages=dict(elvish=elvish, gnomish=gnomish), processes=1))
+    assert set(first.scores) == {"elvish", "gnomish"}
+    second = next(identify.identify_stream([line], languages=dict(dwarvish=dwarvish), processes=1))
+    assert set(second.scores) == {"dwarvish"}
+
+
+def test_identify_stream_workers_use_the_same_languages():
+    lines = ["Tiny Châ Pothesadottyr", "Floral Maple Syrup"] * 3
+    results = list(identify.identify_stream(lines, languages=dict(dwarvish=dwarvish), processes=2, batch_size=2))
+    assert all(set(result.scores) == {"dwarvish"} for result in results)
+    identifier = identify.Identifier(dict(dwarvish=dwarvish))
+    assert [str(result) for result in results] == [str(identifier.identify(line)) for line in lines]
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+import threading
+from types import ModuleType
+
+import pytest
+
+from language import lazy, types
+
+
+def fresh(code: str) -> str:
+    """
+    Run code in a new interpreter, in which nothing has been imported yet.
+    """
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def test_generators_are_built_on_first_use():
+    output = fresh(
+        "import sys\n"
+        "from language.languages import elvish\n"
+        "print('language.languages.elvish.names' in sys.modules, 'Name' in vars(elvish))\n"
+        "name = elvish.Name\n"
+        "print('language.languages.elvish.names' in sys.modules, elvish.Name is name, elvish.NobleName is not name)\n"
+    )
+    assert output.split() == ["False", "False", "True", "True", "True"]
+
+
+def test_default_tables_are_built_on_first_use():
+    output = fresh(
+        "from language import defaults\n"
+        "print('vowels' in vars(defaults))\n"
+        "vowels = defaults.vowels\n"
+        "print(defaults.vowels is vowels, 'vowels' in vars(defaults), 'titles' in vars(defaults))\n"
+    )
+    assert output.split() == ["False", "True", "True", "False"]
+
+
+def module(**factories):
+    namespace = ModuleType("example")
+    namespace.__getattr__ = lazy(vars(namespace), **factories)
+    return namespace
+
+
+def test_unknown_attributes():
+    example = module(Name=list)
+    with pytest.raises(AttributeError):
+        example.Surname
+
+
+def test_attributes_are_built_once_across_threads():
+    built = []
+    barrier = threading.Barrier(8)
+
+    def factory():
+        built.append(None)
+        return types.WeightedSet(("a", 1.0))
+
+    example = module(vowels=factory)
+    results = [None] * 8
+
+    def target(index):
+        barrier.wait()
+        results[index] = example.vowels
+
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,91 @@
+import pytest
+
+from language import loadtest
+
+
+def test_percentile():
+    latencies = list(range(1, 101))
+    assert [loadtest.percentile(latencies, percent) for percent in (0, 1, 50, 90, 99.9, 100)] == [
+        1,
+        1,
+        50,
+        90,
+        100,
+        100,
+    ]
+    assert loadtest.percentile([7], 50) == 7
+
+
+def test_summarize():
+    results = [("a", 0.001 * n, "ok") for n in range(1, 9)] + [("a", 0.5, "HTTP 500"), ("a", 0.01, "OSError")]
+    summary = loadtest.summarize(results, elapsed=2.0)
+    assert summary["requests"] == 10 and summary["throughput"] == 5.0
+    assert summary["errors"] == 2 and summary["error_rate"] == 0.2
+    assert summary["error_kinds"] == {"HTTP 500": 1, "OSError": 1}
+    assert summary["latency_ms"]["p50"] == pytest.approx(5.0)
+    assert summary["latency_ms"]["max"] == pytest.approx(500.0)
+    assert loadtest.summarize([], elapsed=0) == dict(
+        requests=0, throughput=0.0, errors=0, error_rate=0.0, error_kinds={}, latency_ms={}
+    )
+
+
+def report(throughput, p50, label="", concurrency=16):
+    summary = dict(
+        requests=100,
+        throughput=throughput,
+        errors=0,
+        error_rate=0.0,
+        error_kinds={},
+        latency_ms=dict(p50=p50, p90=2 * p50, p99=3 * p50, **{"p99.9": 4 * p50}, max=5 * p50),
+    )
+    return dict(
+        label=label,
+        versions=dict(package="0.1", python="CPython 3.11.7", pack_hash="0123456789abcdef"),
+        config=dict(concurrency=concurrency),
+        total=summary,
+        requests={"elvish:names": summary},
+    )
+
+
+def test_compare():
+    lines = loadtest.compare(report(150.0, 40.0), report(100.0, 50.0, label="v1")).splitlines()
+    assert lines[0] == "Compared with v1 (0.1, CPython 3.11.7):"
+    assert lines[1].split() == ["elvish:names", "req/s", "+50.0%", "errors", "+0.00%"] + [
+        word for key in ("p50", "p90", "p99", "p99.9") for word in (key, "-20.0%")
+    ]
+    assert lines[2].split()[0] == "total"
+    unlabelled = loadtest.compare(report(100.0, 50.0), report(100.0, 50.0, concurrency=4))
+    assert unlabelled.splitlines()[:2] == [
+        "Compared with 01234567 (0.1, CPython 3.11.7):",
+        "  (warning: the tests were run with different settings)",
+    ]
+
+
+def test_format_report():
+    lines = loadtest.format_report(report(100.0, 50.0)).splitlines()
+    assert lines[0].split() == ["request", "requests", "req/s", "errors", "p50", "p90", "p99", "p99.9", "max"]
+    assert lines[1].split() == [
+        "elvish:names",
+        "100",
+        "100.0",
+        "0.00%",
+        "50.0ms",
+        "100.0ms",
+        "150.0ms",
+        "200.0ms",
+        "250.0ms",
+    ]
+
+
+def test_parse_mix():
+    requests = loadtest.parse_mix("common,elvish:noble:0.2,celestial:text:0.1", count=2, words=5)
+    assert [(request.label, request.weight) for request in requests] == [
+        ("common:names", 1.0),
+        ("elvish:noble", 0.2),
+        ("celestial:text", 0.1),
+    ]
+    assert requests[1].target == "/names?language=elvish&count=2&noble=1"
+    assert requests[2].target == "/text?language=celestial&words=5"
+    for mix in ("common:poems", "common:names:lots", "common:names:0"):
+        with pytest.raises(ValueError):
+            loadtest.parse_mix(mix)
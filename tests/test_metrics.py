@@ -0,0 +1,103 @@
+import json
+import re
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+
+from language import metrics, types
+from language.languages import gnomish
+
+SAMPLE = re.compile(r'^(\w+)\{((?:\w+="(?:[^"\\]|\\.)*",?)*)\} (\S+)$')
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse(text: str) -> dict:
+    """
+    Parse the Prometheus text format into {(metric, labels): value}, checking that every metric is declared.
+    """
+    declared = set()
+    values = {}
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            continue
+        if line.startswith("# TYPE "):
+            name, kind = line.split()[2:]
+            assert kind in ("counter", "histogram")
+            declared.add(name)
+            continue
+        name, labels, value = SAMPLE.match(line).groups()
+        assert re.sub(r"_(bucket|sum|count)$", "", name) in declared, name
+        values[(name, frozenset(LABEL.findall(labels)))] = float(value)
+    return values
+
+
+def labels(component: str, kind: str, **extra) -> frozenset:
+    return frozenset(dict(language="test", component=component, kind=kind, **extra).items())
+
+
+@pytest.fixture
+def languages():
+    # A fresh language and generator, so that no other test's calls are counted.
+    language = gnomish.Language.copy(name="test")
+    generator = types.NameGenerator(
+        language=language, templates=types.NameSet((types.NameTemplate("name,surname"), 1.0))
+    )
+    return {"test": SimpleNamespace(Language=language, Name=generator)}
+
+
+def generate(languages):
+    for count in (100, 100, 50):
+        languages["test"].Name.name(count)
+    languages["test"].Language.word(10)
+
+
+def test_collect_counts_what_was_generated(languages):
+    generate(languages)
+    samples = dict(((s["component"], s["kind"]), s) for s in metrics.collect(languages))
+    assert samples[("Name", "names")]["items"] == 250
+    assert samples[("Name", "names")]["calls"] == 3
+    # The generator's copy of the language draws a name and a surname for each name.
+    assert samples[("Name", "words")]["items"] == 500
+    assert samples[("Language", "words")]["items"] == 10
+    assert samples[("Language", "words")]["attempts"] >= 10
+    assert set(samples[("Language", "words")]["rejections"]) == {
+        getattr(rule, "__name__", repr(rule)) for rule in languages["test"].Language.rules
+    }
+
+
+def test_prometheus_output_parses(languages):
+    generate(languages)
+    values = parse(metrics.prometheus(metrics.collect(languages)))
+    assert values[("fanlang_generated_total", labels("Name", "names"))] == 250
+    assert values[("fanlang_generated_total", labels("Name", "words"))] == 500
+    assert values[("fanlang_calls_total", labels("Name", "names"))] == 3
+
+    buckets = sorted(
+        (float(dict(key)["le"]), value)
+        for ((name, key), value) in values.items()
+        if name == "fanlang_generation_seconds_bucket" and labels("Name", "names") < key
+    )
+    assert [count for (bound, count) in buckets] == sorted(count for (bound, count) in buckets)
+    assert buckets[-1] == (float("inf"), 3)
+    assert values[("fanlang_generation_seconds_count", labels("Name", "names"))] == 3
+
+
+def test_labels_are_escaped():
+    sample = dict(language='a "quoted"\\name', component="Name", kind="names")
+    assert metrics._labels(sample) == '{language="a \\"quoted\\"\\\\name",component="Name",kind="names"}'
+
+
+def test_served_metrics(languages):
+    generate(languages)
+    server = metrics.serve(languages, port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            values = parse(response.read().decode("utf-8"))
+        assert values[("fanlang_generated_total", labels("Name", "names"))] == 250
+        with urllib.request.urlopen(f"{url}/metrics.json") as response:
+            summary = dict(((s["component"], s["kind"]), s) for s in json.loads(response.read()))
+        assert summary[("Name", "names")]["generated"] == 250
+    finally:
+        server.shutdown()
@@ -0,0 +1,55 @@
+from collections import Counter
+
+import pytest
+
+from language import types
+from language.languages import gnomish
+
+
+def weighted(*members):
+    return types.WeightedSet(*((member, float(weight)) for (weight, member) in enumerate(members, start=1)))
+
+
+def generator(*templates):
+    return types.NameGenerator(
+        language=gnomish.Language,
+        templates=types.NameSet(*((types.NameTemplate(template), float(weight)) for (template, weight) in templates)),
+        surnames=weighted(("ash",), ("oak",)),
+        suffixes=weighted("en", "ward"),
+        adjectives=weighted("tall", "short"),
+        titles=weighted("sir", "lady", ""),
+        counts=weighted("I", "II"),
+        affixes=weighted("of", "von"),
+        nicknames=weighted("bold", "quick"),
+    )
+
+
+@pytest.mark.parametrize("part", ["name", "adjective", "affix", "title", "the", "count", "nickname"])
+def test_batch_handlers_draw_what_get_handlers_draw(part):
+    # Each of these parts is one draw, so a batch is the same as drawing one value at a time.
+    names = generator(("name", 1))
+    with types.seeded(1234):
+        batch = names.add_parts(part, 100)
+    with types.seeded(1234):
+        assert batch == [names.add_part(part) for _ in range(100)]
+
+
+def test_grouped_names_are_distributed_as_names_generated_one_at_a_time():
+    names = generator(("title,surname,count", 1), ("adjective,surname,nickname", 2), ("the,affix,surname", 1))
+    with types.seeded(1234):
+        grouped = Counter(name["fullname"] for name in names.name(20000))
+    with types.seeded(4321):
+        single = Counter(names.name(1)[0]["fullname"] for _ in range(20000))
+    assert set(grouped) == set(single)
+    assert all(abs(grouped[name] - single[name]) / 20000 < 0.01 for name in grouped)
+
+
+def test_grouped_names_keep_the_parts_of_their_templates():
+    names = generator(("title,surname,count", 1), ("adjective,surname,nickname", 2))
+    with types.seeded(1234):
+        for name in names.name(1000):
+            parts = [
+                " ".join(name[part]) for part in ("title", "adjective", "surname", "count", "nickname") if part in name
+            ]
+            assert " ".join(parts) == name["fullname"]
+            assert ("count" in name) != ("adjective" in name)
@@ -0,0 +1,75 @@
+import importlib
+
+import pytest
+
+from language import ngram, types
+
+CORPUS = """
+Aldric Brenna Corwin Dorian Elowen Fenwick Gareth Halden Isolde Jorah
+Kestrel Lorien Maelis Nerys Orrin Perrin Quillan Rowena Soren Tamsin
+Ulric Vesper Wendell Xander Yorick Zephyr Aldwin Berengar Cedric Duncan
+"""
+
+
+@pytest.fixture(scope="module")
+def model():
+    trainer = ngram.NgramTrainer(order=3)
+    trainer.update(CORPUS.splitlines())
+    return trainer.model()
+
+
+def words(language, count=200, seed=1234):
+    with types.seeded(seed), types.budget():
+        return language.word(count)
+
+
+def test_words_are_seeded_and_drawn_from_the_corpus(model):
+    language = ngram.NgramLanguage(name="names", model=model)
+    generated = words(language)
+    assert generated == words(language)
+    assert generated != words(language, seed=4321)
+    assert set("".join(generated)) <= set(CORPUS.lower()) - set(" \n")
+
+
+def test_snapshot_round_trip(model, tmp_path):
+    path = tmp_path / "names.ngram"
+    model.save(path)
+    loaded = ngram.NgramModel.load(path)
+    for attribute in ("order", "contexts", "symbols", "frequencies", "offsets", "probability", "alias", "following"):
+        assert getattr(loaded, attribute) == getattr(model, attribute)
+    original = ngram.NgramLanguage(name="names", model=model)
+    assert words(ngram.NgramLanguage.load(path, name="names")) == words(original)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "names.ngram"
+    path.write_bytes(b"not a model")
+    with pytest.raises(types.LanguageError):
+        ngram.NgramModel.load(path)
+
+
+def test_order_must_be_at_least_two():
+    with pytest.raises(types.LanguageError):
+        ngram.NgramTrainer(order=1)
+
+
+def test_copy_and_dialect(model):
+    language = ngram.NgramLanguage(name="names", model=model)
+    copy = language.copy(name="copy", minimum_grapheme_count=2, max_length=6)
+    assert (copy.name, copy.minimum_grapheme_count, copy.max_length) == ("copy", 2, 6)
+    assert copy.model is language.model and copy.vowels is language.vowels
+    assert all(len(word) <= 6 for word in words(copy))
+    dialect = language.dialect("dialect", suffixes=types.Overlay(add={"ar": 1.0}))
+    assert dialect.model is language.model and dialect.consonants is language.consonants
+    assert all(word.endswith("ar") for word in words(dialect))
+    with pytest.raises(types.LanguageError):
+        language.copy(colour="blue")
+
+
+def test_write_module(model, tmp_path, monkeypatch):
+    ngram.write_module(model, "trained", tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("trained")
+    assert words(module.Language) == words(ngram.NgramLanguage(name="trained", model=model))
+    with types.seeded(1234), types.budget():
+        assert len(module.Name.name(5)) == 5
@@ -0,0 +1,62 @@
+import pytest
+
+from language import parallel
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(parallel, "CHUNK_WORDS", 500)
+
+
+def passage(language, count, seed, processes):
+    return "".join(parallel.text(language, count, seed, processes=processes))
+
+
+@pytest.mark.parametrize("language", ["elvish", "common"])
+def test_text_is_the_same_for_any_number_of_processes(language):
+    # Enough Common words that some run out of attempts, and are replaced with safe words.
+    text = passage(language, 12000, 1234, processes=1)
+    assert len(text.split()) == 12000
+    assert passage(language, 12000, 1234, processes=2) == text
+
+
+def test_text_depends_on_the_seed():
+    assert passage("gnomish", 1200, 1, processes=1) == passage("gnomish", 1200, 1, processes=1)
+    assert passage("gnomish", 1200, 1, processes=1) != passage("gnomish", 1200, 2, processes=1)
+
+
+def test_sample_all_returns_every_language():
+    samples = list(parallel.sample_all(["elvish", "gnomish"], kind="names", count=2, processes=2, ordered=True))
+    assert [sample.language for sample in samples] == ["elvish", "gnomish"]
+    assert all(len(sample.values) == 2 and not sample.error for sample in samples)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_sample_all_yields_each_language_once(processes):
+    languages = ["elvish", "gnomish", "dwarvish", "common"]
+    samples = list(parallel.sample_all(languages, kind="noble", count=3, processes=processes))
+    assert sorted(sample.language for sample in samples) == sorted(languages)
+    assert all(sample.kind == "noble" and len(sample.values) == 3 and sample.elapsed > 0 for sample in samples)
+
+
+def test_sample_all_generates_paragraphs_of_text():
+    (sample,) = parallel.sample_all(["gnomish"], kind="text", count=2, words=15, processes=1)
+    assert len(sample.values) == 2
+    assert all(isinstance(paragraph, str) and paragraph for paragraph in sample.values)
+
+
+def test_sample_all_reports_errors_on_the_sample(monkeypatch):
+    from language.languages import gnomish
+
+    def broken(count=1):
+        raise RuntimeError("broken")
+
+    monkeypatch.setattr(gnomish.Name, "name", broken)
+    samples = list(parallel.sample_all(["gnomish", "elvish"], count=2, processes=1))
+    assert samples[0].values == [] and samples[0].error == "RuntimeError: broken"
+    assert len(samples[1].values) == 2 and not samples[1].error
+
+
+def test_sample_all_rejects_unknown_kinds():
+    with pytest.raises(ValueError):
+        list(parallel.sample_all(["gnomish"], kind="poems"))
@@ -0,0 +1,40 @@
+import pytest
+
+from language import permute, types
+from language.languages import gnomish
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 10, 1000, 4097])
+def test_permutation_is_a_bijection(size):
+    permutation = permute.Permutation(size, seed=1234)
+    assert sorted(permutation) == list(range(size))
+    assert [permutation[i] for i in range(size)] == [*permutation]
+
+
+def test_permutation_depends_on_the_seed():
+    assert [*permute.Permutation(1000, seed=1)] == [*permute.Permutation(1000, seed=1)]
+    assert [*permute.Permutation(1000, seed=1)] != [*permute.Permutation(1000, seed=2)]
+
+
+def test_word_space_holds_every_valid_word_once():
+    space = gnomish.Language.space()
+    words = [*space]
+    assert len(words) == len(set(words)) == 2480
+    with types.seeded(1234):
+        assert set(gnomish.Language.word(200)) <= set(words)
+
+
+def test_name_space_permutes_every_name_exactly_once():
+    # A blank nickname spells the same names as the second template, which are only counted once.
+    generator = types.NameGenerator(
+        language=gnomish.Language,
+        nicknames=types.equal_weights(["bold", "quick"], 1.0),
+        templates=types.NameSet((types.NameTemplate("name,nickname"), 1.0), (types.NameTemplate("name"), 1.0)),
+    )
+    space = generator.space()
+    names = [name["fullname"] for name in space.permute(seed=1234)]
+    assert len(names) == len(set(names)) == len(space) == 2480 * 3
+    assert set(names) == {name["fullname"] for name in space}
+    assert names == [name["fullname"] for name in space.permute(seed=1234)]
+    with types.seeded(1234):
+        assert {name["fullname"] for name in generator.name(100)} <= set(names)
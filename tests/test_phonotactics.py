@@ -0,0 +1,136 @@
+import random
+import re
+import threading
+
+import pytest
+
+from language import phonotactics, rules, types
+from language.languages import common, elvish, undercommon
+from language.languages.elvish.rules import permitted_starting_clusters
+from language.languages.undercommon.rules import valid_consonant_sequences
+from language.phonotactics import VOWELS, Automaton, LanguageGraphemes, Phonotactics
+
+# The default rules, as a specification.
+DEFAULTS = Phonotactics(
+    runs=[("aeiou", 2), ("bcdfghjklmnpqrstvwxz", 2)],
+    required=VOWELS,
+    distinct=True,
+)
+
+
+def random_words(count=20000, seed=1234, letters="aeiouybcdlmnrstw"):
+    draw = random.Random(seed)
+    return ["".join(draw.choices(letters, k=draw.randint(1, 8))) for _ in range(count)]
+
+
+# The hand-written rules the elvish and undercommon specifications replaced.
+def elvish_cannot_start_with_two_consonants(language, word):
+    found = re.compile(r"(^[bcdfghklmnpqrstvwxz]{2})").search(word)
+    if not found:
+        return True
+    first, second = found.group(1)
+    if first == second and first != "l":
+        return False
+    return found.group(1) in permitted_starting_clusters
+
+
+def elvish_too_many_vowels(language, word):
+    return not re.compile(r"[" + "".join(language.vowels.members) + "]{4}").findall(word)
+
+
+def elvish_too_many_consonants(language, word):
+    return not re.compile(r"[bcdfghklmnprstvw]{3}").findall(word)
+
+
+def elvish_cannot_have_just_repeated_vowels(language, word):
+    return len(word) == 1 or len(set(word)) > 1
+
+
+def elvish_must_have_a_vowel(language, word):
+    return any(vowel in word for vowel in language.vowels.members)
+
+
+def undercommon_valid_sequences(language, word):
+    found = re.compile(r"([bcdfghjklmnpqrstvwxz]{2})").findall(word)
+    return all(sequence in valid_consonant_sequences for sequence in found)
+
+
+def undercommon_too_many_vowels(language, word):
+    return not re.compile(r"[" + "".join(language.vowels.members) + r"]{3}").findall(word)
+
+
+REPLACED = {
+    "elvish": {
+        elvish_must_have_a_vowel,
+        elvish_too_many_vowels,
+        elvish_too_many_consonants,
+        elvish_cannot_have_just_repeated_vowels,
+        elvish_cannot_start_with_two_consonants,
+    },
+    "undercommon": rules.default_rules.union({undercommon_valid_sequences, undercommon_too_many_vowels}),
+}
+
+
+@pytest.mark.parametrize("language", [common.Language, elvish.Language])
+def test_specification_matches_the_rules_it_replaces(language):
+    for word in random_words():
+        expected = all(rule(language, word) for rule in rules.default_rules)
+        assert DEFAULTS(language, word) == expected, word
+
+
+@pytest.mark.parametrize("module", [elvish, undercommon])
+def test_language_specifications_match_the_rules_they_replace(module):
+    language = module.Language
+    with types.seeded(1234):
+        words = [language.candidate() for _ in range(20000)]
+    words += random_words(letters="".join(language.vowels.members) + "bcdfghjklmnpqrstvwxyz")
+    for word in words:
+        expected = all(rule(language, word) for rule in REPLACED[module.__name__.split(".")[-1]])
+        assert all(rule(language, word) for rule in language.rules) == expected, word
+
+
+def test_automata_are_shared_by_languages_with_the_same_graphemes():
+    spec = Phonotactics(runs=[(VOWELS, 2)], required=VOWELS)
+    language = common.Language
+    assert spec.compile(language) is spec.compile(language.copy(name="copy"))
+    assert spec.compile(language) is spec.compile(language.dialect("dialect", suffixes=types.Overlay(add={"x": 1})))
+    dialect = language.dialect("dialect", vowels=types.Overlay(add={"ø": 1.0}))
+    assert spec.compile(dialect) is not spec.compile(language)
+    assert not spec(language, "bøø") and spec(dialect, "bøø") and not spec(dialect, "bøøø")
+
+
+def test_automata_follow_every_grapheme_set_they_refer_to():
+    spec = Phonotactics(runs=[(VOWELS, 2), (LanguageGraphemes("consonants"), 1)])
+    language = common.Language
+    dialect = language.dialect("dialect", consonants=types.Overlay(remove={"x"}))
+    assert spec.compile(dialect) is not spec.compile(language)
+    assert not spec(language, "axta") and spec(dialect, "axta")
+
+
+def test_threads_share_an_automaton():
+    spec = Phonotactics(name="threads", runs=[("aeiou", 2), ("bcdlmnrstw", 2)], required="aeiou", distinct=True)
+    words = random_words()
+    expected = [spec.compile(common.Language).accepts(word) for word in words]
+    automaton = Automaton(spec.compile(common.Language).components)
+    results = {}
+
+    def check(thread):
+        results[thread] = [automaton.accepts(word) for word in words]
+
+    threads = [threading.Thread(target=check, args=(thread,)) for thread in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(result == expected for result in results.values())
+    assert len(automaton) == len(spec.compile(common.Language))
+
+
+def test_automata_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(phonotactics, "AUTOMATA", 4)
+    spec = Phonotactics(runs=[(VOWELS, 2)], required=VOWELS)
+    dialects = [common.Language.dialect(f"d{i}", vowels=types.Overlay(add={"ø": i + 1.0})) for i in range(10)]
+    for dialect in dialects:
+        spec.compile(dialect)
+    assert len(spec._automata) == 4
+    assert spec.compile(dialects[-1]) is spec.compile(dialects[-1])
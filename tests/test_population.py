@@ -0,0 +1,55 @@
+import io
+from collections import defaultdict
+
+import pytest
+
+from language import population
+
+MIX = [("common", 0.6), ("dwarvish", 0.2), ("elvish", 0.2)]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(population, "CHUNK_SIZE", 60)
+
+
+def test_population_is_the_same_for_any_number_of_processes():
+    rows = list(population.generate(600, MIX, seed=1234, processes=1, noble=0.2))
+    assert len(rows) == 600
+    assert [row[0] for row in rows] == list(range(1, 601))
+    assert list(population.generate(600, MIX, seed=1234, processes=2, noble=0.2)) == rows
+    assert list(population.generate(600, MIX, seed=4321, processes=1, noble=0.2)) != rows
+
+
+def test_families_share_a_surname():
+    rows = list(population.generate(600, MIX, seed=1234, processes=1, noble=0.2))
+    surnames = defaultdict(set)
+    languages = defaultdict(set)
+    for person, household, family, language, noble, name, surname, fullname in rows:
+        languages[family].add((language, noble))
+        if surname:
+            surnames[family].add(surname)
+            assert surname in fullname
+    assert all(len(values) == 1 for values in surnames.values())
+    assert all(len(values) == 1 for values in languages.values())
+    assert {row[4] for row in rows} == {0, 1}
+
+
+def test_apportion_divides_every_person():
+    counts = population.apportion(1001, population.parse_mix("common:0.6,dwarvish:0.2,elvish"))
+    assert counts == [("common", 334), ("dwarvish", 111), ("elvish", 556)]
+    assert sum(count for (language, count) in counts) == 1001
+
+
+@pytest.mark.parametrize("mix", ["common:many", "common:0,elvish:0"])
+def test_parse_mix_rejects_bad_weights(mix):
+    with pytest.raises(ValueError):
+        population.parse_mix(mix)
+
+
+def test_write():
+    f = io.StringIO()
+    assert population.write(population.generate(50, MIX, seed=1234, processes=1), f) == 50
+    lines = f.getvalue().splitlines()
+    assert lines[0].split("\t") == list(population.COLUMNS)
+    assert all(len(line.split("\t")) == len(population.COLUMNS) for line in lines[1:])
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import uuid
+
+import pytest
+
+from language import ring, types
+from language.languages import elvish
+
+
+@pytest.fixture
+def prefix(tmp_path, monkeypatch):
+    # Consumers claim lanes under a lock file in TMPDIR.
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    return f"fanlang-test-{os.getpid()}-{uuid.uuid4().hex[:8]}-"
+
+
+def test_encode_round_trip():
+    with types.seeded(1234):
+        names = elvish.NobleName.name(50)
+    assert [ring.decode(ring.encode(name)) for name in names] == names
+
+
+def test_lanes_are_fifo_and_bounded(prefix):
+    buffer = ring.Ring.create(f"{prefix}lanes", lanes=2, capacity=4, slot_size=16)
+    try:
+        for value in range(10):
+            assert all(buffer.push(0, f"{value}-{i}".encode()) for i in range(3))
+            assert buffer.occupancy(0) == 3 and buffer.occupancy(1) == 0
+            assert [buffer.pop(0) for i in range(3)] == [f"{value}-{i}".encode() for i in range(3)]
+            assert buffer.pop(0) is None
+        assert all(buffer.push(1, b"x") for i in range(4))
+        assert not buffer.push(1, b"y")
+        assert buffer.stats()["consumed"] == 30
+    finally:
+        buffer.close()
+        buffer.unlink()
+
+
+def test_consumers_receive_every_name_in_order(prefix):
+    with ring.Producer({"elvish": elvish.Name}, lanes=2, capacity=50, prefix=prefix) as producer:
+        with types.seeded(1234):
+            assert producer.refill() == 100
+        with types.seeded(1234):
+            expected = [name["fullname"] for name in elvish.Name.name(100)]
+        code = (
+            "from language import ring\n"
+            f"with ring.Consumer('elvish', prefix={prefix!r}) as names:\n"
+            "    print(names.lane)\n"
+            "    while (name := names.pop()) is not None:\n"
+            "        print(name['fullname'])\n"
+        )
+        first = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        lane, *received = first.stdout.splitlines()
+        assert lane == "0" and received == expected[:50]
+        with ring.Consumer("elvish", lane=1, prefix=prefix) as names:
+            assert [names.pop()["fullname"] for i in range(50)] == expected[50:]
+            assert names.pop() is None
+        assert producer.stats()["elvish"]["consumed"] == 100
+
+
+def test_names_too_long_for_the_slots_are_replaced(prefix):
+    # Only about one in ten elvish names fits in 48 bytes.
+    with ring.Producer({"elvish": elvish.Name}, lanes=2, capacity=50, slot_size=48, prefix=prefix) as producer:
+        with types.seeded(1234):
+            assert producer.refill() == 100
+        buffer = producer.rings["elvish"]
+        assert buffer.occupancy(0) == buffer.occupancy(1) == 50
+        assert all(len(buffer.pop(lane)) <= 48 for lane in (0, 1) for i in range(50))
+
+
+def test_slots_too_small_for_any_name_are_left_empty(prefix, monkeypatch):
+    monkeypatch.setattr(ring, "MAX_SKIPPED", 500)
+    with ring.Producer({"elvish": elvish.Name}, lanes=2, capacity=50, slot_size=8, prefix=prefix) as producer:
+        assert producer.refill() == 0
@@ -0,0 +1,66 @@
+from language import types
+from language.languages import common, dwarvish, undercommon
+
+
+def a_slow_permissive_rule(language, word):
+    return sum(ord(letter) for letter in word * 50) >= 0
+
+
+def b_cheap_strict_rule(language, word):
+    return not word.startswith("x")
+
+
+RULES = {a_slow_permissive_rule, b_cheap_strict_rule}
+WORDS = [f"{'x' if i % 2 else 'y'}word{i}" for i in range(1000)]
+
+
+def test_rules_start_in_name_order():
+    order = types.RuleOrder(RULES)
+    assert order.order == (a_slow_permissive_rule, b_cheap_strict_rule)
+
+
+def test_cheap_rules_that_reject_move_first():
+    order = types.RuleOrder(RULES)
+    for word in WORDS:
+        order.validate(None, word)
+    assert order.order == (b_cheap_strict_rule, a_slow_permissive_rule)
+
+
+def test_only_sampled_words_are_profiled():
+    order = types.RuleOrder(RULES, sample_interval=10, retune_interval=4)
+    for word in WORDS[:44]:
+        order.validate(None, word)
+    # Four warm-up words, then one in every ten.
+    assert order.counters.samples == 8
+
+
+def test_verdicts_do_not_depend_on_the_order():
+    order = types.RuleOrder(RULES, sample_interval=3, retune_interval=2)
+    assert [order.validate(None, word) for word in WORDS] == [all(rule(None, word) for rule in RULES) for word in WORDS]
+
+
+def test_languages_validate_as_their_rules_do():
+    for language in (common.Language, dwarvish.Language, undercommon.Language):
+        with types.seeded(1):
+            words = [language.candidate() for _ in range(2000)]
+        assert [language.validate(word) for word in words] == [
+            all(rule(language, word) for rule in language.rules) for word in words
+        ]
+
+
+def test_rejections_are_counted_while_warming_up():
+    order = types.RuleOrder(RULES, retune_interval=100)
+    for word in WORDS[:50]:
+        order.validate(None, word)
+    assert order.rejected() == dict(a_slow_permissive_rule=0, b_cheap_strict_rule=25)
+
+
+def test_changes_to_a_mutable_set_of_rules_are_picked_up():
+    rules = set(RULES)
+    order = types.RuleOrder(rules, sample_interval=4, retune_interval=2)
+    for word in WORDS[:10]:
+        order.validate(None, word)
+    rules.discard(b_cheap_strict_rule)
+    verdicts = [order.validate(None, word) for word in WORDS[:10]]
+    assert order.rules == (a_slow_permissive_rule,)
+    assert verdicts[-1] is True
@@ -0,0 +1,34 @@
+import random
+
+from language import types
+from language.languages import dwarvish, elvish
+
+
+def test_name_at_is_deterministic_and_random_access():
+    forward = [elvish.NobleName.name_at(1234, index)["fullname"] for index in range(20)]
+    backward = [elvish.NobleName.name_at(1234, index)["fullname"] for index in reversed(range(20))]
+    assert forward == backward[::-1]
+    assert len(set(forward)) > 1
+
+
+def test_name_at_depends_only_on_seed_and_index():
+    expected = dwarvish.Name.name_at("seed", 1000)
+    random.seed(1)
+    dwarvish.Name.name(50)
+    assert dwarvish.Name.name_at("seed", 1000) == expected
+    assert dwarvish.Name.name_at("other", 1000) != expected
+
+
+def test_name_at_does_not_disturb_the_random_state():
+    state = random.getstate()
+    elvish.Name.name_at(1234, 5)
+    assert random.getstate() == state
+
+
+def test_word_at_is_deterministic():
+    assert [elvish.Language.word_at(7, i) for i in range(10)] == [elvish.Language.word_at(7, i) for i in range(10)]
+
+
+def test_derive_seed_differs_by_index_and_attempt():
+    seeds = {types.derive_seed(1, index, attempt) for index in range(100) for attempt in range(3)}
+    assert len(seeds) == 300
@@ -0,0 +1,108 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from language import loadtest, service
+from language.languages import elvish, gnomish
+
+
+class Broken:
+    def name(self, count):
+        raise RuntimeError("no names today")
+
+
+LANGUAGES = dict(elvish=elvish, gnomish=gnomish, broken=SimpleNamespace(Name=Broken(), NobleName=Broken()))
+
+
+async def started():
+    server = await asyncio.start_server(service.Service(LANGUAGES).connection, host="127.0.0.1", port=0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def exchange(port: int, request: bytes) -> tuple:
+    """
+    Send a raw request, and return the status, headers and JSON body of the response.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = json.loads(await reader.readexactly(int(headers["content-length"])))
+    writer.close()
+    return status, headers, body
+
+
+def test_responses():
+    async def main():
+        server, port = await started()
+        client = loadtest.Client(port=port, size=1)
+        async with server:
+            statuses = [
+                await client.get(target)
+                for target in (
+                    "/names?language=elvish&count=3",
+                    "/names?language=elvish&count=2&noble=1&deadline_ms=50",
+                    "/text?language=gnomish&words=10",
+                    "/names?language=klingon",
+                    "/names?language=elvish&count=0",
+                    "/names?language=elvish&count=many",
+                    "/text?language=gnomish&deadline_ms=soon",
+                    "/names?language=broken",
+                    "/nowhere",
+                )
+            ]
+            # Every request was answered over the same kept-alive connection.
+            connections = len(client.idle)
+            names = await exchange(port, b"GET /names?language=elvish&count=3 HTTP/1.1\r\n\r\n")
+            error = await exchange(port, b"GET /names?language=broken HTTP/1.1\r\n\r\n")
+            client.close()
+        return statuses, connections, names, error
+
+    statuses, connections, names, error = asyncio.run(main())
+    assert statuses == [200, 200, 200, 400, 400, 400, 400, 500, 404]
+    assert connections == 1
+    assert len(names[2]["names"]) == 3 and all(names[2]["names"])
+    assert error[2] == {"error": "RuntimeError: no names today"}
+
+
+def test_connections():
+    async def main():
+        server, port = await started()
+        async with server:
+            post = await exchange(port, b"POST /names?language=elvish HTTP/1.1\r\n\r\n")
+            closed = await exchange(port, b"GET /nowhere HTTP/1.1\r\nConnection: close\r\n\r\n")
+            old = await exchange(port, b"GET /nowhere HTTP/1.0\r\n\r\n")
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /names?language=gnomish HTTP/1.1\r\n\r\n" * 2 + b"GET /nowhere HTTP/1.1\r\n\r\n")
+            await writer.drain()
+            writer.write_eof()
+            pipelined = (await reader.read()).count(b"HTTP/1.1 ")
+            writer.close()
+        return post, closed, old, pipelined
+
+    post, closed, old, pipelined = asyncio.run(main())
+    assert post[0] == 400 and post[2] == {"error": "Unsupported method POST."}
+    assert post[1]["connection"] == "keep-alive"
+    assert closed[0] == 404 and closed[1]["connection"] == "close"
+    assert old[1]["connection"] == "close"
+    assert pipelined == 3
+
+
+def test_load_test_against_the_service():
+    async def main():
+        server, port = await started()
+        async with server:
+            client = loadtest.Client(port=port, size=4)
+            requests = loadtest.parse_mix("elvish:names:3,gnomish:text:1,broken:names:1")
+            return await loadtest.run(client, requests, duration=0.5, concurrency=4, warmup=0.1, seed=1234)
+
+    report = asyncio.run(main())
+    assert report["total"]["requests"] > 0
+    assert set(report["requests"]) == {"elvish:names", "gnomish:text", "broken:names"}
+    assert report["requests"]["elvish:names"]["errors"] == 0
+    broken = report["requests"]["broken:names"]
+    assert broken["error_rate"] == 1.0 and broken["error_kinds"] == {"HTTP 500": broken["requests"]}
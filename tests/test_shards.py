@@ -0,0 +1,89 @@
+import hashlib
+import json
+
+import pytest
+
+from language import shards, types
+from language.languages import elvish
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    monkeypatch.setattr(shards, "BATCH_SIZE", 100)
+
+
+def write(directory, compression="none", seed=1234, count=1050):
+    return shards.write(elvish.Name, directory, count, seed=seed, compression=compression, shard_bytes=4096)
+
+
+def names(directory, manifest):
+    return [name for entry in manifest["shards"] for name in shards.read(directory, entry)]
+
+
+def test_manifest_describes_every_shard(tmp_path):
+    manifest = write(tmp_path)
+    assert manifest == shards.load(tmp_path)
+    assert manifest["complete"] and manifest["count"] == 1050 and manifest["seed"] == 1234
+    assert len(manifest["shards"]) > 1
+    first = 0
+    for entry in manifest["shards"]:
+        assert entry["first"] == first
+        assert 0 < entry["bytes"] <= 4096
+        assert shards.verify(tmp_path, entry)
+        assert len(list(shards.read(tmp_path, entry))) == entry["count"]
+        first += entry["count"]
+    assert first == 1050
+
+
+def test_shards_hold_the_seeded_names(tmp_path):
+    manifest = write(tmp_path)
+    expected = []
+    for index, start in enumerate(range(0, 1050, 100)):
+        with types.seeded(types.derive_seed(1234, index)), types.budget():
+            expected += [name["fullname"] for name in elvish.Name.name(min(100, 1050 - start))]
+    assert names(tmp_path, manifest) == expected
+
+
+@pytest.mark.parametrize("compression", ["gzip", "xz"])
+def test_compression_does_not_change_the_names(tmp_path, compression):
+    plain = write(tmp_path / "none")
+    compressed = write(tmp_path / compression, compression=compression)
+    assert [entry["file"] for entry in compressed["shards"]] == [
+        entry["file"] + shards.COMPRESSION[compression] for entry in plain["shards"]
+    ]
+    assert names(tmp_path / compression, compressed) == names(tmp_path / "none", plain)
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "xz"])
+def test_shards_are_reproducible(tmp_path, compression):
+    first = write(tmp_path / "first", compression=compression)
+    second = write(tmp_path / "second", compression=compression)
+    assert [entry["sha256"] for entry in first["shards"]] == [entry["sha256"] for entry in second["shards"]]
+    other = write(tmp_path / "other", compression=compression, seed=4321)
+    assert names(tmp_path / "other", other) != names(tmp_path / "first", first)
+
+
+def test_verify_detects_changed_shards(tmp_path):
+    manifest = write(tmp_path, compression="gzip")
+    entry = manifest["shards"][1]
+    path = tmp_path / entry["file"]
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(data)
+    assert hashlib.sha256(data).hexdigest() != entry["sha256"]
+    assert not shards.verify(tmp_path, entry)
+    (tmp_path / manifest["shards"][2]["file"]).unlink()
+    assert not shards.verify(tmp_path, manifest["shards"][2])
+    assert shards.verify(tmp_path, manifest["shards"][0])
+
+
+def test_failed_generation_leaves_the_manifest_incomplete(tmp_path):
+    with pytest.raises(RuntimeError):
+        with shards.ShardWriter(tmp_path, shard_bytes=4096) as writer:
+            writer.write(["Nyeyias um Adyuss"] * 500)
+            raise RuntimeError
+    manifest = json.loads((tmp_path / shards.MANIFEST).read_text())
+    assert not manifest["complete"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [shards.MANIFEST] + [entry["file"] for entry in manifest["shards"]]
+    )
@@ -0,0 +1,23 @@
+import os
+
+import pytest
+
+from language import startup
+
+
+def test_cold_start_imports_only_what_it_uses(monkeypatch):
+    # FANLANG_DEBUG loads rich on purpose.
+    monkeypatch.delenv("FANLANG_DEBUG", raising=False)
+    modules = startup.imported_modules()
+    assert not {"rich", "numpy"} & modules
+    languages = [name for name in modules if name.startswith("language.languages.")]
+    assert languages
+    assert all(name.startswith("language.languages.common.") for name in languages), languages
+
+
+@pytest.mark.skipif("FANLANG_STARTUP_BUDGET" not in os.environ, reason="set FANLANG_STARTUP_BUDGET to time cold starts")
+def test_cold_start_is_within_budget():
+    elapsed = startup.cold_start()
+    assert (
+        elapsed <= startup.BUDGET
+    ), f"fanlang took {elapsed:.3f}s to start; slowest imports: {startup.slowest_imports()}"
@@ -0,0 +1,27 @@
+import threading
+
+from language import types
+from language.languages import common, elvish
+
+
+def run(function, count=8):
+    results = [None] * count
+
+    def target(index):
+        results[index] = function(index)
+
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def names(index):
+    with types.seeded(index), types.budget():
+        return [name["fullname"] for name in elvish.Name.name(200)] + common.Language.word(200)
+
+
+def test_seeded_generation_is_the_same_in_every_thread():
+    assert run(names) == [names(index) for index in range(8)]
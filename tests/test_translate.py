@@ -0,0 +1,52 @@
+from language import translate
+from language.languages import common, elvish
+
+TEXT = "The King is dead. Long live the KING! Don't count the 12 ravens, o'clock or not."
+
+
+def test_translation_does_not_depend_on_order():
+    translator = translate.Translator(elvish.Language)
+    words = ["king", "dead", "raven", "long", "the"]
+    forward = [translator.word(word) for word in words]
+    backward = [translate.Translator(elvish.Language).word(word) for word in reversed(words)]
+    assert forward == backward[::-1]
+    assert translator.translate(TEXT) == translate.Translator(elvish.Language).translate(TEXT)
+
+
+def test_translation_keeps_punctuation_and_case():
+    translator = translate.Translator(elvish.Language)
+    king = translator.word("king")
+    assert translator.word("King") == king[:1].upper() + king[1:]
+    assert translator.word("KING") == king.upper()
+    translated = translator.translate(TEXT)
+    assert translate.WORD.sub("", translated) == translate.WORD.sub("", TEXT)
+
+
+def test_every_word_has_a_translation():
+    translator = translate.Translator(common.Language)
+    words = [f"{a}{b}{c}" for a in "abcdefghij" for b in "aeiou" for c in "rstl"]
+    assert all(translator.word(word) for word in words)
+    assert [translator.word(word) for word in words] == [translate.Translator(common.Language).word(w) for w in words]
+
+
+def test_lexicon_round_trip(tmp_path):
+    path = tmp_path / "lexicon.sqlite3"
+    with translate.Lexicon(path, batch_size=2) as lexicon:
+        translated = translate.Translator(elvish.Language, lexicon=lexicon).translate(TEXT)
+    with translate.Lexicon(path) as lexicon:
+        key = translate.Translator(elvish.Language, lexicon=lexicon).key
+        assert lexicon.get(key, "king") == translate.Translator(elvish.Language).word("king")
+        lexicon.set(key, "king", "aranë")
+        assert translate.Translator(elvish.Language, lexicon=lexicon).word("King") == "Aranë"
+        assert translate.Translator(elvish.Language, lexicon=lexicon).translate("the") in translated.lower().split()
+
+
+def test_lexicon_is_invalidated_by_changes_to_the_language_pack(tmp_path, monkeypatch):
+    path = tmp_path / "lexicon.sqlite3"
+    with translate.Lexicon(path) as lexicon:
+        translator = translate.Translator(elvish.Language, lexicon=lexicon)
+        lexicon.set(translator.key, "king", "aranë")
+        assert translate.Translator(elvish.Language, lexicon=lexicon).word("king") == "aranë"
+    monkeypatch.setattr(translate, "pack_hash", lambda pack="": "changed")
+    with translate.Lexicon(path) as lexicon:
+        assert translate.Translator(elvish.Language, lexicon=lexicon).word("king") != "aranë"
@@ -0,0 +1,53 @@
+import pytest
+
+import language
+from language import types
+
+numpy = pytest.importorskip("numpy")
+
+SUPPORTED = language.load_language_pack()[1]
+VECTORIZED = [name for (name, module) in SUPPORTED.items() if module.Language.vectorized()]
+
+
+def bare(language):
+    """
+    The language without prefixes and suffixes, whose words are exactly those that pass its rules.
+    """
+    return language.copy(prefixes=None, suffixes=None)
+
+
+def test_most_languages_are_vectorized():
+    assert {"common", "dwarvish", "elvish", "undercommon"} <= set(VECTORIZED)
+
+
+@pytest.mark.parametrize("name", VECTORIZED)
+def test_vectorized_words_pass_every_rule(name):
+    language = bare(SUPPORTED[name].Language)
+    # Words that run out of attempts are replaced by safe words, which must pass the rules too.
+    with types.seeded(1234), types.budget():
+        words = language.vectorized().words(2000)
+    for word in words:
+        assert all(rule(language, word) for rule in language.rules), word
+
+
+def test_vectorized_words_follow_added_rules():
+    def no_a(language, word):
+        return "a" not in word
+
+    language = bare(SUPPORTED["common"].Language)
+    dialect = language.dialect("no-a", add_rules={no_a})
+    with types.seeded(1234), types.budget():
+        assert any("a" in word for word in language.word(types.VECTORIZE_THRESHOLD))
+        assert not any("a" in word for word in dialect.word(types.VECTORIZE_THRESHOLD))
+    assert dialect.vectorized() is not None
+
+
+@pytest.mark.parametrize("name", ["common", "elvish"])
+def test_vectorized_words_are_valid_grapheme_sequences(name):
+    language = bare(SUPPORTED[name].Language)
+    sequences = language.vectorized().sequences(numpy.random.default_rng(1234), 2000)
+    lengths = (sequences >= 0).sum(axis=1)
+    assert (lengths >= language.minimum_grapheme_count).all()
+    for row in sequences.tolist():
+        row = [kind for kind in row if kind >= 0]
+        assert not any(a == b == c for (a, b, c) in zip(row, row[1:], row[2:])), row